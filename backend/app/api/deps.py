@@ -0,0 +1,11 @@
+"""Shared FastAPI dependencies."""
+
+from fastapi import Request
+
+from app.clients.binance_client import BinanceFuturesClient, get_shared_client
+
+
+def get_binance_client(request: Request) -> BinanceFuturesClient:
+    """lifespan에서 생성한 공용 BinanceFuturesClient 주입"""
+    client = getattr(request.app.state, "binance_client", None)
+    return client if client is not None else get_shared_client()
@@ -1,6 +1,19 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from app.api.deps import get_binance_client
+from app.clients.binance_client import BinanceFuturesClient
+from app.clients.clock_sync import clock_sync
 from app.core.config import get_binance_config, get_environment_summary
+from app.core.security import api_key_monitor
+from app.services.account import account_snapshot
+from app.services.balance import balance_service
+from app.services.health import health_monitor
+from app.services.position import position_service
+from app.services.position_feed import position_feed
+from app.services.shared_state import shared_state
+from app.services.symbol_catalog import symbol_catalog
+from app.services.symbol_search import symbol_search
+from app.services.user_stream import user_stream
 
 router = APIRouter()
 
@@ -17,72 +30,90 @@ async def health():
     }
 
 
+@router.get("/health")
+async def health_snapshot():
+    """백그라운드에서 계산된 전체 헬스 스냅샷 (구성 요소별 상태, ageSec 포함)"""
+    return health_monitor.snapshot()
+
+
 @router.get("/health/binance")
 async def binance_health():
-    """Binance 연결성 및 시간 동기화 상태 확인"""
-    from app.clients.binance_client import BinanceFuturesClient
-
-    client = BinanceFuturesClient()
-    reachable = False
-    offset_ms = 0
-
-    try:
-        await client.sync_time()
-        # internal attr exists in client; if absent, keep 0
-        offset_ms = getattr(client, "_ts_offset_ms", 0)
-        reachable = True
-    except Exception:
-        reachable = False
-    finally:
-        await client.close()
-
+    """Binance 도달성 및 시간 오프셋 (스냅샷 기반 - 업스트림 호출 없음)"""
+    snapshot = health_monitor.snapshot()
+    binance = snapshot["components"].get("binance")
+    if binance is None:
+        return {"status": "unknown", "ageSec": None, "binance": None}
     return {
-        "status": "ok" if reachable else "error",
+        "status": binance["status"],
+        "ageSec": snapshot["ageSec"],
         "binance": {
-            "reachable": reachable,
-            "tsOffsetMs": offset_ms,
-            "testnet": client.use_testnet,
+            "reachable": binance["reachable"],
+            "tsOffsetMs": binance["tsOffsetMs"],
+            "lastSyncAgeSec": binance["lastSyncAgeSec"],
+            "testnet": binance["testnet"],
         },
     }
 
 
+@router.get("/health/binance/clock")
+async def binance_clock_health():
+    """서버 시각 오프셋/드리프트/마지막 동기화 경과 시간 조회 (네트워크 호출 없음)"""
+    snapshot = clock_sync.snapshot()
+    return {
+        "status": "ok" if snapshot["synced"] else "degraded",
+        "clock": snapshot,
+    }
+
+
+@router.get("/health/binance/rate-limit")
+async def binance_rate_limit(
+    client: BinanceFuturesClient = Depends(get_binance_client),
+):
+    """업스트림 가중치 예산 및 주문 카운트 현황 조회"""
+    return {"status": "ok", "rateLimit": client.rate_limiter.metrics()}
+
+
+@router.get("/health/cache")
+async def cache_stats():
+    """계좌 스냅샷/포지션/잔고 캐시 적중률 및 갱신 통계"""
+    return {
+        "status": "ok",
+        "account": account_snapshot.stats(),
+        "positions": position_service.stats(),
+        "balances": balance_service.cache.stats(),
+        "userStream": user_stream.stats(),
+        "positionFeed": position_feed.stats(),
+        "symbolCatalog": symbol_catalog.stats(),
+        "symbolSearch": symbol_search.stats(),
+        "sharedState": shared_state.stats(),
+        "apiKey": api_key_monitor.stats(),
+    }
+
+
 @router.get("/health/binance/api-key")
 async def validate_api_key():
-    """Binance API Key 유효성 검증 엔드포인트"""
-    from app.core.security import get_api_key_status
-
-    try:
-        status = await get_api_key_status()
-        binance_config = get_binance_config()
-
-        return {
-            "status": "valid" if status.is_valid else "invalid",
-            "message": (
-                "API key is valid and has required permissions"
-                if status.is_valid
-                else status.error_message
-            ),
-            "details": {
-                "is_valid": status.is_valid,
-                "has_futures_permission": status.has_futures_permission,
-                "rate_limit_remaining": status.rate_limit_remaining,
-                "last_check": status.last_check.isoformat(),
-                "error_message": status.error_message,
-            },
-            "testnet": binance_config["use_testnet"],
-        }
-
-    except Exception as e:
-        binance_config = get_binance_config()
-        return {
-            "status": "error",
-            "message": f"API key validation failed: {str(e)}",
-            "details": {
-                "is_valid": False,
-                "has_futures_permission": False,
-                "rate_limit_remaining": 0,
-                "last_check": None,
-                "error_message": str(e),
-            },
-            "testnet": binance_config["use_testnet"],
-        }
+    """Binance API Key 유효성 (모니터가 마지막으로 확인한 상태 - 계좌 조회 없음)"""
+    snapshot = health_monitor.snapshot()
+    key = snapshot["components"].get("apiKey") or {}
+    rate_limit = snapshot["components"].get("rateLimit") or {}
+    is_valid = bool(key.get("isValid"))
+    if key.get("isValid") is None:
+        status, message = "unknown", "API key status not checked yet"
+    elif is_valid:
+        status, message = "valid", "API key is valid and has required permissions"
+    else:
+        status, message = "invalid", key.get("errorMessage")
+
+    return {
+        "status": status,
+        "message": message,
+        "ageSec": snapshot["ageSec"],
+        "details": {
+            "is_valid": is_valid,
+            "has_futures_permission": bool(key.get("hasFuturesPermission")),
+            "rate_limit_remaining": rate_limit.get("remainingWeight", 0),
+            "last_check": key.get("lastCheck"),
+            "error_message": key.get("errorMessage"),
+        },
+        "testnet": get_binance_config()["use_testnet"],
+    }
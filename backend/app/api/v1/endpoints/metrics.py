@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Response
+
+from app.services.account import account_snapshot
+from app.services.balance import balance_service
+from app.services.journal import trade_journal
+from app.services.position import position_service
+from app.utils.metrics import CONTENT_TYPE, registry
+
+router = APIRouter()
+
+
+def _caches() -> dict[str, dict]:
+    return {
+        "account": account_snapshot.cache.stats(),
+        "positions": position_service.cache.stats(),
+        "balances": balance_service.cache.stats(),
+    }
+
+
+def _cache_lookups() -> dict[tuple[str, ...], float]:
+    samples: dict[tuple[str, ...], float] = {}
+    for name, stats in _caches().items():
+        samples[(name, "hit")] = stats["hits"]
+        samples[(name, "stale")] = stats["staleHits"]
+        samples[(name, "miss")] = stats["misses"]
+    return samples
+
+
+def _cache_hit_ratio() -> dict[tuple[str, ...], float]:
+    return {
+        (name,): stats["hitRatio"]
+        for name, stats in _caches().items()
+        if stats["hitRatio"] is not None
+    }
+
+
+# 서비스 상태는 스크레이프 시점에만 읽음 (요청 경로 비용 없음)
+registry.callback(
+    "cache_lookups_total",
+    "Cache lookups by result",
+    _cache_lookups,
+    ("cache", "result"),
+    kind="counter",
+)
+registry.callback(
+    "cache_hit_ratio", "Fresh+stale hit ratio per cache", _cache_hit_ratio, ("cache",)
+)
+registry.callback(
+    "journal_queue_depth",
+    "Trade journal rows waiting to be written",
+    lambda: {(): trade_journal.queue_depth},
+)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 텍스트 포맷 메트릭"""
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
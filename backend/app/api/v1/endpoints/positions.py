@@ -1,13 +1,25 @@
+import asyncio
 from typing import Optional
 
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 
+from app.core.config import POSITION_LONG_POLL_MAX
 from app.services.position import position_service
+from app.services.position_feed import format_sse, position_feed
 from app.utils.errors import error_response
 
 router = APIRouter()
 
 
+def _etag_version(header: Optional[str]) -> Optional[int]:
+    """If-None-Match 값(`"123"`, `W/"123"`, 목록)에서 첫 버전 번호 추출"""
+    if not header:
+        return None
+    tag = header.split(",")[0].strip().removeprefix("W/").strip('"')
+    return int(tag) if tag.isdigit() else None
+
+
 @router.post(
     "/positions/{symbol}/close",
     response_model=None,
@@ -65,23 +77,77 @@ async def close_position(request: Request, symbol: str, user: str = "unknown"):
     description="Retrieve all active futures positions with caching for performance",
 )
 async def get_positions(
-    request: Request, symbol: Optional[str] = None, bypass_cache: bool = Query(False)
+    request: Request,
+    symbol: Optional[str] = None,
+    bypass_cache: bool = Query(False),
+    since: Optional[int] = Query(None, ge=0),
+    wait: float = Query(0.0, ge=0.0, le=POSITION_LONG_POLL_MAX),
 ):
     """
     현재 활성 포지션 정보를 조회합니다.
 
+    응답에는 스냅샷 버전이 `ETag`/`X-Positions-Version` 헤더로 붙습니다.
+    `since`를 주면 그 버전 이후 변경/종료된 심볼만 돌려주고, `wait`를 주면
+    기준 버전(`since` 또는 `If-None-Match`) 이후 변경이 생길 때까지 대기합니다.
+    `If-None-Match`가 현재 버전과 같으면 304를 반환합니다.
+
     Args:
         symbol: 특정 심볼의 포지션만 조회 (선택사항)
+        since: 이 버전 이후 변경분만 조회 (선택사항)
+        wait: 변경이 없을 때 최대 대기 시간(초, 롱폴)
         request: FastAPI 요청 객체
 
     Returns:
-        활성 포지션 목록 또는 에러 응답
+        활성 포지션 목록(또는 델타) 또는 에러 응답
     """
     try:
         positions = await position_service.get_positions(
             symbol=symbol, bypass_cache=bypass_cache
         )
-        return positions
+        versions = position_service.versions
+        if_none_match = request.headers.get("if-none-match")
+        baseline = since if since is not None else _etag_version(if_none_match)
+
+        if wait and baseline is not None and versions.version <= baseline:
+            await position_service.wait_for_change(baseline, wait)
+            positions = await position_service.get_positions(symbol=symbol)
+
+        etag = f'"{versions.version}"'
+        headers = {
+            "ETag": etag,
+            "X-Positions-Version": str(versions.version),
+            "Cache-Control": "no-cache",
+        }
+        if if_none_match is not None and _etag_version(if_none_match) == (
+            versions.version
+        ):
+            return Response(status_code=304, headers=headers)
+
+        if since is None:
+            return JSONResponse(
+                [position.model_dump() for position in positions], headers=headers
+            )
+
+        delta = versions.changes_since(since)
+        if delta is None:
+            # 이전 프로세스/알 수 없는 버전 기준 - 전체 스냅샷으로 교체하도록 응답
+            changed, closed, full = positions, [], True
+        else:
+            changed, closed = delta
+            full = False
+            if symbol is not None:
+                changed = [p for p in changed if p.symbol == symbol]
+                # 헤지 모드 다리는 SYMBOL:SIDE 형식
+                closed = [s for s in closed if s.split(":")[0] == symbol]
+        return JSONResponse(
+            {
+                "version": versions.version,
+                "full": full,
+                "changed": [position.model_dump() for position in changed],
+                "closed": closed,
+            },
+            headers=headers,
+        )
 
     except RuntimeError:
         return error_response(
@@ -94,3 +160,38 @@ async def get_positions(
             502,
             request=request,
         )
+
+
+@router.get(
+    "/positions/stream",
+    response_model=None,
+    tags=["positions"],
+    summary="Stream live position/PnL updates",
+    description="Server-Sent Events: a full snapshot first, then version-numbered deltas",
+)
+async def stream_positions(request: Request):
+    """
+    포지션/PnL 변경분을 SSE로 푸시합니다.
+
+    모든 구독자는 하나의 공용 갱신 루프를 공유하므로 대시보드 수와 무관하게
+    업스트림 비용이 같습니다. 변경이 없으면 하트비트 주석을 보냅니다.
+    """
+
+    async def events():
+        async with position_feed.subscription() as subscriber:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        position_feed.next_event(subscriber), position_feed.heartbeat
+                    )
+                except TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield format_sse(event)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
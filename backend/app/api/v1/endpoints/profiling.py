@@ -0,0 +1,68 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+
+from app.utils.profiling import request_profiler
+
+router = APIRouter()
+
+
+async def require_profiling_token(
+    x_profile_token: Optional[str] = Header(default=None),
+):
+    """프로파일링 토큰 검증 (토큰 미설정 시 엔드포인트 자체를 숨김)"""
+    if not request_profiler.enabled:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": "PROFILING_DISABLED", "message": "Profiling disabled"},
+        )
+    if not request_profiler.authorized(x_profile_token):
+        raise HTTPException(
+            status_code=401, detail={"code": "UNAUTHORIZED", "message": "Invalid token"}
+        )
+
+
+@router.get("/admin/profiling", dependencies=[Depends(require_profiling_token)])
+async def list_profiles():
+    """무장 상태와 보관 중인 프로파일 목록"""
+    return request_profiler.stats()
+
+
+@router.post("/admin/profiling/arm", dependencies=[Depends(require_profiling_token)])
+async def arm_profiling(
+    path: str = Query(..., examples=["/api/order"]),
+    count: int = Query(1, ge=1, le=10),
+):
+    """다음 count개의 path 요청을 프로파일 (헤더를 붙일 수 없는 클라이언트용)"""
+    request_profiler.arm(path, count)
+    return request_profiler.stats()
+
+
+@router.delete("/admin/profiling/arm", dependencies=[Depends(require_profiling_token)])
+async def disarm_profiling(path: Optional[str] = None):
+    request_profiler.disarm(path)
+    return request_profiler.stats()
+
+
+@router.get(
+    "/admin/profiling/{profile_id}", dependencies=[Depends(require_profiling_token)]
+)
+async def download_profile(
+    profile_id: str,
+    format: Literal["pstats", "text"] = "pstats",
+    sort: Literal["cumulative", "tottime", "calls"] = "cumulative",
+):
+    """프로파일 다운로드 (pstats 덤프 또는 텍스트 리포트)"""
+    profile = request_profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": "PROFILE_NOT_FOUND", "message": "Unknown profile id"},
+        )
+    if format == "text":
+        return Response(content=profile.report(sort), media_type="text/plain")
+    return Response(
+        content=profile.pstats_bytes(),
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{profile.id}.pstats"'},
+    )
@@ -1,8 +1,12 @@
-from fastapi import APIRouter
+from typing import Literal
+
+from fastapi import APIRouter, Query, Request
 from fastapi.responses import JSONResponse
 
-from app.clients.binance_client import BinanceFuturesClient
-from app.models.schemas import Symbol, SymbolsResponse
+from app.models.schemas import SymbolSearchResponse, SymbolsResponse
+from app.services.symbol_catalog import symbol_catalog
+from app.services.symbol_search import symbol_search
+from app.utils.http_cache import precompressed_response
 
 router = APIRouter()
 
@@ -10,37 +14,37 @@ router = APIRouter()
 @router.get(
     "/symbols", response_model=SymbolsResponse, summary="Get available trading symbols"
 )
-async def get_symbols():
+async def get_symbols(request: Request):
     """거래 가능한 심볼 목록을 반환합니다. TRADING 상태이고 USDT 페어인 모든 심볼을 필터링합니다."""
-    # 직접 BinanceFuturesClient 생성
-    client = BinanceFuturesClient()
-
     try:
-        exchange_info = await client.get_exchange_info()
-
-        # 거래 가능한 심볼만 필터링
-        trading_symbols = []
-        for symbol_info in exchange_info.get("symbols", []):
-            symbol = symbol_info.get("symbol", "")
-            status = symbol_info.get("status", "")
-            quote_asset = symbol_info.get("quoteAsset", "")
-
-            # TRADING 상태이고 USDT 페어인 모든 심볼
-            if status == "TRADING" and quote_asset == "USDT":
-                trading_symbols.append(
-                    Symbol(
-                        symbol=symbol,
-                        baseAsset=symbol_info.get("baseAsset", ""),
-                        quoteAsset=quote_asset,
-                    )
-                )
-
-        return SymbolsResponse(symbols=trading_symbols)
+        # 메타 갱신 때 미리 직렬화/압축해 둔 본문 반환 (ETag 일치 시 304)
+        body = await symbol_catalog.get_body()
+        return precompressed_response(request.headers, body)
 
     except Exception as e:
         return JSONResponse(
             status_code=500,
             content={"ok": False, "error": f"Failed to fetch symbols: {str(e)}"},
         )
-    finally:
-        await client.close()
+
+
+@router.get(
+    "/symbols/search",
+    response_model=SymbolSearchResponse,
+    summary="Search trading symbols by symbol/base asset",
+)
+async def search_symbols(
+    q: str = Query(..., min_length=1, max_length=20),
+    limit: int = Query(10, ge=1, le=50),
+    order: Literal["relevance", "volume"] = "relevance",
+):
+    """심볼/기초자산 접두·부분 일치 상위 N개를 반환합니다 (선택적으로 거래량 순)."""
+    try:
+        results = await symbol_search.search(q, limit=limit, order=order)
+        return SymbolSearchResponse(query=q, results=results)
+
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content={"ok": False, "error": f"Failed to search symbols: {str(e)}"},
+        )
@@ -4,6 +4,7 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException
 from starlette import status
 
+from app.api.deps import get_binance_client
 from app.clients.binance_client import BinanceFuturesClient
 from app.models.schemas import TradeRequest
 from app.services.trade import TradeService
@@ -13,11 +14,6 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-# Dependency for BinanceFuturesClient
-async def get_binance_client() -> BinanceFuturesClient:
-    return BinanceFuturesClient()
-
-
 # Dependency for TradeService
 def get_trade_service(
     client: BinanceFuturesClient = Depends(get_binance_client),
@@ -0,0 +1,70 @@
+from typing import Optional
+
+from fastapi import APIRouter, Query, Request
+
+from app.models.schemas import TradeRecord, TradesResponse
+from app.services.trade_store import MAX_PAGE_SIZE, trade_store
+from app.utils.errors import error_response
+
+router = APIRouter()
+
+
+@router.get(
+    "/trades",
+    response_model=TradesResponse,
+    summary="Query trade history",
+    description="Filter the indexed trade journal with cursor pagination (newest first)",
+)
+async def get_trades(
+    request: Request,
+    user: Optional[str] = None,
+    symbol: Optional[str] = None,
+    result: Optional[str] = Query(None, description="trade_result, e.g. COMPLETED"),
+    start: Optional[str] = Query(None, description="ISO-8601 inclusive lower bound"),
+    end: Optional[str] = Query(None, description="ISO-8601 exclusive upper bound"),
+    cursor: Optional[str] = Query(None, description="nextCursor of previous page"),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+):
+    """
+    거래 이력을 조회합니다.
+
+    Args:
+        user/symbol/result: 정확히 일치하는 값으로 필터
+        start/end: timestamp 범위 (ISO-8601)
+        cursor: 이전 응답의 nextCursor
+        limit: 페이지 크기
+
+    Returns:
+        거래 목록과 다음 페이지 커서
+    """
+    try:
+        cursor_id = int(cursor) if cursor else None
+    except ValueError:
+        return error_response("BAD_REQUEST", "Invalid cursor", 400, request=request)
+
+    try:
+        rows, next_cursor = await trade_store.query(
+            user=user,
+            symbol=symbol,
+            result=result,
+            start=start,
+            end=end,
+            cursor=cursor_id,
+            limit=limit,
+        )
+    except ValueError as e:
+        return error_response(
+            "BAD_REQUEST", f"Invalid start/end: {str(e)}", 400, request=request
+        )
+    except Exception as e:
+        return error_response(
+            "INTERNAL_ERROR",
+            f"Failed to query trades: {str(e)}",
+            500,
+            request=request,
+        )
+
+    return TradesResponse(
+        trades=[TradeRecord(**row) for row in rows],
+        nextCursor=str(next_cursor) if next_cursor is not None else None,
+    )
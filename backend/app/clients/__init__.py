@@ -1,5 +1,9 @@
 """External API clients for the application."""
 
-from .binance_client import BinanceFuturesClient
+from .binance_client import (
+    BinanceFuturesClient,
+    close_shared_client,
+    get_shared_client,
+)
 
-__all__ = ["BinanceFuturesClient"]
+__all__ = ["BinanceFuturesClient", "close_shared_client", "get_shared_client"]
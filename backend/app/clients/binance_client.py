@@ -2,16 +2,63 @@ import hashlib
 import hmac
 import logging
 import time
+from collections.abc import Callable
 from typing import Any, Optional
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential_jitter
-
-from app.core.config import BINANCE_API_KEY, BINANCE_SECRET_KEY, BINANCE_TESTNET
+from tenacity import (
+    RetryCallState,
+    retry,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from app.clients.clock_sync import ClockSync, clock_sync
+from app.clients.rate_limiter import Priority, WeightRateLimiter, endpoint_weight
+from app.core.config import (
+    BINANCE_API_KEY,
+    BINANCE_HTTP2,
+    BINANCE_HTTP_KEEPALIVE_EXPIRY,
+    BINANCE_HTTP_MAX_CONNECTIONS,
+    BINANCE_HTTP_MAX_KEEPALIVE,
+    BINANCE_HTTP_TIMEOUT,
+    BINANCE_SECRET_KEY,
+    BINANCE_TESTNET,
+)
+from app.utils.metrics import upstream_request_duration, upstream_retries
+from app.utils.tracing import current_trace
+
+try:
+    # Optional: HTTP/2 requires the h2 package (httpx[http2])
+    import h2  # type: ignore # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 # 로거 설정
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # DEBUG 로그 활성화하여 API 문제 디버깅
+# 레벨은 LOG_LEVELS로 모듈별 조정 (예: app.clients.binance_client=DEBUG)
+
+
+def _record_retry(retry_state: RetryCallState) -> None:
+    """tenacity 재시도 직전 훅 - 호출별 재시도 횟수 집계"""
+    upstream_retries.inc((retry_state.fn.__name__ if retry_state.fn else "unknown",))
+
+
+def _key_format(key: str) -> str:
+    """Binance API 키/시크릿은 영문 대소문자와 숫자로만 구성"""
+    if not key:
+        return "missing"
+    return "valid" if key.isascii() and key.isalnum() else "invalid"
+
+
+# 공개 GET 호출 공통 재시도 정책
+_RETRY_POLICY: dict[str, Any] = {
+    "stop": stop_after_attempt(2),
+    "wait": wait_exponential_jitter(initial=0.1, max=0.6),
+    "before_sleep": _record_retry,
+}
 
 
 class BinanceFuturesClient:
@@ -25,7 +72,10 @@ class BinanceFuturesClient:
         api_key: Optional[str] = None,
         api_secret: Optional[str] = None,
         use_testnet: Optional[bool] = None,
-        timeout_seconds: float = 5.0,
+        timeout_seconds: float = BINANCE_HTTP_TIMEOUT,
+        http2: bool = BINANCE_HTTP2,
+        clock: Optional[ClockSync] = None,
+        rate_limiter: Optional[WeightRateLimiter] = None,
     ) -> None:
         self.api_key = api_key or BINANCE_API_KEY or ""
         self.api_secret = api_secret or BINANCE_SECRET_KEY or ""
@@ -37,93 +87,132 @@ class BinanceFuturesClient:
             if self.use_testnet
             else "https://fapi.binance.com"
         )
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url, timeout=timeout_seconds
+        self.ws_base_url = (
+            "wss://stream.binancefuture.com"
+            if self.use_testnet
+            else "wss://fstream.binance.com"
         )
-        self._ts_offset_ms: int = 0
-
-        # 초기화 로깅 및 API 키 검증
-        logger.debug(
-            f"BinanceFuturesClient initialized: testnet={self.use_testnet}, base_url={self.base_url}"
+        # 커넥션 재사용: keep-alive 풀을 유지해 주문마다 TCP+TLS 핸드셰이크를 피함
+        if http2 and not _HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested but h2 is not installed - using HTTP/1.1")
+            http2 = False
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=BINANCE_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=BINANCE_HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=BINANCE_HTTP_KEEPALIVE_EXPIRY,
+            ),
+            http2=http2,
         )
-
-        # API 키 포맷 검증 및 로깅
-        if self.api_key:
-            logger.debug(f"API Key length: {len(self.api_key)}")
-            logger.debug(f"API Key prefix: {self.api_key[:8]}...")
-            # Binance API 키는 대소문자 알파벳과 숫자 포함 가능
-            valid_chars = set(
-                "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
-            )
-            logger.debug(
-                f"API Key format: {'Valid' if all(c in valid_chars for c in self.api_key) else 'Invalid'}"
-            )
-        else:
-            logger.warning("API Key is missing")
-
-        if self.api_secret:
-            logger.debug(f"API Secret length: {len(self.api_secret)}")
-            logger.debug(f"API Secret prefix: {self.api_secret[:8]}...")
-            # API Secret도 동일한 검증
-            valid_chars = set(
-                "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
-            )
+        # 서버 시각 오프셋은 프로세스 공용 시계가 관리 (백그라운드 재동기화)
+        self._clock = clock or clock_sync
+        # 분 단위 가중치 윈도우는 서버 시각 기준으로 정렬
+        self.rate_limiter = rate_limiter or WeightRateLimiter(now_ms=self._clock.now_ms)
+        # 서명 요청 응답(상태 코드/헤더)을 관찰하는 콜백 (API 키 모니터)
+        self._response_listeners: list[Callable[[httpx.Response], None]] = []
+
+        # 초기화 로깅 및 API 키 검증 (키/시크릿 값 자체는 기록하지 않음)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"API Secret format: {'Valid' if all(c in valid_chars for c in self.api_secret) else 'Invalid'}"
+                f"BinanceFuturesClient initialized: testnet={self.use_testnet}, "
+                f"base_url={self.base_url}, "
+                f"api_key_format={_key_format(self.api_key)}, "
+                f"api_secret_format={_key_format(self.api_secret)}"
             )
-        else:
-            logger.warning("API Secret is missing")
-
         if not self.api_key or not self.api_secret:
             logger.warning("API key or secret is missing - private endpoints will fail")
             logger.warning(
                 f"API Key present: {bool(self.api_key)}, API Secret present: {bool(self.api_secret)}"
             )
 
+    def add_response_listener(self, callback: Callable[[httpx.Response], None]) -> None:
+        """서명 요청 응답을 받을 때마다(오류 응답 포함) 호출할 콜백 등록"""
+        if callback not in self._response_listeners:
+            self._response_listeners.append(callback)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client.is_closed
+
     async def close(self) -> None:
         await self._client.aclose()
 
-    @retry(
-        stop=stop_after_attempt(2), wait=wait_exponential_jitter(initial=0.1, max=0.6)
-    )
-    async def sync_time(self) -> None:
-        """Update local timestamp offset against Binance server time."""
-        local_ms_before = int(time.time() * 1000)
-        logger.debug(f"Syncing time - Local time before: {local_ms_before}")
-
-        resp = await self._client.get("/fapi/v1/time")
-        resp.raise_for_status()
-        server_ms = int(resp.json()["serverTime"])
+    @property
+    def clock(self) -> ClockSync:
+        return self._clock
 
-        local_ms_after = int(time.time() * 1000)
-        self._ts_offset_ms = server_ms - local_ms_after
+    @property
+    def _ts_offset_ms(self) -> int:
+        return self._clock.offset_ms
 
-        logger.debug(f"Server time: {server_ms}")
-        logger.debug(f"Local time after: {local_ms_after}")
-        logger.debug(f"Time offset: {self._ts_offset_ms}ms")
-        logger.debug(f"Time difference: {abs(server_ms - local_ms_after)}ms")
+    @retry(**_RETRY_POLICY)
+    async def sync_time(self) -> None:
+        """Update the shared timestamp offset against Binance server time."""
+        await self._clock.sync(self._fetch_server_time)
 
-        if abs(self._ts_offset_ms) > 1000:  # 1초 이상 차이
-            logger.warning(f"Large time offset detected: {self._ts_offset_ms}ms")
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        priority: Priority = Priority.READ,
+    ) -> httpx.Response:
+        """레이트리미터 예산 확보 후 요청 전송, 응답 헤더로 사용량 보정"""
+        trace = current_trace()
+        queued = time.perf_counter()
+        await self.rate_limiter.acquire(
+            path, endpoint_weight(path, params), priority=priority
+        )
+        start = time.perf_counter()
+        if trace is not None and start - queued >= 0.001:
+            trace.add("rateLimit", (start - queued) * 1000)
+        status = "error"
+        try:
+            resp = await self._client.request(
+                method, path, params=params, headers=headers
+            )
+            status = str(resp.status_code)
+        finally:
+            elapsed = time.perf_counter() - start
+            upstream_request_duration.observe((method, path, status), elapsed)
+            if trace is not None:
+                # 구간 이름은 경로 마지막 부분 (exchangeInfo, order, time, ...)
+                trace.add(path.rsplit("/", 1)[-1], elapsed * 1000)
+        self.rate_limiter.update_from_headers(resp.headers)
+        if resp.status_code in (418, 429):
+            self.rate_limiter.record_throttled(resp.status_code, resp.headers)
+        return resp
+
+    async def _fetch_server_time(self) -> int:
+        resp = await self._send("GET", "/fapi/v1/time")
+        resp.raise_for_status()
+        return int(resp.json()["serverTime"])
 
     def _now_ms(self) -> int:
-        return int(time.time() * 1000) + self._ts_offset_ms
+        return self._clock.now_ms()
 
-    @retry(
-        stop=stop_after_attempt(2), wait=wait_exponential_jitter(initial=0.1, max=0.6)
-    )
+    @retry(**_RETRY_POLICY)
     async def get_exchange_info(self) -> dict[str, Any]:
-        resp = await self._client.get("/fapi/v1/exchangeInfo")
+        resp = await self._send("GET", "/fapi/v1/exchangeInfo")
         resp.raise_for_status()
         return resp.json()
 
-    @retry(
-        stop=stop_after_attempt(2), wait=wait_exponential_jitter(initial=0.1, max=0.6)
-    )
+    @retry(**_RETRY_POLICY)
     async def get_mark_price(self, symbol: Optional[str] = None) -> Any:
         """Use premiumIndex for broader testnet compatibility."""
         params = {"symbol": symbol} if symbol else None
-        resp = await self._client.get("/fapi/v1/premiumIndex", params=params)
+        resp = await self._send("GET", "/fapi/v1/premiumIndex", params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+    @retry(**_RETRY_POLICY)
+    async def get_24hr_ticker(self, symbol: Optional[str] = None) -> Any:
+        """24시간 티커 (symbol 미지정 시 전체 - 가중치 40)"""
+        params = {"symbol": symbol} if symbol else None
+        resp = await self._send("GET", "/fapi/v1/ticker/24hr", params=params)
         resp.raise_for_status()
         return resp.json()
 
@@ -132,6 +221,7 @@ class BinanceFuturesClient:
             method="POST",
             path="/fapi/v1/leverage",
             params={"symbol": symbol, "leverage": leverage},
+            priority=Priority.ORDER,
         )
 
     async def place_market_order(
@@ -147,54 +237,64 @@ class BinanceFuturesClient:
                 "quantity": quantity,
                 "reduceOnly": str(reduce_only).lower(),
             },
+            priority=Priority.ORDER,
         )
 
     async def get_position_risk(self, symbol: Optional[str] = None) -> Any:
-        logger.debug(f"Getting position risk for symbol: {symbol or 'all'}")
         params: dict[str, Any] = {}
         if symbol:
             params["symbol"] = symbol
         try:
-            result = await self._signed_request(
+            return await self._signed_request(
                 "GET", "/fapi/v2/positionRisk", params=params
             )
-            logger.debug(
-                f"Successfully retrieved position risk data: {len(result) if isinstance(result, list) else 'single item'}"
-            )
-            return result
         except Exception as e:
             logger.error(f"Failed to get position risk: {str(e)}")
             raise
 
     async def get_account_info(self) -> dict[str, Any]:
         """계좌 정보 조회 (API 키 검증용)"""
-        logger.debug("Getting account information")
         try:
-            result = await self._signed_request("GET", "/fapi/v2/account")
-            logger.debug("Successfully retrieved account information")
-            return result
+            return await self._signed_request("GET", "/fapi/v2/account")
         except Exception as e:
             logger.error(f"Failed to get account info: {str(e)}")
             raise
 
     async def get_balance(self) -> list[dict[str, Any]]:
         """Futures 잔고 정보 조회"""
-        logger.debug("Getting futures balance information")
         try:
-            result = await self._signed_request("GET", "/fapi/v2/balance")
-            logger.debug(
-                f"Successfully retrieved balance data: {len(result) if isinstance(result, list) else 'single item'}"
-            )
-            return result
+            return await self._signed_request("GET", "/fapi/v2/balance")
         except Exception as e:
             logger.error(f"Failed to get balance: {str(e)}")
             raise
 
+    async def _api_key_request(self, method: str, path: str) -> dict[str, Any]:
+        """서명 없이 API 키 헤더만 필요한 요청 (listenKey 관리)"""
+        if not self.api_key:
+            raise RuntimeError("API key required for user data stream")
+        resp = await self._send(method, path, headers={"X-MBX-APIKEY": self.api_key})
+        resp.raise_for_status()
+        return resp.json()
+
+    async def create_listen_key(self) -> str:
+        """사용자 데이터 스트림 listenKey 발급 (이미 있으면 같은 키 반환)"""
+        result = await self._api_key_request("POST", "/fapi/v1/listenKey")
+        return result["listenKey"]
+
+    async def keepalive_listen_key(self) -> None:
+        """listenKey 만료 시간 60분 연장"""
+        await self._api_key_request("PUT", "/fapi/v1/listenKey")
+
+    async def close_listen_key(self) -> None:
+        await self._api_key_request("DELETE", "/fapi/v1/listenKey")
+
     async def _signed_request(
-        self, method: str, path: str, params: Optional[dict[str, Any]] = None
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        priority: Priority = Priority.READ,
     ) -> dict[str, Any]:
-        logger.debug(f"Making signed request: {method} {path}")
-
         if not self.api_key or not self.api_secret:
             logger.error("API key/secret required for private endpoints")
             logger.error(
@@ -202,56 +302,47 @@ class BinanceFuturesClient:
             )
             raise RuntimeError("API key/secret required for private endpoints")
 
-        if self._ts_offset_ms == 0:
-            logger.debug("Syncing time with Binance server")
+        # 오프셋은 백그라운드 루프가 갱신 - 최초 1회(콜드 스타트)만 직접 동기화
+        if not self._clock.is_synced:
             await self.sync_time()
 
         params = params.copy() if params else {}
         params["timestamp"] = self._now_ms()
         query = str(httpx.QueryParams(params))
-
-        # 서명 생성 과정 상세 로깅
-        logger.debug(f"Original params: {params}")
-        logger.debug(f"Query string: {query}")
-        logger.debug(f"API Secret length: {len(self.api_secret)}")
-        logger.debug(f"API Secret prefix: {self.api_secret[:8]}...")
-
         signature = hmac.new(
             self.api_secret.encode(), query.encode(), hashlib.sha256
         ).hexdigest()
 
-        headers = {"X-MBX-APIKEY": self.api_key}
-        req_kwargs = {"headers": headers}
-
-        logger.debug(f"Generated signature: {signature}")
-        logger.debug(f"Signature length: {len(signature)}")
-        logger.debug(f"Request details: method={method}, path={path}, params={params}")
-        logger.debug(f"Headers: {headers}")
+        # 디버그 로그는 레벨이 켜져 있을 때만 문자열을 만든다 (서명/시크릿은 기록 안 함)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Signed request: {method} {path} params={params}")
 
         try:
-            # 최종 요청 파라미터 로깅
-            final_params = {**params, "signature": signature}
-            logger.debug(f"Final request URL: {self.base_url}{path}")
-            logger.debug(f"Final request params: {final_params}")
-            logger.debug(f"Request method: {method}")
-
-            if method.upper() == "GET":
-                resp = await self._client.get(path, params=final_params, **req_kwargs)
-            else:
-                resp = await self._client.post(path, params=final_params, **req_kwargs)
+            resp = await self._send(
+                method.upper(),
+                path,
+                params={**params, "signature": signature},
+                headers={"X-MBX-APIKEY": self.api_key},
+                priority=priority,
+            )
 
-            logger.debug(f"Response status: {resp.status_code}")
-            logger.debug(f"Response headers: {dict(resp.headers)}")
+            for callback in self._response_listeners:
+                try:
+                    callback(resp)
+                except Exception as e:
+                    logger.warning(f"Response listener failed: {e}")
 
             if resp.status_code >= 400:
                 logger.error(f"HTTP Error {resp.status_code}: {resp.text}")
 
             resp.raise_for_status()
             result = resp.json()
-            logger.debug(f"Response data type: {type(result)}")
-            logger.debug(
-                f"Response data keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}"
-            )
+            if debug:
+                logger.debug(
+                    f"Signed response: {method} {path} status={resp.status_code} "
+                    f"items={len(result) if isinstance(result, list) else 1}"
+                )
             return result
 
         except httpx.HTTPStatusError as e:
@@ -260,3 +351,29 @@ class BinanceFuturesClient:
         except Exception as e:
             logger.error(f"Request failed: {str(e)}")
             raise
+
+
+# 프로세스 공용 클라이언트 (lifespan에서 생성/종료)
+_shared_client: Optional[BinanceFuturesClient] = None
+
+
+def get_shared_client() -> BinanceFuturesClient:
+    """프로세스 전체에서 공유하는 BinanceFuturesClient 반환 (없으면 생성)
+
+    닫힌 클라이언트를 다시 만들 때는 등록된 응답 콜백(API 키 모니터 등)을
+    새 인스턴스로 옮겨, 재생성 후에도 응답 관찰이 끊기지 않게 한다.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        previous = _shared_client
+        _shared_client = BinanceFuturesClient()
+        if previous is not None:
+            for callback in previous._response_listeners:
+                _shared_client.add_response_listener(callback)
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """공용 클라이언트의 커넥션 풀 종료 (콜백 이전을 위해 참조는 유지)"""
+    if _shared_client is not None:
+        await _shared_client.close()
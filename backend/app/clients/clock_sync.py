@@ -0,0 +1,153 @@
+"""Process-wide Binance server clock offset manager."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from app.core.config import CLOCK_SYNC_HISTORY, CLOCK_SYNC_INTERVAL
+from app.utils.tasks import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ClockSample:
+    """단일 시간 동기화 측정값"""
+
+    synced_at: float  # time.time() 기준
+    offset_ms: int
+    rtt_ms: float
+
+
+class ClockSync:
+    """Binance 서버 시각과의 오프셋을 주기적으로 보정하는 시계 서비스.
+
+    서명 요청은 캐시된 오프셋만 읽고(`now_ms`), `/fapi/v1/time` 호출은
+    백그라운드 루프가 담당한다. 왕복 시간의 절반(RTT/2)을 보정해 요청이
+    서버에 도달한 시점 기준으로 오프셋을 계산한다.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = CLOCK_SYNC_INTERVAL,
+        history_size: int = CLOCK_SYNC_HISTORY,
+    ) -> None:
+        self._interval = interval_seconds
+        self._history: deque[ClockSample] = deque(maxlen=history_size)
+        self._offset_ms: int = 0
+        self._last_sync_mono: Optional[float] = None
+        self._task: Optional[PeriodicTask] = None
+        self._lock = asyncio.Lock()
+        # 새 측정값을 받을 콜백 (fetcher가 워커들에게 공유)
+        self._listeners: list[Callable[[dict[str, Any]], None]] = []
+
+    @property
+    def offset_ms(self) -> int:
+        return self._offset_ms
+
+    @property
+    def is_synced(self) -> bool:
+        return self._last_sync_mono is not None
+
+    def now_ms(self) -> int:
+        """서버 기준 현재 시각(ms) - 네트워크 호출 없음"""
+        return int(time.time() * 1000) + self._offset_ms
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    def last_sync_age(self) -> Optional[float]:
+        if self._last_sync_mono is None:
+            return None
+        return time.monotonic() - self._last_sync_mono
+
+    def drift_ms(self) -> int:
+        """직전 측정 대비 오프셋 변화량"""
+        if len(self._history) < 2:
+            return 0
+        return self._history[-1].offset_ms - self._history[-2].offset_ms
+
+    async def sync(self, fetch_server_ms: Callable[[], Awaitable[int]]) -> ClockSample:
+        """서버 시각을 조회해 오프셋 갱신 (동시 호출은 하나로 직렬화)"""
+        async with self._lock:
+            local_before = time.time()
+            started = time.perf_counter()
+            server_ms = await fetch_server_ms()
+            rtt_ms = (time.perf_counter() - started) * 1000
+            # 서버 응답 시각은 왕복 구간의 중간 지점으로 간주
+            local_mid_ms = local_before * 1000 + rtt_ms / 2
+            sample = ClockSample(
+                synced_at=time.time(),
+                offset_ms=int(server_ms - local_mid_ms),
+                rtt_ms=rtt_ms,
+            )
+            self._apply(sample)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Clock synced: offset={sample.offset_ms}ms rtt={rtt_ms:.1f}ms "
+                f"drift={self.drift_ms()}ms"
+            )
+        if abs(sample.offset_ms) > 1000:  # 1초 이상 차이
+            logger.warning(f"Large time offset detected: {sample.offset_ms}ms")
+        for callback in self._listeners:
+            try:
+                callback(asdict(sample))
+            except Exception as e:
+                logger.error(f"Clock sync listener failed: {e}")
+        return sample
+
+    def _apply(self, sample: ClockSample) -> None:
+        self._offset_ms = sample.offset_ms
+        self._last_sync_mono = time.monotonic()
+        self._history.append(sample)
+
+    def last_sample(self) -> Optional[dict[str, Any]]:
+        """마지막 측정값 (공유용 JSON 직렬화 가능한 형태)"""
+        return asdict(self._history[-1]) if self._history else None
+
+    def apply_remote(self, data: dict[str, Any]) -> None:
+        """다른 프로세스(fetcher)가 측정한 값 반영 - /time 호출 없음"""
+        self._apply(ClockSample(**data))
+
+    def add_listener(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        """동기화할 때마다 측정값(`last_sample` 형식)을 받을 콜백 등록"""
+        self._listeners.append(callback)
+
+    def start(self, sync_once: Callable[[], Awaitable[Any]]) -> None:
+        """주기적 재동기화 루프 시작 (이미 실행 중이면 무시)"""
+        if self._task is None:
+            self._task = PeriodicTask("clock-sync", sync_once, self._interval)
+        self._task.start()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            await self._task.stop()
+
+    def snapshot(self) -> dict[str, Any]:
+        """헬스체크용 상태 요약"""
+        age = self.last_sync_age()
+        last = self._history[-1] if self._history else None
+        return {
+            "synced": self.is_synced,
+            "offsetMs": self._offset_ms,
+            "driftMs": self.drift_ms(),
+            "rttMs": round(last.rtt_ms, 1) if last else None,
+            "lastSyncAgeSec": round(age, 1) if age is not None else None,
+            "intervalSec": self._interval,
+            "history": [
+                {"syncedAt": s.synced_at, "offsetMs": s.offset_ms, "rttMs": s.rtt_ms}
+                for s in self._history
+            ],
+        }
+
+
+# 프로세스 공용 시계 인스턴스
+clock_sync = ClockSync()
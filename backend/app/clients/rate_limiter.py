@@ -0,0 +1,245 @@
+"""Weight-aware upstream rate limiter for Binance USDⓈ-M Futures."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Mapping
+from enum import IntEnum
+from typing import Any, Optional
+
+from app.core.config import (
+    BINANCE_ORDER_LIMIT_1M,
+    BINANCE_ORDER_LIMIT_10S,
+    BINANCE_READ_RESERVE,
+    BINANCE_WEIGHT_LIMIT,
+    RATE_LIMIT_SHARES,
+)
+
+logger = logging.getLogger(__name__)
+
+# 문서화된 IP 가중치 (https://binance-docs.github.io/apidocs/futures/en/)
+# 값이 튜플이면 (symbol 지정 시, symbol 미지정 시)
+ENDPOINT_WEIGHTS: dict[str, Any] = {
+    "/fapi/v1/time": 1,
+    "/fapi/v1/exchangeInfo": 1,
+    "/fapi/v1/premiumIndex": (1, 10),
+    "/fapi/v1/ticker/24hr": (1, 40),
+    "/fapi/v1/leverage": 1,
+    "/fapi/v1/order": 0,  # IP 가중치 0, 주문 카운트 1
+    "/fapi/v1/listenKey": 1,
+    "/fapi/v2/positionRisk": 5,
+    "/fapi/v2/account": 5,
+    "/fapi/v2/balance": 5,
+}
+ORDER_PATHS = frozenset({"/fapi/v1/order"})
+DEFAULT_WEIGHT = 1
+
+
+class Priority(IntEnum):
+    """요청 우선순위 레인 (값이 작을수록 우선)"""
+
+    ORDER = 0  # 주문/청산/레버리지
+    READ = 1  # 조회성 요청
+
+
+def endpoint_weight(path: str, params: Optional[Mapping[str, Any]] = None) -> int:
+    """엔드포인트의 문서화된 IP 가중치 계산"""
+    weight = ENDPOINT_WEIGHTS.get(path, DEFAULT_WEIGHT)
+    if isinstance(weight, tuple):
+        return weight[0] if params and params.get("symbol") else weight[1]
+    return weight
+
+
+class WeightRateLimiter:
+    """X-MBX-USED-WEIGHT-1M / X-MBX-ORDER-COUNT-* 헤더로 학습하는 가중치 리미터.
+
+    분 단위 윈도우마다 사용 가중치를 로컬에서 선차감하고 응답 헤더 값으로
+    보정한다. 조회(READ) 레인은 `read_reserve`만큼 남겨두고 멈추므로 주문/청산
+    (ORDER) 레인은 조회 폭주 중에도 항상 먼저 예산을 확보한다.
+
+    `shares` > 1(멀티 워커)이면 모든 한도를 그 수로 나눈 몫만 쓴다. 헤더 값은
+    IP/계정 전체 사용량이므로 로컬 사용량을 덮어쓰지 않고, 남은 몫이 전체
+    잔여분보다 크지 않도록만 보정한다.
+    """
+
+    def __init__(
+        self,
+        weight_limit: int = BINANCE_WEIGHT_LIMIT,
+        read_reserve: int = BINANCE_READ_RESERVE,
+        order_limit_10s: int = BINANCE_ORDER_LIMIT_10S,
+        order_limit_1m: int = BINANCE_ORDER_LIMIT_1M,
+        now_ms: Optional[Callable[[], int]] = None,
+        shares: int = RATE_LIMIT_SHARES,
+    ) -> None:
+        self.shares = max(shares, 1)
+        # 헤더 보정용 전체 한도 (IP 가중치, 계정 주문 수)
+        self._total_limits = (weight_limit, order_limit_10s, order_limit_1m)
+        self.weight_limit = weight_limit // self.shares
+        self.read_reserve = min(read_reserve // self.shares, self.weight_limit)
+        self.order_limit_10s = order_limit_10s // self.shares
+        self.order_limit_1m = order_limit_1m // self.shares
+        self._now_ms = now_ms or (lambda: int(time.time() * 1000))
+        self._cond = asyncio.Condition()
+        self._minute = self._current_minute()
+        self._ten_sec = self._current_ten_sec()
+        self._used_weight = 0
+        self._orders_10s = 0
+        self._orders_1m = 0
+        self._banned_until_ms = 0
+        self._waiting = {Priority.ORDER: 0, Priority.READ: 0}
+        self._total_waits = 0
+        self._total_wait_ms = 0.0
+
+    def _current_minute(self) -> int:
+        return self._now_ms() // 60_000
+
+    def _current_ten_sec(self) -> int:
+        return self._now_ms() // 10_000
+
+    def _roll_windows(self) -> None:
+        minute = self._current_minute()
+        if minute != self._minute:
+            self._minute = minute
+            self._used_weight = 0
+            self._orders_1m = 0
+        ten_sec = self._current_ten_sec()
+        if ten_sec != self._ten_sec:
+            self._ten_sec = ten_sec
+            self._orders_10s = 0
+
+    def _budget(self, priority: Priority) -> int:
+        if priority == Priority.ORDER:
+            return self.weight_limit
+        return self.weight_limit - self.read_reserve
+
+    def _can_proceed(self, weight: int, priority: Priority, is_order: bool) -> bool:
+        if self._now_ms() < self._banned_until_ms:
+            return False
+        # 상위 레인 대기자가 있으면 하위 레인은 양보
+        if priority == Priority.READ and self._waiting[Priority.ORDER]:
+            return False
+        if is_order and (
+            self._orders_10s >= self.order_limit_10s
+            or self._orders_1m >= self.order_limit_1m
+        ):
+            return False
+        return self._used_weight + weight <= self._budget(priority)
+
+    def _sleep_hint(self, is_order: bool) -> float:
+        """다음 윈도우 경계(또는 밴 해제)까지 남은 시간(초)"""
+        now = self._now_ms()
+        if now < self._banned_until_ms:
+            return (self._banned_until_ms - now) / 1000
+        boundary = 10_000 if is_order else 60_000
+        return max((boundary - now % boundary) / 1000, 0.01)
+
+    async def acquire(
+        self, path: str, weight: int, priority: Priority = Priority.READ
+    ) -> None:
+        """요청 전 가중치 예산 확보 (부족하면 다음 윈도우까지 대기)"""
+        is_order = path in ORDER_PATHS
+        async with self._cond:
+            self._roll_windows()
+            if not self._can_proceed(weight, priority, is_order):
+                started = time.perf_counter()
+                self._waiting[priority] += 1
+                try:
+                    while True:
+                        try:
+                            await asyncio.wait_for(
+                                self._cond.wait(), timeout=self._sleep_hint(is_order)
+                            )
+                        except TimeoutError:
+                            pass
+                        self._roll_windows()
+                        if self._can_proceed(weight, priority, is_order):
+                            break
+                finally:
+                    self._waiting[priority] -= 1
+                    self._cond.notify_all()
+                waited_ms = (time.perf_counter() - started) * 1000
+                self._total_waits += 1
+                self._total_wait_ms += waited_ms
+                logger.warning(
+                    f"Rate limiter delayed {path} ({priority.name}) by {waited_ms:.0f}ms"
+                )
+            self._used_weight += weight
+            if is_order:
+                self._orders_10s += 1
+                self._orders_1m += 1
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """응답 헤더의 실제 사용량으로 로컬 카운터 보정"""
+        self._roll_windows()
+        total_weight, total_10s, total_1m = self._total_limits
+        used = _int_header(headers, "x-mbx-used-weight-1m")
+        if used is not None:
+            self._used_weight = self._calibrate(
+                self._used_weight, used, total_weight, self.weight_limit
+            )
+        orders_10s = _int_header(headers, "x-mbx-order-count-10s")
+        if orders_10s is not None:
+            self._orders_10s = self._calibrate(
+                self._orders_10s, orders_10s, total_10s, self.order_limit_10s
+            )
+        orders_1m = _int_header(headers, "x-mbx-order-count-1m")
+        if orders_1m is not None:
+            self._orders_1m = self._calibrate(
+                self._orders_1m, orders_1m, total_1m, self.order_limit_1m
+            )
+
+    def _calibrate(self, local: int, reported: int, total: int, share: int) -> int:
+        if self.shares == 1:
+            return reported  # 단일 프로세스: 헤더 값이 곧 내 사용량
+        # 다른 프로세스 몫은 알 수 없음 - 남은 몫(share - local)이 전체 잔여분
+        # (total - reported)을 넘을 때만 로컬 사용량을 끌어올림
+        return max(local, reported - (total - share))
+
+    def record_throttled(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """429/418 응답 시 Retry-After 동안 모든 레인 차단"""
+        retry_after = _int_header(headers, "retry-after")
+        if retry_after is None:
+            retry_after = 60 if status_code == 418 else 1
+        self._banned_until_ms = max(
+            self._banned_until_ms, self._now_ms() + retry_after * 1000
+        )
+        logger.warning(
+            f"Binance throttled request (status={status_code}), "
+            f"blocking for {retry_after}s"
+        )
+
+    @property
+    def remaining_weight(self) -> int:
+        self._roll_windows()
+        return max(self.weight_limit - self._used_weight, 0)
+
+    def metrics(self) -> dict[str, Any]:
+        """남은 예산 및 대기 통계"""
+        self._roll_windows()
+        return {
+            "weightLimit": self.weight_limit,
+            "shares": self.shares,
+            "usedWeight1m": self._used_weight,
+            "remainingWeight": self.remaining_weight,
+            "readReserve": self.read_reserve,
+            "orderCount10s": self._orders_10s,
+            "orderCount1m": self._orders_1m,
+            "orderLimit10s": self.order_limit_10s,
+            "orderLimit1m": self.order_limit_1m,
+            "waiting": {p.name.lower(): n for p, n in self._waiting.items()},
+            "totalWaits": self._total_waits,
+            "totalWaitMs": round(self._total_wait_ms, 1),
+            "bannedForMs": max(self._banned_until_ms - self._now_ms(), 0),
+        }
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    raw = headers.get(name)
+    if raw is None:
+        return None
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,256 @@
+"""Unix-socket pub/sub for sharing fetched state between worker processes."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+TopicHandler = Callable[[Any], Union[Awaitable[None], None]]
+
+# exchangeInfo 한 건이 한 줄이므로 기본 64KB보다 크게
+_LINE_LIMIT = 16 * 1024 * 1024
+
+
+def encode_frame(topic: str, data: Any) -> bytes:
+    """한 줄짜리 JSON 프레임 (구독자 수와 무관하게 발행당 한 번만 직렬화)"""
+    return (
+        json.dumps({"topic": topic, "data": data}, separators=(",", ":")).encode()
+        + b"\n"
+    )
+
+
+async def _dispatch(handlers: dict[str, TopicHandler], frame: dict[str, Any]) -> bool:
+    """토픽 핸들러 호출 (핸들러가 없으면 False, 핸들러 오류는 로그만 남김)"""
+    handler = handlers.get(frame.get("topic"))
+    if handler is None:
+        return False
+    try:
+        result = handler(frame.get("data"))
+        if asyncio.iscoroutine(result):
+            await result
+    except Exception as e:
+        logger.warning(f"State bus handler {frame.get('topic')} failed: {e}")
+    return True
+
+
+class _Subscriber:
+    def __init__(self, writer: asyncio.StreamWriter, queue_size: int) -> None:
+        self.writer = writer
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(queue_size)
+        self.task: Optional[asyncio.Task] = None
+
+
+class StateBusServer:
+    """토픽별 최신 값을 보관하고 접속한 워커에게 방송하는 발행자.
+
+    새 구독자는 접속 즉시 토픽별 마지막 프레임을 받아 상태를 맞춘다.
+    구독자별 큐가 가득 차면(느린 워커) 연결을 끊어, 재접속 시 최신 값으로
+    다시 동기화되게 한다 - 발행 경로는 어떤 경우에도 기다리지 않는다.
+    워커가 보낸 프레임(예: 거래 기록)은 `handlers`의 토픽별 핸들러로 전달한다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        queue_size: int = 256,
+        handlers: Optional[dict[str, TopicHandler]] = None,
+    ) -> None:
+        self.path = path
+        self.queue_size = queue_size
+        self._handlers = handlers or {}
+        self._server: Optional[asyncio.Server] = None
+        self._subscribers: set[_Subscriber] = set()
+        self._last: dict[str, bytes] = {}
+        self.published = 0
+        self.received = 0
+        self.dropped_subscribers = 0
+
+    async def start(self) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)  # 이전 프로세스가 남긴 소켓 파일
+        self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+        logger.info(f"State bus listening on {self.path}")
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        # wait_closed()는 (3.12.1+) 접속 핸들러가 끝나길 기다리므로 구독자를 먼저 정리
+        handlers = [s.task for s in self._subscribers if s.task is not None]
+        for subscriber in list(self._subscribers):
+            self._drop(subscriber)
+        await asyncio.gather(*handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+
+    def publish(self, topic: str, data: Any) -> None:
+        frame = encode_frame(topic, data)
+        self._last[topic] = frame
+        self.published += 1
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self.dropped_subscribers += 1
+                logger.warning("State bus subscriber too slow, disconnecting")
+                self._drop(subscriber)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        subscriber = _Subscriber(writer, max(self.queue_size, len(self._last)))
+        for frame in self._last.values():
+            subscriber.queue.put_nowait(frame)
+        self._subscribers.add(subscriber)
+        subscriber.task = asyncio.current_task()
+        inbound = asyncio.create_task(self._receive(reader))
+        try:
+            while True:
+                frame = await subscriber.queue.get()
+                writer.write(frame)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            # 취소(_drop/stop)는 정리 후 그대로 전파
+            inbound.cancel()
+            self._subscribers.discard(subscriber)
+            writer.close()
+
+    async def _receive(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while line := await reader.readline():
+                frame = json.loads(line)
+                self.received += 1
+                await _dispatch(self._handlers, frame)
+        except (ConnectionError, ValueError) as e:
+            logger.warning(f"State bus inbound frame dropped: {e}")
+
+    def _drop(self, subscriber: _Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+        subscriber.writer.close()
+        if subscriber.task is not None:
+            subscriber.task.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "subscribers": len(self._subscribers),
+            "topics": sorted(self._last),
+            "published": self.published,
+            "received": self.received,
+            "droppedSubscribers": self.dropped_subscribers,
+        }
+
+
+class StateBusClient:
+    """발행자에 접속해 토픽별 핸들러로 프레임을 전달하는 구독자.
+
+    끊기면 지수 backoff로 재접속하며, 재접속 직후 받는 토픽별 최신 값으로
+    상태가 다시 맞춰진다. 연결/해제 시 `on_state`(True/False)를 호출한다.
+    같은 연결로 발행자에게 프레임을 보낼 수 있다(`send`).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        handlers: dict[str, TopicHandler],
+        on_state: Optional[Callable[[bool], None]] = None,
+        reconnect_min: float = 0.2,
+        reconnect_max: float = 5.0,
+    ) -> None:
+        self.path = path
+        self._handlers = handlers
+        self._on_state = on_state
+        self._reconnect_min = reconnect_min
+        self._reconnect_max = reconnect_max
+        self._task: Optional[asyncio.Task] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self.connected = False
+        self.frames = 0
+        self.sent = 0
+        self.reconnects = 0
+        self.last_error: Optional[str] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="state-bus-client")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self._set_connected(False)
+
+    def _set_connected(self, connected: bool) -> None:
+        if connected == self.connected:
+            return
+        self.connected = connected
+        if self._on_state is not None:
+            self._on_state(connected)
+
+    async def _run(self) -> None:
+        delay = self._reconnect_min
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    self.path, limit=_LINE_LIMIT
+                )
+            except OSError as e:
+                self.last_error = str(e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._reconnect_max)
+                continue
+            delay = self._reconnect_min
+            self._writer = writer
+            self._set_connected(True)
+            try:
+                await self._consume(reader)
+            except (ConnectionError, ValueError) as e:
+                self.last_error = str(e)
+            finally:
+                self._writer = None
+                writer.close()
+                self._set_connected(False)
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+
+    async def _consume(self, reader: asyncio.StreamReader) -> None:
+        while line := await reader.readline():
+            frame = json.loads(line)
+            if await _dispatch(self._handlers, frame):
+                self.frames += 1
+
+    async def send(self, topic: str, data: Any) -> bool:
+        """발행자에게 프레임 전송 (연결돼 있지 않으면 False)"""
+        writer = self._writer
+        if writer is None:
+            return False
+        try:
+            writer.write(encode_frame(topic, data))
+            await writer.drain()
+        except ConnectionError as e:
+            self.last_error = str(e)
+            return False
+        self.sent += 1
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "connected": self.connected,
+            "frames": self.frames,
+            "sent": self.sent,
+            "reconnects": self.reconnects,
+            "lastError": self.last_error,
+        }
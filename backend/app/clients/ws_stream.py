@@ -0,0 +1,129 @@
+"""Reconnecting WebSocket consumer for Binance market/user streams."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional, Union
+
+from websockets.asyncio.client import connect
+
+logger = logging.getLogger(__name__)
+
+UrlSource = Union[str, Callable[[], Awaitable[str]]]
+MessageHandler = Callable[[Any], Union[Awaitable[None], None]]
+
+
+class WebSocketStream:
+    """끊기면 지수 backoff로 재연결하는 WebSocket 구독 루프.
+
+    메시지는 JSON으로 디코딩해 `on_message`에 전달한다. `idle_timeout` 동안
+    메시지가 없으면 연결이 죽은 것으로 보고 재연결한다 (None이면 ping에만 의존).
+    URL은 문자열 또는 연결 시마다 호출되는 코루틴(listenKey 발급 등)으로
+    지정할 수 있다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        url: UrlSource,
+        on_message: MessageHandler,
+        on_connect: Optional[Callable[[], Awaitable[None]]] = None,
+        idle_timeout: Optional[float] = 30.0,
+        reconnect_min: float = 0.5,
+        reconnect_max: float = 30.0,
+    ) -> None:
+        self.name = name
+        self._url = url
+        self._on_message = on_message
+        self._on_connect = on_connect
+        self._idle_timeout = idle_timeout
+        self._reconnect_min = reconnect_min
+        self._reconnect_max = reconnect_max
+        self._task: Optional[asyncio.Task] = None
+        self.connected = False
+        self.messages = 0
+        self.reconnects = 0
+        self.last_message_at: Optional[float] = None  # time.monotonic()
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.connected = False
+
+    async def restart(self) -> None:
+        """현재 연결을 끊고 새로 연결 (URL 코루틴도 다시 호출됨)"""
+        await self.stop()
+        self.reconnects += 1
+        self.start()
+
+    async def _resolve_url(self) -> str:
+        if isinstance(self._url, str):
+            return self._url
+        return await self._url()
+
+    async def _run(self) -> None:
+        delay = self._reconnect_min
+        while True:
+            try:
+                url = await self._resolve_url()
+                async with connect(url, open_timeout=10, max_size=2**22) as ws:
+                    self.connected = True
+                    delay = self._reconnect_min
+                    logger.info(f"{self.name} connected")
+                    if self._on_connect is not None:
+                        await self._on_connect()
+                    while True:
+                        raw = await asyncio.wait_for(ws.recv(), self._idle_timeout)
+                        self.messages += 1
+                        self.last_message_at = time.monotonic()
+                        result = self._on_message(json.loads(raw))
+                        if inspect.isawaitable(result):
+                            await result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                logger.warning(f"{self.name} disconnected: {self.last_error}")
+            finally:
+                self.connected = False
+
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._reconnect_max)
+
+    def lag(self) -> Optional[float]:
+        """마지막 메시지 이후 경과 시간(초)"""
+        if self.last_message_at is None:
+            return None
+        return time.monotonic() - self.last_message_at
+
+    def stats(self) -> dict[str, Any]:
+        lag = self.lag()
+        return {
+            "connected": self.connected,
+            "messages": self.messages,
+            "reconnects": self.reconnects,
+            "lagSec": round(lag, 3) if lag is not None else None,
+            "lastError": self.last_error,
+        }
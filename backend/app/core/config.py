@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from pathlib import Path
 from typing import Optional
 
 try:
@@ -31,6 +32,31 @@ def _int_env(name: str, default: int) -> int:
         return default
 
 
+def _float_env(name: str, default: float) -> float:
+    """환경변수를 실수 값으로 변환"""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+_LOG_LEVEL_NAMES = {"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"}
+
+
+def _log_levels_env(name: str) -> dict[str, str]:
+    """모듈=레벨 쉼표 목록을 dict로 변환 (잘못된 항목은 무시)"""
+    levels: dict[str, str] = {}
+    for item in os.getenv(name, "").split(","):
+        module, sep, level = item.partition("=")
+        level = level.strip().upper()
+        if sep and module.strip() and level in _LOG_LEVEL_NAMES:
+            levels[module.strip()] = level
+    return levels
+
+
 # =============================================================================
 # Binance API Configuration
 # =============================================================================
@@ -38,6 +64,23 @@ BINANCE_API_KEY: Optional[str] = os.getenv("BINANCE_API_KEY")
 BINANCE_SECRET_KEY: Optional[str] = os.getenv("BINANCE_API_SECRET")
 BINANCE_TESTNET: bool = _bool_env("BINANCE_TESTNET", True)
 
+# Binance HTTP 커넥션 풀 설정 (프로세스 공용 클라이언트)
+BINANCE_HTTP_TIMEOUT: float = _float_env("BINANCE_HTTP_TIMEOUT", 5.0)
+BINANCE_HTTP_MAX_CONNECTIONS: int = _int_env("BINANCE_HTTP_MAX_CONNECTIONS", 20)
+BINANCE_HTTP_MAX_KEEPALIVE: int = _int_env("BINANCE_HTTP_MAX_KEEPALIVE", 10)
+BINANCE_HTTP_KEEPALIVE_EXPIRY: float = _float_env("BINANCE_HTTP_KEEPALIVE_EXPIRY", 60.0)
+BINANCE_HTTP2: bool = _bool_env("BINANCE_HTTP2", False)
+
+# 서버 시각 동기화 주기(초) 및 드리프트 이력 보관 개수
+CLOCK_SYNC_INTERVAL: float = _float_env("CLOCK_SYNC_INTERVAL", 60.0)
+CLOCK_SYNC_HISTORY: int = _int_env("CLOCK_SYNC_HISTORY", 60)
+
+# 업스트림 레이트리밋 (응답 헤더로 실제 사용량 보정)
+BINANCE_WEIGHT_LIMIT: int = _int_env("BINANCE_WEIGHT_LIMIT", 2400)  # 1분당 IP 가중치
+BINANCE_READ_RESERVE: int = _int_env("BINANCE_READ_RESERVE", 200)  # 주문 전용 예비분
+BINANCE_ORDER_LIMIT_10S: int = _int_env("BINANCE_ORDER_LIMIT_10S", 300)
+BINANCE_ORDER_LIMIT_1M: int = _int_env("BINANCE_ORDER_LIMIT_1M", 1200)
+
 
 # Binance API 설정 검증
 def get_binance_config() -> dict:
@@ -63,17 +106,97 @@ CORS_ORIGIN: str = os.getenv("CORS_ORIGIN", "http://localhost:8080")
 # Authentication
 AUTH_TOKEN: Optional[str] = os.getenv("AUTH_TOKEN")
 
+# 요청 프로파일링 (토큰 미설정 시 비활성) 및 보관할 최근 프로파일 수
+PROFILING_TOKEN: Optional[str] = os.getenv("PROFILING_TOKEN")
+PROFILING_MAX_PROFILES: int = _int_env("PROFILING_MAX_PROFILES", 10)
+
 
 # =============================================================================
 # Logging Configuration
 # =============================================================================
 LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+# 모듈별 로그 레벨 (예: "app=INFO,app.clients.binance_client=DEBUG")
+LOG_LEVELS: dict[str, str] = _log_levels_env("LOG_LEVELS")
 
 
 # =============================================================================
 # Cache Configuration
 # =============================================================================
 POSITION_CACHE_TTL: int = _int_env("POSITION_CACHE_TTL", 30)  # 30초
+# TTL 경과 후에도 이 시간 동안은 오래된 값을 즉시 반환하고 백그라운드 갱신
+POSITION_CACHE_STALE_TTL: int = _int_env("POSITION_CACHE_STALE_TTL", 30)
+POSITION_CACHE_MAXSIZE: int = _int_env("POSITION_CACHE_MAXSIZE", 256)
+# exchangeInfo 기반 심볼 메타데이터 백그라운드 갱신 주기
+SYMBOL_META_REFRESH_INTERVAL: int = _int_env("SYMBOL_META_REFRESH_INTERVAL", 60)
+# 심볼 검색 거래량 정렬용 24시간 티커 캐시 유효 시간(초)
+SYMBOL_TICKER_TTL: int = _int_env("SYMBOL_TICKER_TTL", 60)
+# 마크프라이스 스트림 사용 여부 및 REST 폴백 기준(초)
+MARK_PRICE_STREAM_ENABLED: bool = _bool_env("MARK_PRICE_STREAM_ENABLED", True)
+MARK_PRICE_MAX_AGE: float = _float_env("MARK_PRICE_MAX_AGE", 2.0)
+# 심볼별 레버리지 상태 캐시 유효 시간(초). 앱 밖(웹 UI, 다른 클라이언트)에서
+# 바꾼 레버리지는 사용자 스트림의 ACCOUNT_CONFIG_UPDATE로 즉시 반영되지만,
+# 스트림이 끊긴 동안에는 이 시간까지 잘못된 레버리지로 주문될 수 있으므로 짧게
+# 둔다 (계좌 스냅샷 조회/재동기화마다 다시 채워짐)
+LEVERAGE_CACHE_TTL: int = _int_env("LEVERAGE_CACHE_TTL", 30)
+# 사용자 데이터 스트림(listenKey) 사용 여부 및 keepalive 주기(초, 키 만료는 60분)
+USER_STREAM_ENABLED: bool = _bool_env("USER_STREAM_ENABLED", True)
+USER_STREAM_KEEPALIVE_INTERVAL: float = _float_env(
+    "USER_STREAM_KEEPALIVE_INTERVAL", 1800.0
+)
+# 스트림 이벤트에 없는 잔고 필드(availableBalance 등)를 맞추는 REST 계좌 조회 주기(초)
+USER_STREAM_RECONCILE_INTERVAL: float = _float_env(
+    "USER_STREAM_RECONCILE_INTERVAL", 30.0
+)
+# 포지션 푸시(SSE): 공용 갱신 주기, 하트비트 간격(초), 구독자별 큐 크기
+POSITION_FEED_INTERVAL: float = _float_env("POSITION_FEED_INTERVAL", 1.0)
+POSITION_FEED_HEARTBEAT: float = _float_env("POSITION_FEED_HEARTBEAT", 15.0)
+POSITION_FEED_QUEUE_SIZE: int = _int_env("POSITION_FEED_QUEUE_SIZE", 32)
+# GET /api/positions?wait= 롱폴 최대 대기 시간(초)
+POSITION_LONG_POLL_MAX: float = _float_env("POSITION_LONG_POLL_MAX", 30.0)
+# 헬스 스냅샷 계산 주기(초), 스트림 지연 허용치(초), 최소 가중치 여유 비율
+HEALTH_CHECK_INTERVAL: float = _float_env("HEALTH_CHECK_INTERVAL", 5.0)
+HEALTH_STREAM_MAX_LAG: float = _float_env("HEALTH_STREAM_MAX_LAG", 5.0)
+HEALTH_MIN_WEIGHT_HEADROOM: float = _float_env("HEALTH_MIN_WEIGHT_HEADROOM", 0.1)
+# 서명 요청이 이 시간(초) 동안 없을 때만 API 키를 직접 확인 (계좌 조회)
+API_KEY_IDLE_PROBE_INTERVAL: float = _float_env("API_KEY_IDLE_PROBE_INTERVAL", 300.0)
+
+
+# =============================================================================
+# Multi-worker Configuration
+# =============================================================================
+# standalone: 단일 프로세스 / fetcher: 업스트림 연결 소유 후 상태 발행 /
+# worker: 상태를 구독해 요청만 처리 (여러 uvicorn 워커)
+WORKER_ROLE: str = os.getenv("WORKER_ROLE", "standalone").lower()
+STATE_BUS_PATH: str = os.getenv("STATE_BUS_PATH", "/tmp/remocon-state.sock")
+# 구독 워커별 미전송 프레임 한도 (초과 시 끊고 재접속으로 재동기화)
+STATE_BUS_QUEUE_SIZE: int = _int_env("STATE_BUS_QUEUE_SIZE", 256)
+# uvicorn 워커 수 (start.sh와 같은 값)
+WEB_WORKERS: int = max(_int_env("WEB_WORKERS", 1), 1)
+# 레이트리미터는 프로세스마다 따로 있으므로 멀티 워커에서는 가중치/주문 한도를
+# fetcher + 워커 수로 나눠, 합계가 Binance IP/계정 한도를 넘지 않게 함
+RATE_LIMIT_SHARES: int = WEB_WORKERS + 1 if WORKER_ROLE in ("fetcher", "worker") else 1
+
+
+# =============================================================================
+# Trade Journal Configuration
+# =============================================================================
+TRADE_JOURNAL_PATH: Path = Path(
+    os.getenv(
+        "TRADE_JOURNAL_PATH",
+        str(Path(__file__).parent.parent.parent / "data" / "trades.csv"),
+    )
+)
+TRADE_JOURNAL_BATCH_SIZE: int = _int_env("TRADE_JOURNAL_BATCH_SIZE", 100)
+TRADE_JOURNAL_FLUSH_INTERVAL: float = _float_env("TRADE_JOURNAL_FLUSH_INTERVAL", 1.0)
+# none | batch | interval
+TRADE_JOURNAL_FSYNC: str = os.getenv("TRADE_JOURNAL_FSYNC", "batch")
+# 거래 이력 조회용 SQLite(WAL) 색인 저장소
+TRADE_STORE_PATH: Path = Path(
+    os.getenv(
+        "TRADE_STORE_PATH",
+        str(Path(__file__).parent.parent.parent / "data" / "trades.db"),
+    )
+)
 
 
 # =============================================================================
@@ -81,6 +204,8 @@ POSITION_CACHE_TTL: int = _int_env("POSITION_CACHE_TTL", 30)  # 30초
 # =============================================================================
 # 최대 레버리지 설정
 MAX_LEVERAGE: int = _int_env("MAX_LEVERAGE", 25)
+# 주문 전 단계(심볼 메타/마크프라이스/레버리지) 공용 데드라인(초)
+PRE_TRADE_TIMEOUT: float = _float_env("PRE_TRADE_TIMEOUT", 3.0)
 
 
 # =============================================================================
@@ -98,14 +223,68 @@ def validate_config() -> dict:
             "cors_origin": CORS_ORIGIN,
         },
         "binance": binance_config,
+        "http": {
+            "timeout": BINANCE_HTTP_TIMEOUT,
+            "max_connections": BINANCE_HTTP_MAX_CONNECTIONS,
+            "max_keepalive": BINANCE_HTTP_MAX_KEEPALIVE,
+            "keepalive_expiry": BINANCE_HTTP_KEEPALIVE_EXPIRY,
+            "http2": BINANCE_HTTP2,
+        },
+        "clock": {
+            "sync_interval": CLOCK_SYNC_INTERVAL,
+            "history": CLOCK_SYNC_HISTORY,
+        },
+        "rate_limit": {
+            "weight_limit": BINANCE_WEIGHT_LIMIT,
+            "read_reserve": BINANCE_READ_RESERVE,
+            "order_limit_10s": BINANCE_ORDER_LIMIT_10S,
+            "order_limit_1m": BINANCE_ORDER_LIMIT_1M,
+        },
         "cache": {
             "position_cache_ttl": POSITION_CACHE_TTL,
+            "position_cache_stale_ttl": POSITION_CACHE_STALE_TTL,
+            "position_cache_maxsize": POSITION_CACHE_MAXSIZE,
+            "symbol_meta_refresh_interval": SYMBOL_META_REFRESH_INTERVAL,
+            "symbol_ticker_ttl": SYMBOL_TICKER_TTL,
+            "mark_price_stream": MARK_PRICE_STREAM_ENABLED,
+            "mark_price_max_age": MARK_PRICE_MAX_AGE,
+            "leverage_cache_ttl": LEVERAGE_CACHE_TTL,
+            "user_stream": USER_STREAM_ENABLED,
+            "user_stream_keepalive_interval": USER_STREAM_KEEPALIVE_INTERVAL,
+            "user_stream_reconcile_interval": USER_STREAM_RECONCILE_INTERVAL,
+            "position_feed_interval": POSITION_FEED_INTERVAL,
+            "position_feed_heartbeat": POSITION_FEED_HEARTBEAT,
+            "position_feed_queue_size": POSITION_FEED_QUEUE_SIZE,
+            "position_long_poll_max": POSITION_LONG_POLL_MAX,
+            "health_check_interval": HEALTH_CHECK_INTERVAL,
+            "health_stream_max_lag": HEALTH_STREAM_MAX_LAG,
+            "health_min_weight_headroom": HEALTH_MIN_WEIGHT_HEADROOM,
+            "api_key_idle_probe_interval": API_KEY_IDLE_PROBE_INTERVAL,
         },
         "trading": {
             "max_leverage": MAX_LEVERAGE,
+            "pre_trade_timeout": PRE_TRADE_TIMEOUT,
         },
-        "logging": {"level": LOG_LEVEL},
+        "journal": {
+            "path": str(TRADE_JOURNAL_PATH),
+            "batch_size": TRADE_JOURNAL_BATCH_SIZE,
+            "flush_interval": TRADE_JOURNAL_FLUSH_INTERVAL,
+            "fsync": TRADE_JOURNAL_FSYNC,
+            "store_path": str(TRADE_STORE_PATH),
+        },
+        "workers": {
+            "role": WORKER_ROLE,
+            "state_bus_path": STATE_BUS_PATH,
+            "state_bus_queue_size": STATE_BUS_QUEUE_SIZE,
+            "web_workers": WEB_WORKERS,
+            "rate_limit_shares": RATE_LIMIT_SHARES,
+        },
+        "logging": {"level": LOG_LEVEL, "levels": LOG_LEVELS},
         "auth": {"enabled": bool(AUTH_TOKEN)},
+        "profiling": {
+            "enabled": bool(PROFILING_TOKEN),
+            "max_profiles": PROFILING_MAX_PROFILES,
+        },
     }
 
 
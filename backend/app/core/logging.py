@@ -1,12 +1,44 @@
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
 import sys
+from typing import Optional
+
+from app.core.config import LOG_LEVELS
+
+_listener: Optional[logging.handlers.QueueListener] = None
+# 실제 출력 핸들러(stdout)와 이벤트 루프 쪽 큐 핸들러 - 라이터 스레드가 멈춘
+# 동안에는 출력 핸들러를 직접 붙여 종료 이후 로그도 유실되지 않게 한다
+_stream_handler: Optional[logging.Handler] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+class _DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """메시지 병합만 호출 스레드에서 하고 포매팅/출력은 라이터 스레드로 넘김
+
+    기본 QueueHandler.prepare()는 타임스탬프를 포함한 전체 포매팅을 호출
+    스레드(이벤트 루프)에서 수행하므로, 인자 병합만 하고 나머지는 미룬다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            # 트레이스백은 프레임 참조를 들고 있으므로 기존 방식대로 처리
+            return super().prepare(record)
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 def setup_logger() -> logging.Logger:
+    global _stream_handler, _queue_handler
     logger = logging.getLogger("app")
-    if logger.handlers:
+    if _stream_handler is not None:
+        start_logging()
         return logger
     logger.setLevel(logging.WARNING)  # WARNING 레벨로 유지
     handler = logging.StreamHandler(stream=sys.stdout)
@@ -15,7 +47,13 @@ def setup_logger() -> logging.Logger:
         datefmt="%Y-%m-%dT%H:%M:%S%z",
     )
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    _stream_handler = handler
+
+    # 이벤트 루프에서는 큐에 넣기만 하고 stdout 쓰기는 백그라운드 스레드에서 수행
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = _DeferredFormatQueueHandler(log_queue)
+    start_logging()
+    atexit.register(stop_logging)
 
     # FastAPI와 uvicorn 로그 레벨 조정
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -31,4 +69,33 @@ def setup_logger() -> logging.Logger:
     # API 키 모니터링 로그는 유지 (중요한 정보)
     logging.getLogger("app.core.security").setLevel(logging.INFO)
 
+    # 모듈별 레벨 재정의 (LOG_LEVELS="app.clients.binance_client=DEBUG,...")
+    for name, level in LOG_LEVELS.items():
+        logging.getLogger(name).setLevel(level)
+
     return logger
+
+
+def start_logging() -> None:
+    """라이터 스레드 시작 후 큐 핸들러로 전환 (이미 실행 중이면 무시)"""
+    global _listener
+    if _listener is not None or _queue_handler is None:
+        return
+    logger = logging.getLogger("app")
+    _listener = logging.handlers.QueueListener(
+        _queue_handler.queue, _stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+    logger.removeHandler(_stream_handler)
+    logger.addHandler(_queue_handler)
+
+
+def stop_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 라이터 스레드 종료 (이후 로그는 직접 출력)"""
+    global _listener
+    if _listener is not None:
+        logger = logging.getLogger("app")
+        logger.removeHandler(_queue_handler)
+        logger.addHandler(_stream_handler)
+        _listener.stop()
+        _listener = None
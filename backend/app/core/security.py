@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-import asyncio
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Optional
 
+import httpx
 from fastapi import Header, HTTPException
 
-from app.core.config import AUTH_TOKEN, BINANCE_API_KEY, BINANCE_SECRET_KEY
+from app.core.config import API_KEY_IDLE_PROBE_INTERVAL, AUTH_TOKEN
 from app.core.logging import setup_logger
+from app.services.account import AccountSnapshotService, account_snapshot
+from app.utils.tasks import PeriodicTask
+
+if TYPE_CHECKING:
+    from app.clients.binance_client import BinanceFuturesClient
 
 
 @dataclass
@@ -22,99 +29,196 @@ class ApiKeyStatus:
     error_message: Optional[str] = None
 
 
-class ApiKeyMonitor:
-    """API 키 상태 모니터링 클래스"""
+# 키 자체가 거부됐음을 뜻하는 Binance 오류 코드 (그 외 4xx는 인증 통과 후 업무 오류)
+_AUTH_ERROR_CODES = {
+    -1002: "Unauthorized request",
+    -1022: "Invalid signature",
+    -2014: "API key format invalid",
+    -2015: "Invalid API key, IP, or permissions for action",
+}
+
+# 유휴 여부 확인 주기(초) - 유휴 판정 자체는 idle_probe_interval 기준
+_IDLE_CHECK_INTERVAL = 30.0
 
-    def __init__(self):
+
+class ApiKeyMonitor:
+    """API 키 상태 모니터링 클래스.
+
+    실제 서명 요청의 응답 상태 코드로 키 유효성을 판정한다 (2xx와 업무 오류는
+    유효, 인증 오류 코드는 무효). 가중치 여유는 레이트리미터가 응답 헤더로
+    보정한 값을 그대로 쓰고, 서명 요청이 `idle_probe_interval` 동안 없을 때만
+    계좌 조회로 직접 확인한다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[BinanceFuturesClient] = None,
+        account: Optional[AccountSnapshotService] = None,
+        idle_probe_interval: float = API_KEY_IDLE_PROBE_INTERVAL,
+    ):
+        self._client = client
+        self.account = account or account_snapshot
+        self.idle_probe_interval = idle_probe_interval
         self._status: Optional[ApiKeyStatus] = None
-        self._last_check = datetime.min
-        self._check_interval = timedelta(minutes=5)  # 5분마다 체크
+        self._verified_at: Optional[float] = None  # time.monotonic()
         self._logger = setup_logger()
+        self._task = PeriodicTask(
+            "api-key-monitor",
+            self._probe_if_idle,
+            min(idle_probe_interval, _IDLE_CHECK_INTERVAL),
+        )
+        # 판정이 기록될 때마다 상태(`export` 형식)를 받을 콜백 (워커 공유용)
+        self._listeners: list[Callable[[dict[str, Any]], None]] = []
+        self.observed = 0
+        self.probes = 0
+
+    @property
+    def client(self) -> BinanceFuturesClient:
+        """주입된 클라이언트가 없으면 프로세스 공용 클라이언트 사용"""
+        from app.clients.binance_client import get_shared_client
+
+        return self._client or get_shared_client()
+
+    @property
+    def status(self) -> Optional[ApiKeyStatus]:
+        """마지막으로 확인된 상태 (조회를 일으키지 않음, 미확인 시 None)"""
+        if self._status is None:
+            return None
+        # 남은 가중치는 판정 시점이 아닌 현재 레이트리미터 값
+        return replace(
+            self._status,
+            rate_limit_remaining=self.client.rate_limiter.remaining_weight,
+        )
 
     async def get_api_key_status(self) -> ApiKeyStatus:
-        """API 키 상태 조회 (캐시된 결과 반환)"""
-        now = datetime.now()
-
-        # 캐시된 상태가 있고 최근에 체크했다면 반환
-        if self._status and now - self._last_check < self._check_interval:
-            return self._status
-
-        # 새로운 상태 체크
-        self._status = await self._check_api_key_status()
-        self._last_check = now
-        return self._status
-
-    async def _check_api_key_status(self) -> ApiKeyStatus:
-        """실제 API 키 상태 체크"""
+        """API 키 상태 조회 (한 번도 확인되지 않았을 때만 직접 조회)"""
+        if self._verified_at is None:
+            await self.probe()
+        return self.status
+
+    def observe(self, resp: httpx.Response) -> None:
+        """서명 요청 응답 리스너 - 상태 코드로 키 유효성 판정"""
+        code = resp.status_code
+        if code in (403, 418, 429) or code >= 500:
+            return  # WAF/레이트리밋/서버 오류는 키 상태와 무관
+        self.observed += 1
+        self._record(self._auth_error(resp) if code >= 400 else None)
+
+    @staticmethod
+    def _auth_error(resp: httpx.Response) -> Optional[str]:
         try:
-            from app.clients.binance_client import BinanceFuturesClient
-
-            if not BINANCE_API_KEY or not BINANCE_SECRET_KEY:
-                return ApiKeyStatus(
-                    is_valid=False,
-                    has_futures_permission=False,
-                    rate_limit_remaining=0,
-                    last_check=datetime.now(),
-                    error_message="API keys not configured",
-                )
-
-            client = BinanceFuturesClient()
-
+            body = resp.json()
+        except ValueError:
+            body = None
+        if not isinstance(body, dict):
+            body = {}
+        code = body.get("code")
+        if code not in _AUTH_ERROR_CODES and resp.status_code != 401:
+            return None  # 인증은 통과한 업무 오류 (증거금 부족 등)
+        return (
+            body.get("msg")
+            or _AUTH_ERROR_CODES.get(code)
+            or "Invalid API key or insufficient permissions"
+        )
+
+    def _record(self, error: Optional[str]) -> None:
+        self._set_status(error, datetime.now())
+        data = self.export()
+        for callback in self._listeners:
             try:
-                # 계좌 정보 조회로 API 키 검증
-                await client.get_account_info()
-
-                # 바이낸스 선물 API는 permissions 필드가 없으므로
-                # 계좌 정보가 정상적으로 조회되면 선물 거래 권한이 있다고 판단
-                has_futures = True
-
-                # Rate limit 정보 추출 (응답 헤더에서)
-                rate_limit_remaining = 1200  # 기본값 (실제로는 응답 헤더에서 추출)
-
-                status = ApiKeyStatus(
-                    is_valid=True,
-                    has_futures_permission=has_futures,
-                    rate_limit_remaining=rate_limit_remaining,
-                    last_check=datetime.now(),
-                )
-
-                self._logger.info(
-                    f"API key status: valid={status.is_valid}, "
-                    f"futures={status.has_futures_permission}, "
-                    f"rate_limit={status.rate_limit_remaining}"
-                )
-
-                return status
-
-            except Exception as api_error:
-                # API 호출 실패 시 더 구체적인 에러 메시지 제공
-                error_msg = str(api_error)
-                if "401" in error_msg:
-                    error_msg = "Invalid API key or insufficient permissions"
-                elif "403" in error_msg:
-                    error_msg = "API key lacks required permissions"
-                elif "429" in error_msg:
-                    error_msg = "Rate limit exceeded"
-
-                return ApiKeyStatus(
+                callback(data)
+            except Exception as e:
+                self._logger.error(f"API key status listener failed: {e}")
+
+    def _set_status(self, error: Optional[str], checked_at: datetime) -> None:
+        previous = self._status
+        self._status = ApiKeyStatus(
+            is_valid=error is None,
+            # 선물 엔드포인트 서명 요청이 통과했으면 선물 권한이 있는 것
+            has_futures_permission=error is None,
+            rate_limit_remaining=self.client.rate_limiter.remaining_weight,
+            last_check=checked_at,
+            error_message=error,
+        )
+        self._verified_at = time.monotonic()
+        if previous is None or previous.is_valid != self._status.is_valid:
+            if error is None:
+                self._logger.info("API key status: valid")
+            else:
+                self._logger.warning(f"API key status: invalid ({error})")
+
+    def export(self) -> Optional[dict[str, Any]]:
+        """마지막 판정 (다른 프로세스로 보낼 JSON 직렬화 가능한 형태)"""
+        if self._status is None or self._verified_at is None:
+            return None
+        return {
+            "errorMessage": self._status.error_message,
+            "lastCheck": self._status.last_check.isoformat(),
+        }
+
+    def apply_remote(self, data: dict[str, Any]) -> None:
+        """fetcher가 판정한 상태 반영 (워커는 직접 확인하지 않음)"""
+        self._set_status(
+            data.get("errorMessage"), datetime.fromisoformat(data["lastCheck"])
+        )
+
+    def add_listener(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        self._listeners.append(callback)
+
+    async def probe(self) -> None:
+        """계좌 조회로 키를 직접 확인 (판정은 응답 리스너가 기록)"""
+        if not self.client.api_key or not self.client.api_secret:
+            self._record("API keys not configured")
+            return
+        self.probes += 1
+        try:
+            # 계좌 스냅샷 조회 (포지션/잔고 캐시도 함께 갱신)
+            await self.account.get_account(bypass=True)
+        except Exception as e:
+            if self._status is None:
+                # 응답을 받지 못함 - 확인된 것으로 치지 않아 다음 호출에서 재조회
+                self._status = ApiKeyStatus(
                     is_valid=False,
                     has_futures_permission=False,
-                    rate_limit_remaining=0,
+                    rate_limit_remaining=self.client.rate_limiter.remaining_weight,
                     last_check=datetime.now(),
-                    error_message=error_msg,
+                    error_message=f"API key check failed: {e}",
                 )
-            finally:
-                await client.close()
-
-        except Exception as e:
-            self._logger.error(f"API key check failed: {str(e)}")
-            return ApiKeyStatus(
-                is_valid=False,
-                has_futures_permission=False,
-                rate_limit_remaining=0,
-                last_check=datetime.now(),
-                error_message=str(e),
-            )
+            self._logger.error(f"API key probe failed: {str(e)}")
+
+    async def _probe_if_idle(self) -> None:
+        idle = (
+            self._verified_at is None
+            or time.monotonic() - self._verified_at >= self.idle_probe_interval
+        )
+        if idle:
+            await self.probe()
+
+    def start(self, idle_probe: bool = True) -> None:
+        """응답 관찰 등록 후 유휴 확인 루프 시작 (첫 주기에 최초 확인)
+
+        워커 프로세스는 `idle_probe=False`로 자기 응답만 관찰하고, 유휴 확인은
+        fetcher가 한 번만 수행해 공유 상태로 받는다.
+        """
+        self.client.add_response_listener(self.observe)
+        if idle_probe:
+            self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+    def stats(self) -> dict[str, Any]:
+        status = self._status
+        return {
+            "valid": status.is_valid if status is not None else None,
+            "observed": self.observed,
+            "probes": self.probes,
+            "lastVerifiedAgeSec": (
+                round(time.monotonic() - self._verified_at, 1)
+                if self._verified_at is not None
+                else None
+            ),
+        }
 
     async def validate_for_trading(self) -> None:
         """거래를 위한 API 키 유효성 검증"""
@@ -143,20 +247,6 @@ class ApiKeyMonitor:
                 f"Rate limit low: {status.rate_limit_remaining} remaining"
             )
 
-    async def start_monitoring(self) -> None:
-        """백그라운드 모니터링 시작"""
-
-        async def monitor_loop():
-            while True:
-                try:
-                    await self.get_api_key_status()
-                    await asyncio.sleep(300)  # 5분마다 체크
-                except Exception as e:
-                    self._logger.error(f"Monitoring error: {str(e)}")
-                    await asyncio.sleep(60)  # 에러 시 1분 후 재시도
-
-        asyncio.create_task(monitor_loop())
-
 
 # 전역 모니터 인스턴스
 api_key_monitor = ApiKeyMonitor()
@@ -0,0 +1,76 @@
+"""Standalone fetcher process for multi-worker mode (WORKER_ROLE=fetcher).
+
+Owns every Binance stream/poller and publishes the resulting state to the
+uvicorn workers over the state bus. It is also the only writer of the trade
+journal and its SQLite index; workers forward their rows over the bus. Run with `python -m app.fetcher`.
+"""
+
+import asyncio
+import logging
+import signal
+
+from app.clients.binance_client import close_shared_client, get_shared_client
+from app.clients.clock_sync import clock_sync
+from app.core.logging import setup_logger, stop_logging
+from app.core.security import api_key_monitor
+from app.services.journal import trade_journal
+from app.services.price_cache import price_cache
+from app.services.shared_state import SharedStatePublisher
+from app.services.symbol_meta import symbol_meta_cache
+from app.services.trade_store import trade_store
+from app.services.user_stream import user_stream
+
+logger = logging.getLogger("app.fetcher")
+
+
+async def run() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    client = get_shared_client()
+    # 거래 저널/색인은 이 프로세스만 기록 (워커 여러 개가 같은 파일에 쓰지 않음)
+    trade_journal.start()
+    trade_journal.add_flush_listener(trade_store.sync_from_csv)
+    store_import = asyncio.create_task(trade_store.sync_from_csv())
+    publisher = SharedStatePublisher()
+    # 워커가 접속하자마자 받을 수 있도록 발행자를 먼저 연다
+    await publisher.start()
+    clock_sync.start(client.sync_time)
+    # API 키 판정/유휴 확인은 이 프로세스만 수행해 워커들에게 공유
+    api_key_monitor.start()
+    symbol_meta_cache.start()
+    price_cache.start()
+    user_stream.start()
+    logger.warning("Fetcher started, publishing shared state")
+
+    try:
+        await stop.wait()
+    finally:
+        await user_stream.stop()
+        await price_cache.stop()
+        await symbol_meta_cache.stop()
+        await clock_sync.stop()
+        await api_key_monitor.stop()
+        await publisher.stop()
+        # 워커가 마지막으로 보낸 기록까지 기록한 뒤 종료
+        await trade_journal.stop()
+        try:
+            await store_import
+        except Exception:
+            pass
+        trade_store.close()
+        await close_shared_client()
+
+
+def main() -> None:
+    setup_logger()
+    try:
+        asyncio.run(run())
+    finally:
+        stop_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,33 @@
+import asyncio
 from contextlib import asynccontextmanager
+from typing import Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.v1.endpoints import health, positions, symbols, trade
-from app.clients.binance_client import BinanceFuturesClient
-from app.core.config import CORS_ORIGIN, get_binance_config
-from app.core.logging import setup_logger
-from app.utils.middleware import access_log_middleware
+from app.api.v1.endpoints import (
+    health,
+    metrics,
+    positions,
+    profiling,
+    symbols,
+    trade,
+    trades,
+)
+from app.clients.binance_client import close_shared_client, get_shared_client
+from app.clients.clock_sync import clock_sync
+from app.core.config import CORS_ORIGIN, WORKER_ROLE
+from app.core.logging import setup_logger, start_logging, stop_logging
+from app.core.security import api_key_monitor
+from app.services.health import health_monitor
+from app.services.journal import trade_journal
+from app.services.position_feed import position_feed
+from app.services.price_cache import price_cache
+from app.services.shared_state import shared_state
+from app.services.symbol_meta import symbol_meta_cache
+from app.services.trade_store import trade_store
+from app.services.user_stream import user_stream
+from app.utils.middleware import AccessLogMiddleware
 
 # 로깅 설정 초기화
 setup_logger()
@@ -16,30 +36,70 @@ setup_logger()
 # intent: minimal FastAPI app with health check and static SPA mount
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 로그 라이터 스레드는 앱 수명과 함께 시작/종료 (재시작 시 다시 기동)
+    start_logging()
     # intent: create a single AsyncClient-bound Binance client for app lifetime
-    binance_config = get_binance_config()
-    app.state.binance_client = BinanceFuturesClient(
-        use_testnet=binance_config["use_testnet"]
-    )
+    # 라우터/서비스/모니터 모두 이 공용 커넥션 풀을 사용
+    app.state.binance_client = get_shared_client()
 
-    # API 키 모니터링 시작
-    from app.core.security import api_key_monitor
+    if WORKER_ROLE == "worker":
+        # 스트림/폴러/시각 동기화는 fetcher 프로세스가 소유 - 워커는 공유 상태만 구독
+        shared_state.start()
+        # 거래 기록은 fetcher에 전달 (저널 파일/색인은 fetcher 단독 기록)
+        trade_journal.forward_to(shared_state.forward_trades)
+    else:
+        # 서버 시각 재동기화 루프 (서명 요청 경로에서 /time 호출 제거)
+        clock_sync.start(app.state.binance_client.sync_time)
+        # 심볼 메타데이터 색인 주기 갱신 (주문마다 exchangeInfo 호출 제거)
+        symbol_meta_cache.start()
+        # 마크프라이스 스트림 구독 (주문마다 premiumIndex 호출 제거)
+        price_cache.start()
+        # 사용자 데이터 스트림 (포지션/잔고를 이벤트로 갱신, 끊기면 REST 재동기화)
+        user_stream.start()
+    # 거래 저널 백그라운드 라이터 (요청 경로에서 디스크 I/O 제거)
+    trade_journal.start()
+    store_import: Optional[asyncio.Task] = None
+    if WORKER_ROLE != "worker":
+        # 거래 이력 색인: 기존 CSV는 백그라운드로 가져오고, 이후 배치마다 증분 색인
+        trade_journal.add_flush_listener(trade_store.sync_from_csv)
+        store_import = asyncio.create_task(trade_store.sync_from_csv())
 
-    await api_key_monitor.start_monitoring()
+    # API 키 모니터: 서명 요청 응답으로 판정, 유휴 시에만 직접 확인 (워커는 fetcher 판정 공유)
+    api_key_monitor.start(idle_probe=WORKER_ROLE != "worker")
+    # 헬스 스냅샷 계산 루프 (헬스 엔드포인트는 스냅샷만 반환)
+    health_monitor.start()
 
     try:
         yield
     finally:
+        await health_monitor.stop()
+        await api_key_monitor.stop()
+        await position_feed.stop()
+        # 큐에 남은 거래 기록을 모두 기록(워커는 fetcher에 전달)한 뒤 종료
+        await trade_journal.stop()
+        await shared_state.stop()
+        await user_stream.stop()
+        await price_cache.stop()
+        if store_import is not None:
+            try:
+                await store_import
+            except Exception:
+                pass
+        trade_store.close()
+        await symbol_meta_cache.stop()
+        await clock_sync.stop()
         try:
-            await app.state.binance_client.close()
+            await close_shared_client()
         except Exception:
             pass
+        # 종료 과정에서 남긴 로그까지 출력한 뒤 라이터 스레드 정리
+        stop_logging()
 
 
 app = FastAPI(title="Futures Remote Microservice", version="0.1.0", lifespan=lifespan)
 
 # 미들웨어 설정
-app.middleware("http")(access_log_middleware)
+app.add_middleware(AccessLogMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[CORS_ORIGIN],
@@ -50,6 +110,9 @@ app.add_middleware(
 
 # API 라우터 등록
 app.include_router(health.router, tags=["health"])
+app.include_router(metrics.router, tags=["metrics"])
 app.include_router(trade.router, prefix="/api", tags=["trade"])
 app.include_router(positions.router, prefix="/api", tags=["positions"])
 app.include_router(symbols.router, prefix="/api", tags=["symbols"])
+app.include_router(trades.router, prefix="/api", tags=["trades"])
+app.include_router(profiling.router, prefix="/api", tags=["profiling"])
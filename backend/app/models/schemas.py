@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -39,6 +39,7 @@ class Position(BaseModel):
     leverage: int
     unRealizedProfit: str
     marginType: str
+    positionSide: str = "BOTH"  # 헤지 모드에서는 LONG/SHORT
 
 
 class Balance(BaseModel):
@@ -63,6 +64,39 @@ class SymbolsResponse(BaseModel):
     symbols: list[Symbol]
 
 
+class SymbolMatch(Symbol):
+    """검색 결과 심볼 (거래량 정렬 시 24시간 quote 거래량 포함)"""
+
+    quoteVolume: Optional[str] = None
+
+
+class SymbolSearchResponse(BaseModel):
+    query: str
+    results: list[SymbolMatch]
+
+
+class TradeRecord(BaseModel):
+    id: int
+    timestamp: str
+    symbol: str
+    side: str
+    quantity: str
+    price: str
+    leverage: str
+    order_id: str
+    status: str
+    binance_status: str
+    order_type: str
+    trade_result: str
+    error_message: str
+    user: str
+
+
+class TradesResponse(BaseModel):
+    trades: list[TradeRecord]
+    nextCursor: Optional[str] = None
+
+
 class ErrorResponse(BaseModel):
     requestId: str
     code: str
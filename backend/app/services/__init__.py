@@ -1,4 +1,5 @@
 # Business logic services package
 
+from .account import account_snapshot
 from .balance import balance_service
 from .position import position_service
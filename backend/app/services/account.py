@@ -0,0 +1,136 @@
+"""Account snapshot service: one /fapi/v2/account call feeds every account view."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any, Optional
+
+from app.clients.binance_client import BinanceFuturesClient, get_shared_client
+from app.core.config import POSITION_CACHE_TTL
+from app.models.schemas import Balance, Position
+from app.services.leverage import leverage_manager
+from app.utils.cache import SWRCache
+
+logger = logging.getLogger(__name__)
+
+AccountListener = Callable[[dict[str, Any]], None]
+
+_ACCOUNT_KEY = "account"
+
+
+def parse_positions(data: Any) -> list[Position]:
+    """positionRisk/account.positions 행에서 수량이 있는 포지션만 파싱"""
+    results: list[Position] = []
+    for position_data in data if isinstance(data, list) else []:
+        try:
+            # 포지션 수량 확인
+            position_amt = float(position_data.get("positionAmt", "0"))
+            if position_amt == 0.0:
+                continue  # 포지션이 없는 경우 스킵
+
+            # 포지션 정보 생성
+            position = Position(
+                symbol=position_data.get("symbol", ""),
+                positionAmt=position_data.get("positionAmt", "0"),
+                entryPrice=position_data.get("entryPrice", "0"),
+                leverage=int(position_data.get("leverage", 0) or 0),
+                # account.positions는 unrealizedProfit/isolated 필드를 사용
+                unRealizedProfit=position_data.get(
+                    "unRealizedProfit", position_data.get("unrealizedProfit", "0")
+                ),
+                marginType=str(
+                    position_data.get("marginType")
+                    or ("isolated" if position_data.get("isolated") else "cross")
+                ).lower(),
+                positionSide=position_data.get("positionSide") or "BOTH",
+            )
+            results.append(position)
+
+        except (ValueError, TypeError) as e:
+            # 개별 포지션 파싱 실패 시 로그만 남기고 계속 진행
+            logger.warning(f"Failed to parse position data: {e}")
+            continue
+    return results
+
+
+def parse_balances(data: Any) -> list[Balance]:
+    """balance/account.assets 행을 잔고 모델로 파싱"""
+    results: list[Balance] = []
+    for balance_data in data if isinstance(data, list) else []:
+        try:
+            # 잔고 정보 생성 (account.assets는 balance 대신 walletBalance 사용)
+            balance = Balance(
+                accountAlias=balance_data.get("accountAlias", ""),
+                asset=balance_data.get("asset", ""),
+                balance=balance_data.get(
+                    "balance", balance_data.get("walletBalance", "0")
+                ),
+                crossWalletBalance=balance_data.get("crossWalletBalance", "0"),
+                crossUnPnl=balance_data.get("crossUnPnl", "0"),
+                availableBalance=balance_data.get("availableBalance", "0"),
+                maxWithdrawAmount=balance_data.get("maxWithdrawAmount", "0"),
+            )
+            results.append(balance)
+
+        except (ValueError, TypeError) as e:
+            # 개별 잔고 파싱 실패 시 로그만 남기고 계속 진행
+            logger.warning(f"Failed to parse balance data: {e}")
+            continue
+    return results
+
+
+class AccountSnapshotService:
+    """계좌 스냅샷 조회 서비스.
+
+    `/fapi/v2/account` 응답에는 포지션(`positions`)과 자산(`assets`)이 모두
+    들어 있으므로, 한 번 조회해 등록된 리스너(포지션/잔고 캐시, API 키 상태)에
+    모두 전달한다. 동시 조회는 하나의 업스트림 호출로 합쳐진다.
+    """
+
+    def __init__(self, client: Optional[BinanceFuturesClient] = None) -> None:
+        self._client = client
+        self.cache: SWRCache[dict[str, Any]] = SWRCache(
+            ttl=POSITION_CACHE_TTL, maxsize=1
+        )
+        self._listeners: list[AccountListener] = []
+        self.fetches = 0
+
+    @property
+    def client(self) -> BinanceFuturesClient:
+        """주입된 클라이언트가 없으면 프로세스 공용 클라이언트 사용"""
+        return self._client or get_shared_client()
+
+    def add_listener(self, callback: AccountListener) -> None:
+        """새 계좌 스냅샷을 받을 때마다 호출할 콜백 등록"""
+        self._listeners.append(callback)
+
+    async def get_account(self, bypass: bool = False) -> dict[str, Any]:
+        """계좌 스냅샷 조회 (bypass 시에도 동시 요청은 합쳐짐)"""
+        return await self.cache.get(
+            _ACCOUNT_KEY, self._fetch_account, bypass=bypass, allow_stale=False
+        )
+
+    async def _fetch_account(self) -> dict[str, Any]:
+        account = await self.client.get_account_info()
+        self.fetches += 1
+        self.apply(account)
+        return account
+
+    def apply(self, account: dict[str, Any]) -> None:
+        """계좌 스냅샷을 레버리지 캐시와 리스너에 반영"""
+        # account.positions에는 포지션이 없는 심볼의 레버리지도 포함
+        leverage_manager.seed(account.get("positions", []))
+        for callback in self._listeners:
+            try:
+                callback(account)
+            except Exception as e:
+                # 한 리스너 실패가 다른 뷰 갱신을 막지 않도록 로그만 남김
+                logger.warning(f"Account snapshot listener failed: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        return {**self.cache.stats(), "fetches": self.fetches}
+
+
+# 싱글톤 인스턴스
+account_snapshot = AccountSnapshotService()
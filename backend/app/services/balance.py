@@ -1,23 +1,51 @@
 """Balance management service for Binance futures trading."""
 
-import time
-from typing import Optional
-
-from app.clients.binance_client import BinanceFuturesClient
-from app.core.config import POSITION_CACHE_TTL
+import logging
+from typing import Any, Optional
+
+from app.core.config import (
+    POSITION_CACHE_MAXSIZE,
+    POSITION_CACHE_STALE_TTL,
+    POSITION_CACHE_TTL,
+)
 from app.models.schemas import Balance
+from app.services.account import (
+    AccountSnapshotService,
+    account_snapshot,
+    parse_balances,
+)
+from app.services.user_stream import UserDataStream, user_stream
+from app.utils.cache import SWRCache
+
+logger = logging.getLogger(__name__)
+
+
+# 계정 전체 잔고 캐시 키 - 자산별 조회도 이 목록에서 필터링
+SNAPSHOT_KEY = "balances_all"
 
 
 class BalanceService:
     """Futures 잔고 관리 서비스"""
 
-    def __init__(self):
-        self._balance_cache = {}
-        self._cache_ttl = POSITION_CACHE_TTL
-
-    def _is_cache_valid(self, timestamp: float) -> bool:
-        """캐시가 유효한지 확인"""
-        return time.time() - timestamp < self._cache_ttl
+    def __init__(
+        self,
+        account: Optional[AccountSnapshotService] = None,
+        stream: Optional[UserDataStream] = None,
+    ):
+        self.cache: SWRCache[list[Balance]] = SWRCache(
+            ttl=POSITION_CACHE_TTL,
+            stale_ttl=POSITION_CACHE_STALE_TTL,
+            maxsize=POSITION_CACHE_MAXSIZE,
+        )
+        # 잔고는 계좌 스냅샷의 assets에서 채움 (포지션과 같은 호출 공유)
+        self.account = account or account_snapshot
+        self.account.add_listener(self._apply_account)
+        # 사용자 데이터 스트림이 살아 있으면 메모리 상태로 즉시 응답
+        self.stream = stream or user_stream
+
+    def _apply_account(self, account: dict[str, Any]) -> None:
+        """계좌 스냅샷 리스너 - 다른 경로의 계좌 조회도 잔고 캐시를 갱신"""
+        self.cache.set(SNAPSHOT_KEY, parse_balances(account.get("assets", [])))
 
     async def get_balances(self, asset: Optional[str] = None) -> list[Balance]:
         """
@@ -29,51 +57,18 @@ class BalanceService:
         Returns:
             잔고 목록
         """
-        # 캐시 키 생성
-        cache_key = f"balances_{asset or 'all'}"
-
-        # 캐시 확인
-        if cache_key in self._balance_cache:
-            cached_data, timestamp = self._balance_cache[cache_key]
-            if self._is_cache_valid(timestamp):
-                return cached_data
-
-        # 바이낸스 API 호출
-        client = BinanceFuturesClient()
-        try:
-            data = await client.get_balance()
-        finally:
-            await client.close()
-
-        # 잔고 데이터 파싱 및 필터링
-        results: list[Balance] = []
-        for balance_data in data if isinstance(data, list) else []:
-            try:
-                # 특정 자산 필터링
-                if asset and balance_data.get("asset") != asset:
-                    continue
-
-                # 잔고 정보 생성
-                balance = Balance(
-                    accountAlias=balance_data.get("accountAlias", ""),
-                    asset=balance_data.get("asset", ""),
-                    balance=balance_data.get("balance", "0"),
-                    crossWalletBalance=balance_data.get("crossWalletBalance", "0"),
-                    crossUnPnl=balance_data.get("crossUnPnl", "0"),
-                    availableBalance=balance_data.get("availableBalance", "0"),
-                    maxWithdrawAmount=balance_data.get("maxWithdrawAmount", "0"),
-                )
-                results.append(balance)
-
-            except (ValueError, TypeError) as e:
-                # 개별 잔고 파싱 실패 시 로그만 남기고 계속 진행
-                print(f"Failed to parse balance data: {e}")
-                continue
-
-        # 캐시 업데이트
-        self._balance_cache[cache_key] = (results, time.time())
-
-        return results
+        if self.stream.is_live:
+            return self.stream.state.balance_list(asset)
+
+        balances = await self.cache.get(SNAPSHOT_KEY, self._fetch_balances)
+        if asset is None:
+            return balances
+        return [balance for balance in balances if balance.asset == asset]
+
+    async def _fetch_balances(self) -> list[Balance]:
+        """계좌 스냅샷 조회 후 자산 목록 파싱"""
+        account = await self.account.get_account(bypass=True)
+        return parse_balances(account.get("assets", []))
 
 
 # 싱글톤 인스턴스
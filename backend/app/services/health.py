@@ -0,0 +1,176 @@
+"""Background-computed health snapshot served in constant time."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Optional
+
+from app.clients.binance_client import BinanceFuturesClient, get_shared_client
+from app.clients.clock_sync import ClockSync, clock_sync
+from app.core.config import (
+    HEALTH_CHECK_INTERVAL,
+    HEALTH_MIN_WEIGHT_HEADROOM,
+    HEALTH_STREAM_MAX_LAG,
+    WORKER_ROLE,
+)
+from app.core.security import ApiKeyMonitor, api_key_monitor
+from app.services.price_cache import PriceCache, price_cache
+from app.services.shared_state import SharedStateSubscriber, shared_state
+from app.services.user_stream import UserDataStream, user_stream
+from app.utils.tasks import PeriodicTask
+
+OK, DEGRADED, ERROR, UNKNOWN = "ok", "degraded", "error", "unknown"
+_SEVERITY = {OK: 0, UNKNOWN: 1, DEGRADED: 1, ERROR: 2}
+
+# 이 오프셋(ms)을 넘으면 서명 요청이 recvWindow에 걸릴 수 있음
+_MAX_CLOCK_OFFSET_MS = 1000
+
+
+def _worst(statuses: list[str]) -> str:
+    worst = max(statuses, key=lambda s: _SEVERITY[s], default=OK)
+    return DEGRADED if worst == UNKNOWN else worst
+
+
+class HealthMonitor:
+    """헬스 상태를 백그라운드에서 계산해 두고 요청에는 스냅샷만 반환.
+
+    업스트림을 직접 호출하지 않고 이미 돌고 있는 루프들의 상태(시각 동기화,
+    스트림 수신 시각, 레이트리밋 헤더, API 키 모니터 결과)만 모아 판정한다.
+    각 구성 요소는 ok/degraded/error/unknown 중 하나이며 전체 상태는 가장
+    나쁜 값이다. 스냅샷 자체가 오래되면(계산 루프 정지) degraded로 보고한다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[BinanceFuturesClient] = None,
+        clock: Optional[ClockSync] = None,
+        keys: Optional[ApiKeyMonitor] = None,
+        prices: Optional[PriceCache] = None,
+        stream: Optional[UserDataStream] = None,
+        shared: Optional[SharedStateSubscriber] = None,
+        interval: float = HEALTH_CHECK_INTERVAL,
+        max_stream_lag: float = HEALTH_STREAM_MAX_LAG,
+        min_weight_headroom: float = HEALTH_MIN_WEIGHT_HEADROOM,
+        role: str = WORKER_ROLE,
+    ) -> None:
+        self._client = client
+        self.clock = clock or clock_sync
+        self.keys = keys or api_key_monitor
+        self.prices = prices or price_cache
+        self.stream = stream or user_stream
+        self.shared = shared or shared_state
+        self.interval = interval
+        self.max_stream_lag = max_stream_lag
+        self.min_weight_headroom = min_weight_headroom
+        self.role = role
+        self._task = PeriodicTask("health-monitor", self._refresh, interval)
+        self._snapshot: dict[str, Any] = {}
+        self._computed_at: Optional[float] = None  # time.monotonic()
+
+    @property
+    def client(self) -> BinanceFuturesClient:
+        """주입된 클라이언트가 없으면 프로세스 공용 클라이언트 사용"""
+        return self._client or get_shared_client()
+
+    def _binance(self) -> dict[str, Any]:
+        # 시각 동기화 루프가 주기마다 /time을 호출하므로 그 성공 여부로 도달성 판단
+        age = self.clock.last_sync_age()
+        reachable = age is not None and age <= self.clock.interval * 2 + 5
+        offset = self.clock.offset_ms
+        if not reachable:
+            status = ERROR
+        elif abs(offset) > _MAX_CLOCK_OFFSET_MS:
+            status = DEGRADED
+        else:
+            status = OK
+        return {
+            "status": status,
+            "reachable": reachable,
+            "tsOffsetMs": offset,
+            "lastSyncAgeSec": round(age, 1) if age is not None else None,
+            "testnet": self.client.use_testnet,
+        }
+
+    def _api_key(self) -> dict[str, Any]:
+        key = self.keys.status
+        if key is None:
+            return {"status": UNKNOWN, "isValid": None, "lastCheck": None}
+        return {
+            "status": OK if key.is_valid else ERROR,
+            "isValid": key.is_valid,
+            "hasFuturesPermission": key.has_futures_permission,
+            "lastCheck": key.last_check.isoformat(),
+            "errorMessage": key.error_message,
+        }
+
+    def _streams(self) -> dict[str, Any]:
+        if self.role == "worker":
+            # 스트림은 fetcher 프로세스 소유 - 공유 상태 연결만 확인
+            connected = self.shared.bus.connected
+            return {"status": OK if connected else DEGRADED, "sharedState": connected}
+        market = self.prices.stream
+        lag = market.lag() if market is not None else None
+        if market is None:
+            status = OK if not self.prices.stream_enabled else UNKNOWN
+        elif not market.connected or lag is None or lag > self.max_stream_lag:
+            status = DEGRADED  # 주문 경로는 REST premiumIndex로 폴백
+        else:
+            status = OK
+        return {
+            "status": status,
+            "markPriceLagSec": round(lag, 3) if lag is not None else None,
+            "markPriceConnected": market.connected if market is not None else False,
+            # 사용자 스트림이 끊기면 포지션/잔고는 REST 캐시 경로로 동작
+            "userStreamLive": self.stream.is_live,
+        }
+
+    def _rate_limit(self) -> dict[str, Any]:
+        limiter = self.client.rate_limiter
+        headroom = limiter.remaining_weight / limiter.weight_limit
+        banned_ms = limiter.metrics()["bannedForMs"]
+        if banned_ms > 0:
+            status = ERROR
+        elif headroom < self.min_weight_headroom:
+            status = DEGRADED
+        else:
+            status = OK
+        return {
+            "status": status,
+            "remainingWeight": limiter.remaining_weight,
+            "headroom": round(headroom, 3),
+            "bannedForMs": banned_ms,
+        }
+
+    async def _refresh(self) -> None:
+        components = {
+            "binance": self._binance(),
+            "apiKey": self._api_key(),
+            "streams": self._streams(),
+            "rateLimit": self._rate_limit(),
+        }
+        self._snapshot = {
+            "status": _worst([c["status"] for c in components.values()]),
+            "checkedAt": time.time(),
+            "components": components,
+        }
+        self._computed_at = time.monotonic()
+
+    def snapshot(self) -> dict[str, Any]:
+        """마지막 스냅샷 + 경과 시간 (계산 없음)"""
+        if self._computed_at is None:
+            return {"status": UNKNOWN, "ageSec": None, "components": {}}
+        age = time.monotonic() - self._computed_at
+        status = self._snapshot["status"]
+        if age > self.interval * 3:
+            status = _worst([status, DEGRADED])  # 계산 루프가 멈춤
+        return {**self._snapshot, "status": status, "ageSec": round(age, 1)}
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+
+# 싱글톤 인스턴스
+health_monitor = HealthMonitor()
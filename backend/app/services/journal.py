@@ -0,0 +1,259 @@
+"""Non-blocking, batched trade journal writer (data/trades.csv)."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import aiofiles
+
+from app.core.config import (
+    TRADE_JOURNAL_BATCH_SIZE,
+    TRADE_JOURNAL_FLUSH_INTERVAL,
+    TRADE_JOURNAL_FSYNC,
+    TRADE_JOURNAL_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+TRADE_FIELDNAMES = [
+    "timestamp",
+    "symbol",
+    "side",
+    "quantity",
+    "price",
+    "leverage",
+    "order_id",
+    "status",
+    "binance_status",
+    "order_type",
+    "trade_result",
+    "error_message",
+    "user",
+]
+
+FSYNC_POLICIES = ("none", "batch", "interval")
+
+
+class TradeJournal:
+    """거래 기록을 메모리 큐에 쌓고 백그라운드에서 묶어서 CSV에 추가하는 저널.
+
+    요청 경로에서는 `record()`가 큐에 넣기만 하므로 이벤트 루프가 디스크 I/O로
+    멈추지 않는다. fsync 정책:
+      - none: OS 버퍼에 맡김 (가장 빠름)
+      - batch: 배치마다 fsync (기본값)
+      - interval: 마지막 fsync 후 `flush_interval` 이상 지났을 때만 fsync
+
+    멀티 워커에서는 fetcher 프로세스만 파일에 쓰고, 워커는 `forward_to`로
+    등록한 전달 함수로 배치를 넘긴다 (전달 실패 시에만 직접 기록).
+    """
+
+    def __init__(
+        self,
+        path: Path = TRADE_JOURNAL_PATH,
+        batch_size: int = TRADE_JOURNAL_BATCH_SIZE,
+        flush_interval: float = TRADE_JOURNAL_FLUSH_INTERVAL,
+        fsync_policy: str = TRADE_JOURNAL_FSYNC,
+    ) -> None:
+        if fsync_policy not in FSYNC_POLICIES:
+            logger.warning(f"Unknown fsync policy {fsync_policy!r}, using 'batch'")
+            fsync_policy = "batch"
+        self.path = Path(path)
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self.fsync_policy = fsync_policy
+        self._queue: asyncio.Queue[dict[str, str]] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._last_fsync = time.monotonic()
+        self._flush_listeners: list[Callable[[], Awaitable[Any]]] = []
+        self._forward: Optional[Callable[[list[dict[str, str]]], Awaitable[Any]]] = None
+        self.rows_written = 0
+        self.rows_forwarded = 0
+        self.batches = 0
+        self.write_errors = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @staticmethod
+    def build_row(
+        trade_data: dict[str, Any],
+        quantity_key: str = "quantity",
+        price_key: str = "price",
+        order_type_key: str = "order_type",
+    ) -> dict[str, str]:
+        """거래 데이터를 CSV 행으로 변환 (응답 키 이름은 호출 측이 지정)"""
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "symbol": trade_data.get("symbol", ""),
+            "side": trade_data.get("side", ""),
+            "quantity": trade_data.get(quantity_key, ""),
+            "price": trade_data.get(price_key, ""),
+            "leverage": trade_data.get("leverage", ""),
+            "order_id": str(trade_data.get("orderId", "")),
+            "status": trade_data.get("status", ""),
+            "binance_status": trade_data.get("status", ""),  # 바이낸스 원본 상태
+            "order_type": trade_data.get(order_type_key, ""),
+            "trade_result": trade_data.get("trade_result", ""),
+            "error_message": trade_data.get("error_message", ""),
+            "user": trade_data.get("user", ""),  # 청산 시에는 user 정보가 없을 수 있음
+        }
+
+    def record(self, trade_data: dict[str, Any], **key_map: str) -> None:
+        """거래 기록 추가 (논블로킹). 라이터 미기동 시에는 즉시 동기 기록"""
+        self.enqueue([self.build_row(trade_data, **key_map)])
+
+    def enqueue(self, rows: list[dict[str, str]]) -> None:
+        """이미 만들어진 행 추가 (워커가 전달한 배치 포함)"""
+        if self.running:
+            for row in rows:
+                self._queue.put_nowait(row)
+            return
+        # lifespan 밖(스크립트 실행 등)에서는 기존처럼 바로 파일에 기록
+        try:
+            self._append_sync(rows)
+        except Exception as e:
+            self.write_errors += 1
+            logger.error(f"Failed to save trade to CSV: {e}")
+
+    def forward_to(
+        self, forward: Callable[[list[dict[str, str]]], Awaitable[Any]]
+    ) -> None:
+        """배치를 파일 대신 전달 함수로 넘김 (멀티 워커의 워커 프로세스)"""
+        self._forward = forward
+
+    def _serialize(self, rows: list[dict[str, str]], with_header: bool) -> str:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=TRADE_FIELDNAMES)
+        if with_header:
+            writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+    def _needs_header(self) -> bool:
+        return not self.path.exists() or self.path.stat().st_size == 0
+
+    def _append_sync(self, rows: list[dict[str, str]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = self._serialize(rows, self._needs_header())
+        with open(self.path, mode="a", newline="", encoding="utf-8") as file:
+            file.write(payload)
+        self.rows_written += len(rows)
+
+    def _should_fsync(self) -> bool:
+        if self.fsync_policy == "batch":
+            return True
+        if self.fsync_policy == "interval":
+            return time.monotonic() - self._last_fsync >= self.flush_interval
+        return False
+
+    async def _write_batch(self, rows: list[dict[str, str]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = self._serialize(rows, self._needs_header())
+        async with aiofiles.open(
+            self.path, mode="a", newline="", encoding="utf-8"
+        ) as file:
+            await file.write(payload)
+            await file.flush()
+            if self._should_fsync():
+                await asyncio.to_thread(os.fsync, file.fileno())
+                self._last_fsync = time.monotonic()
+        self.rows_written += len(rows)
+        self.batches += 1
+        logger.debug(f"Trade journal flushed {len(rows)} rows")
+
+    def _drain(self, rows: list[dict[str, str]]) -> None:
+        while len(rows) < self.batch_size and not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+
+    def add_flush_listener(self, listener: Callable[[], Awaitable[Any]]) -> None:
+        """배치 기록 직후 호출할 콜백 등록 (예: 거래 이력 색인)"""
+        self._flush_listeners.append(listener)
+
+    async def _flush(self, rows: list[dict[str, str]]) -> None:
+        if self._forward is not None:
+            try:
+                await self._forward(rows)
+                self.rows_forwarded += len(rows)
+                self.batches += 1
+                return
+            except Exception as e:
+                # fetcher 재시작 중 - 기록을 잃지 않도록 직접 추가 (fetcher가 색인)
+                logger.warning(f"Trade journal forward failed, writing locally: {e}")
+        try:
+            await self._write_batch(rows)
+        except Exception as e:
+            self.write_errors += 1
+            logger.error(f"Failed to write trade journal batch: {e}")
+            return
+        for listener in self._flush_listeners:
+            try:
+                await listener()
+            except Exception as e:
+                logger.error(f"Trade journal flush listener failed: {e}")
+
+    async def _writer_loop(self) -> None:
+        while True:
+            rows = [await self._queue.get()]
+            try:
+                # 짧게 기다려 동시에 들어온 기록을 한 번에 묶음
+                if self.batch_size > 1 and self.flush_interval > 0:
+                    await asyncio.sleep(min(self.flush_interval, 0.05))
+            except asyncio.CancelledError:
+                self._drain(rows)
+                await self._flush(rows)
+                raise
+            self._drain(rows)
+            # 종료 신호가 와도 진행 중인 배치는 끝까지 기록
+            write = asyncio.ensure_future(self._flush(rows))
+            try:
+                await asyncio.shield(write)
+            except asyncio.CancelledError:
+                await write
+                raise
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._writer_loop(), name="trade-journal")
+
+    async def stop(self) -> None:
+        """라이터 종료 후 큐에 남은 기록을 모두 기록 (graceful shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while not self._queue.empty():
+            rows: list[dict[str, str]] = []
+            self._drain(rows)
+            await self._flush(rows)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "queueDepth": self.queue_depth,
+            "rowsWritten": self.rows_written,
+            "rowsForwarded": self.rows_forwarded,
+            "batches": self.batches,
+            "writeErrors": self.write_errors,
+            "fsyncPolicy": self.fsync_policy,
+        }
+
+
+# 싱글톤 인스턴스 (TradeService/PositionService 공용)
+trade_journal = TradeJournal()
@@ -0,0 +1,128 @@
+"""Per-symbol leverage state cache that skips redundant set_leverage calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from typing import Any, Optional
+
+import httpx
+
+from app.clients.binance_client import BinanceFuturesClient, get_shared_client
+from app.core.config import LEVERAGE_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+# 이미 같은 레버리지일 때 돌아오는 응답 메시지 (성공으로 간주)
+_NOT_MODIFIED_MARKERS = ("not modified", "no need to change")
+
+
+def _is_not_modified(error: httpx.HTTPStatusError) -> bool:
+    try:
+        message = str(error.response.json().get("msg", ""))
+    except ValueError:
+        message = error.response.text
+    return any(marker in message.lower() for marker in _NOT_MODIFIED_MARKERS)
+
+
+class LeverageManager:
+    """심볼별 현재 레버리지 캐시.
+
+    positionRisk/account 응답으로 초기값을 채우고 set_leverage 응답으로
+    갱신한다. 요청 레버리지가 캐시 값과 다를 때만 `POST /fapi/v1/leverage`를
+    호출해 주문 경로에서 서명 왕복 1회를 줄인다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[BinanceFuturesClient] = None,
+        ttl: float = LEVERAGE_CACHE_TTL,
+    ) -> None:
+        self._client = client
+        self._ttl = ttl
+        self._leverage: dict[str, tuple[int, float]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self.skipped = 0
+        self.updated = 0
+
+    @property
+    def client(self) -> BinanceFuturesClient:
+        """주입된 클라이언트가 없으면 프로세스 공용 클라이언트 사용"""
+        return self._client or get_shared_client()
+
+    def get(self, symbol: str) -> Optional[int]:
+        """TTL 내의 캐시된 레버리지 (없거나 만료되면 None)"""
+        entry = self._leverage.get(symbol)
+        if entry is None:
+            return None
+        leverage, updated_at = entry
+        if time.monotonic() - updated_at > self._ttl:
+            return None
+        return leverage
+
+    def record(self, symbol: str, leverage: int) -> None:
+        self._leverage[symbol] = (int(leverage), time.monotonic())
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        if symbol is None:
+            self._leverage.clear()
+        else:
+            self._leverage.pop(symbol, None)
+
+    def seed(self, rows: Iterable[dict[str, Any]]) -> None:
+        """positionRisk 또는 account.positions 항목으로 캐시 채우기"""
+        for row in rows:
+            symbol = row.get("symbol")
+            leverage = row.get("leverage")
+            if not symbol or leverage in (None, ""):
+                continue
+            try:
+                self.record(symbol, int(leverage))
+            except (TypeError, ValueError):
+                continue
+
+    async def ensure(
+        self,
+        symbol: str,
+        leverage: int,
+        client: Optional[BinanceFuturesClient] = None,
+    ) -> bool:
+        """레버리지를 보장하고, 실제로 변경 요청을 보냈으면 True 반환"""
+        if self.get(symbol) == leverage:
+            self.skipped += 1
+            return False
+
+        lock = self._locks.setdefault(symbol, asyncio.Lock())
+        async with lock:
+            # 대기 중 다른 요청이 이미 같은 값으로 설정했을 수 있음
+            if self.get(symbol) == leverage:
+                self.skipped += 1
+                return False
+            try:
+                result = await (client or self.client).set_leverage(
+                    symbol=symbol, leverage=leverage
+                )
+            except httpx.HTTPStatusError as e:
+                if not _is_not_modified(e):
+                    self.invalidate(symbol)
+                    raise
+                logger.info("Leverage already %sx for %s", leverage, symbol)
+                self.record(symbol, leverage)
+                return False
+
+            self.record(symbol, int(result.get("leverage", leverage)))
+            self.updated += 1
+            return True
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "symbols": len(self._leverage),
+            "skipped": self.skipped,
+            "updated": self.updated,
+        }
+
+
+# 싱글톤 인스턴스
+leverage_manager = LeverageManager()
@@ -1,165 +1,252 @@
 """Position management service for Binance futures trading."""
 
-import csv
+import asyncio
 import logging
-import time
-from datetime import datetime
-from pathlib import Path
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from decimal import Decimal
 from typing import Any, Optional
 
-from app.clients.binance_client import BinanceFuturesClient
-from app.core.config import POSITION_CACHE_TTL
+from app.clients.binance_client import BinanceFuturesClient, get_shared_client
+from app.core.config import (
+    POSITION_CACHE_MAXSIZE,
+    POSITION_CACHE_STALE_TTL,
+    POSITION_CACHE_TTL,
+)
 from app.models.schemas import Position
+from app.services.account import (
+    AccountSnapshotService,
+    account_snapshot,
+    parse_positions,
+)
+from app.services.journal import TradeJournal, trade_journal
+from app.services.leverage import leverage_manager
+from app.services.position_versions import PositionVersions
+from app.services.symbol_meta import symbol_meta_cache
+from app.services.user_stream import (
+    UserDataStream,
+    leg_name,
+    position_key,
+    user_stream,
+    with_mark_pnl,
+)
+from app.utils.cache import SWRCache
 
 logger = logging.getLogger(__name__)
 
 
+# 계정 전체 포지션 스냅샷의 캐시 키 - 심볼별 조회도 이 스냅샷에서 필터링
+SNAPSHOT_KEY = "positions_all"
+# 롱폴 대기 중 스트림 상태를 다시 확인하는 주기(초)
+_WAIT_RECHECK = 1.0
+
+
+@dataclass(frozen=True)
+class PositionSnapshot:
+    """계정 전체 활성 포지션 스냅샷 (다리 이름 -> 포지션 색인)
+
+    원웨이 모드의 다리 이름은 심볼, 헤지 모드는 SYMBOL:LONG / SYMBOL:SHORT.
+    """
+
+    by_leg: dict[str, Position] = field(default_factory=dict)
+
+    @classmethod
+    def of(cls, positions: list[Position]) -> "PositionSnapshot":
+        return cls(by_leg={leg_name(position_key(p)): p for p in positions})
+
+    @property
+    def positions(self) -> list[Position]:
+        return list(self.by_leg.values())
+
+    def filter(self, symbol: Optional[str] = None) -> list[Position]:
+        if symbol is None:
+            return self.positions
+        return [p for p in self.by_leg.values() if p.symbol == symbol]
+
+    def marked(
+        self, mark_price: Callable[[str], Optional[Decimal]]
+    ) -> "PositionSnapshot":
+        """미실현 손익을 신선한 마크프라이스 기준으로 바꾼 스냅샷 (스트림 경로와 같은 계산)"""
+        return PositionSnapshot(
+            by_leg={
+                k: with_mark_pnl(p, mark_price(p.symbol))
+                for k, p in self.by_leg.items()
+            }
+        )
+
+    def patched(self, symbol: str, positions: list[Position]) -> "PositionSnapshot":
+        """한 심볼의 포지션만 교체한 새 스냅샷 (나머지 심볼은 그대로 공유)"""
+        by_leg = {k: v for k, v in self.by_leg.items() if v.symbol != symbol}
+        for position in positions:
+            by_leg[leg_name(position_key(position))] = position
+        return PositionSnapshot(by_leg=by_leg)
+
+
 class PositionService:
     """포지션 관리 서비스"""
 
-    def __init__(self):
-        self._position_cache = {}
-        self._cache_ttl = POSITION_CACHE_TTL
-        # CSV 파일 경로 설정
-        self.csv_file_path = Path(__file__).parent.parent.parent / "data" / "trades.csv"
-        self.csv_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-    def _is_cache_valid(self, timestamp: float) -> bool:
-        """캐시가 유효한지 확인"""
-        return time.time() - timestamp < self._cache_ttl
+    def __init__(
+        self,
+        client: Optional[BinanceFuturesClient] = None,
+        journal: Optional[TradeJournal] = None,
+        account: Optional[AccountSnapshotService] = None,
+        stream: Optional[UserDataStream] = None,
+    ):
+        self._client = client
+        # 동시 만료 시 업스트림 호출을 하나로 합치고, 만료 직후에는 오래된 값 반환
+        self.cache: SWRCache[PositionSnapshot] = SWRCache(
+            ttl=POSITION_CACHE_TTL,
+            stale_ttl=POSITION_CACHE_STALE_TTL,
+            maxsize=POSITION_CACHE_MAXSIZE,
+        )
+        # 스냅샷에서 값이 낡은 심볼 - 다음 조회 때 해당 심볼만 다시 가져옴
+        self._dirty: set[str] = set()
+        self.symbol_refreshes = 0
+        self.journal = journal or trade_journal
+        # 전체 스냅샷은 계좌 스냅샷에서 채움 (잔고/API 키 상태와 같은 호출 공유)
+        self.account = account or account_snapshot
+        self.account.add_listener(self._apply_account)
+        # 사용자 데이터 스트림이 살아 있으면 메모리 상태로 즉시 응답
+        self.stream = stream or user_stream
+        self.stream_reads = 0
+        # 스냅샷이 달라질 때마다 올라가는 버전 (델타/롱폴/ETag 기준)
+        self.versions = PositionVersions()
+
+    @property
+    def client(self) -> BinanceFuturesClient:
+        """주입된 클라이언트가 없으면 프로세스 공용 클라이언트 사용"""
+        return self._client or get_shared_client()
 
     def _save_trade_to_csv(self, trade_data: dict[str, Any]) -> None:
-        """거래 데이터를 CSV 파일에 저장"""
-        try:
-            file_exists = self.csv_file_path.exists()
-
-            with open(
-                self.csv_file_path, mode="a", newline="", encoding="utf-8"
-            ) as file:
-                fieldnames = [
-                    "timestamp",
-                    "symbol",
-                    "side",
-                    "quantity",
-                    "price",
-                    "leverage",
-                    "order_id",
-                    "status",
-                    "binance_status",
-                    "order_type",
-                    "trade_result",
-                    "error_message",
-                    "user",
-                ]
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-
-                # 파일이 없으면 헤더 작성
-                if not file_exists:
-                    writer.writeheader()
-
-                # 현재 시간 가져오기
-                timestamp = datetime.now().isoformat()
-
-                # 거래 데이터 준비
-                row = {
-                    "timestamp": timestamp,
-                    "symbol": trade_data.get("symbol", ""),
-                    "side": trade_data.get("side", ""),
-                    "quantity": trade_data.get("quantity", ""),
-                    "price": trade_data.get("price", ""),
-                    "leverage": trade_data.get("leverage", ""),
-                    "order_id": str(trade_data.get("orderId", "")),
-                    "status": trade_data.get("status", ""),
-                    "binance_status": trade_data.get(
-                        "status", ""
-                    ),  # 바이낸스 원본 상태
-                    "order_type": trade_data.get("order_type", ""),
-                    "trade_result": trade_data.get("trade_result", ""),
-                    "error_message": trade_data.get("error_message", ""),
-                    "user": trade_data.get(
-                        "user", ""
-                    ),  # 청산 시에는 user 정보가 없을 수 있음
-                }
-
-                writer.writerow(row)
-                logger.info(
-                    f"Position close data saved to CSV: {trade_data.get('symbol', '')} {trade_data.get('side', '')} - {trade_data.get('trade_result', '')}"
-                )
+        """거래 데이터를 저널 큐에 기록 (디스크 쓰기는 백그라운드에서 수행)"""
+        self.journal.record(trade_data)
 
-        except Exception as e:
-            logger.error(f"Failed to save position close to CSV: {e}")
-            # CSV 저장 실패해도 청산은 계속 진행
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """심볼 지정 시 해당 심볼만 낡음 표시, 미지정 시 스냅샷 전체 폐기"""
+        if symbol is None:
+            self._dirty.clear()
+            self.cache.invalidate()
+        else:
+            self._dirty.add(symbol)
 
     async def get_positions(
-        self, symbol: Optional[str] = None, bypass_cache: bool = False
+        self,
+        symbol: Optional[str] = None,
+        bypass_cache: bool = False,
+        allow_stale: bool = True,
     ) -> list[Position]:
         """
         현재 활성 포지션 정보를 조회합니다.
 
+        전체/심볼별 조회 모두 하나의 계정 스냅샷에서 응답하므로,
+        스냅샷을 한 번 갱신하면 모든 조회 결과가 함께 갱신됩니다.
+
         Args:
             symbol: 특정 심볼의 포지션만 조회 (선택사항)
+            bypass_cache: 캐시를 건너뛰고 업스트림 조회 (동시 요청은 합쳐짐)
+            allow_stale: TTL이 지난 값을 반환하고 백그라운드 갱신 허용 여부
 
         Returns:
             활성 포지션 목록
         """
-        # 캐시 키 생성
-        cache_key = f"positions_{symbol or 'all'}"
-        logger.info(
-            f"Checking cache for key: {cache_key}, bypass_cache: {bypass_cache}"
+        if not bypass_cache and self.stream.is_live:
+            self.stream_reads += 1
+            self.versions.observe(self.stream.state.legs())
+            return self.stream.state.position_list(symbol)
+
+        if not bypass_cache and self._dirty:
+            if symbol in self._dirty and self._snapshot_usable(allow_stale):
+                await self._refresh_symbol(symbol)
+            elif symbol is None or symbol in self._dirty:
+                # 스냅샷을 쓸 수 없거나 전체 조회면 스냅샷 전체를 새로 받음
+                bypass_cache = True
+
+        snapshot = await self.cache.get(
+            SNAPSHOT_KEY,
+            self._fetch_snapshot,
+            bypass=bypass_cache,
+            allow_stale=allow_stale,
         )
+        # 미실현 손익은 스트림 경로와 같이 신선한 마크프라이스 기준
+        snapshot = snapshot.marked(self.stream.prices.fresh_mark_price)
+        self.versions.observe(snapshot.by_leg)
+        return snapshot.filter(symbol)
+
+    async def wait_for_change(self, since: int, timeout: float) -> int:
+        """since 이후 스냅샷이 바뀌거나 timeout이 지날 때까지 대기 (현재 버전 반환)
 
-        # 캐시 우회 옵션이 있으면 캐시를 사용하지 않음
-        if not bypass_cache:
-            # 캐시 확인
-            if cache_key in self._position_cache:
-                cached_data, timestamp = self._position_cache[cache_key]
-                if self._is_cache_valid(timestamp):
-                    logger.info(
-                        f"Returning cached data for {cache_key}, age: {time.time() - timestamp:.1f}s"
-                    )
-                    return cached_data
-                else:
-                    logger.info(
-                        f"Cache expired for {cache_key}, age: {time.time() - timestamp:.1f}s"
-                    )
-
-        # 바이낸스 API 호출
-        client = BinanceFuturesClient()
+        스트림 이벤트는 조회 시점에 관측되므로 짧은 주기로 메모리/캐시를 다시
+        확인하고, 계좌 스냅샷 갱신은 리스너가 관측해 대기자를 바로 깨운다.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            await self.get_positions()
+            remaining = deadline - loop.time()
+            if self.versions.version > since or remaining <= 0:
+                return self.versions.version
+            await self.versions.wait(min(remaining, _WAIT_RECHECK))
+
+    @staticmethod
+    def _snapshot_from_account(account: dict[str, Any]) -> PositionSnapshot:
+        positions = parse_positions(account.get("positions", []))
+        return PositionSnapshot.of(positions)
+
+    def _apply_account(self, account: dict[str, Any]) -> None:
+        """계좌 스냅샷 리스너 - 다른 경로의 계좌 조회도 포지션 캐시를 갱신"""
+        snapshot = self._snapshot_from_account(account)
+        self.cache.set(SNAPSHOT_KEY, snapshot)
+        self.versions.observe(
+            snapshot.marked(self.stream.prices.fresh_mark_price).by_leg
+        )
+
+    async def _fetch_snapshot(self) -> PositionSnapshot:
+        """계좌 스냅샷 조회 후 심볼별 색인"""
+        # 조회 시작 이후에 낡음 표시된 심볼은 이 결과로 해소되지 않음
+        resolved = set(self._dirty)
+        # 동시에 만료된 잔고 조회와 하나의 /fapi/v2/account 호출을 공유
+        account = await self.account.get_account(bypass=True)
+        snapshot = self._snapshot_from_account(account)
+        self._dirty -= resolved
+        logger.info("Fetched %d positions for all symbols", len(snapshot.by_leg))
+        return snapshot
+
+    def _snapshot_usable(self, allow_stale: bool) -> bool:
+        """캐시된 스냅샷이 업스트림 조회 없이 응답 가능한 상태인지"""
+        found = self.cache.peek(SNAPSHOT_KEY)
+        if found is None:
+            return False
+        limit = self.cache.ttl + (self.cache.stale_ttl if allow_stale else 0)
+        return found[1] < limit
+
+    async def _refresh_symbol(self, symbol: str) -> None:
+        """낡음 표시된 심볼 하나만 조회해 캐시된 스냅샷에 반영"""
+        self._dirty.discard(symbol)
         try:
-            data = await client.get_position_risk(symbol=symbol)
-        finally:
-            await client.close()
-
-        # 포지션 데이터 파싱 및 필터링
-        results: list[Position] = []
-        for position_data in data if isinstance(data, list) else []:
-            try:
-                # 포지션 수량 확인
-                position_amt = float(position_data.get("positionAmt", "0"))
-                if position_amt == 0.0:
-                    continue  # 포지션이 없는 경우 스킵
-
-                # 포지션 정보 생성
-                position = Position(
-                    symbol=position_data.get("symbol", ""),
-                    positionAmt=position_data.get("positionAmt", "0"),
-                    entryPrice=position_data.get("entryPrice", "0"),
-                    leverage=int(position_data.get("leverage", 0) or 0),
-                    unRealizedProfit=position_data.get("unRealizedProfit", "0"),
-                    marginType=str(position_data.get("marginType", "cross")).lower(),
-                )
-                results.append(position)
-
-            except (ValueError, TypeError) as e:
-                # 개별 포지션 파싱 실패 시 로그만 남기고 계속 진행
-                print(f"Failed to parse position data: {e}")
-                continue
-
-        # 캐시 업데이트
-        self._position_cache[cache_key] = (results, time.time())
-        logger.info(f"Cache updated for {cache_key} with {len(results)} positions")
-
-        return results
+            data = await self.client.get_position_risk(symbol=symbol)
+        except Exception:
+            self._dirty.add(symbol)
+            raise
+        if isinstance(data, list):
+            leverage_manager.seed(data)
+        self.symbol_refreshes += 1
+
+        # 조회 중 스냅샷이 교체됐을 수 있으므로 최신 스냅샷에 반영
+        found = self.cache.peek(SNAPSHOT_KEY)
+        if found is not None:
+            self.cache.replace(
+                SNAPSHOT_KEY, found[0].patched(symbol, parse_positions(data))
+            )
+        logger.info("Refreshed position snapshot entry for %s", symbol)
+
+    def _format_close_quantity(self, symbol: str, position_amt: str) -> str:
+        """청산 수량을 심볼 stepSize/정밀도에 맞춰 문자열로 변환"""
+        quantity = Decimal(position_amt).copy_abs()
+        meta = symbol_meta_cache.peek(symbol)
+        if meta is None:
+            # 메타 미로드 시 거래소가 준 수량 문자열을 그대로 사용
+            return format(quantity, "f")
+        return format(meta.round_quantity(quantity), "f")
 
     async def close_position(
         self, symbol: str, user: str = "unknown"
@@ -178,7 +265,7 @@ class PositionService:
             RuntimeError: API 호출 실패 시
         """
         # 청산 시도 상태를 CSV에 기록
-        logger.info(f"Starting position close attempt for {symbol} by user {user}")
+        logger.info("Starting position close attempt for %s by user %s", symbol, user)
         attempt_close_data = {
             "symbol": symbol,
             "side": "CLOSE",  # 청산 작업임을 표시
@@ -193,8 +280,8 @@ class PositionService:
         }
         self._save_trade_to_csv(attempt_close_data)
 
-        # 현재 포지션 정보 조회
-        positions = await self.get_positions(symbol)
+        # 현재 포지션 정보 조회 (청산 수량은 오래된 값 사용 금지)
+        positions = await self.get_positions(symbol, allow_stale=False)
 
         if not positions:
             # 청산 실패 상태 기록
@@ -235,12 +322,11 @@ class PositionService:
 
         # 청산 방향 결정 (포지션과 반대 방향)
         side = "SELL" if position_amt > 0 else "BUY"
-        quantity = str(abs(position_amt))
+        quantity = self._format_close_quantity(symbol, position.positionAmt)
 
         # 바이낸스 API 호출하여 청산 주문
-        client = BinanceFuturesClient()
         try:
-            result = await client.place_market_order(
+            result = await self.client.place_market_order(
                 symbol=symbol,
                 side=side,
                 quantity=quantity,
@@ -264,15 +350,9 @@ class PositionService:
             }
             self._save_trade_to_csv(success_close_data)
 
-            # 캐시 무효화 (포지션 정보 갱신 필요)
-            # 특정 심볼과 전체 포지션 캐시 모두 무효화
-            cache_keys_to_delete = [f"positions_{symbol}", "positions_all"]
-            for cache_key in cache_keys_to_delete:
-                if cache_key in self._position_cache:
-                    del self._position_cache[cache_key]
-                    logger.info(
-                        f"Cache invalidated for {cache_key} after position close"
-                    )
+            # 스냅샷에서 청산한 심볼만 낡음 표시 (다른 심볼 캐시는 유지)
+            self.invalidate(symbol)
+            logger.info("Position cache invalidated for %s after close", symbol)
 
             return result
 
@@ -295,8 +375,15 @@ class PositionService:
             raise RuntimeError(
                 f"Failed to close position for {symbol}: {str(e)}"
             ) from e
-        finally:
-            await client.close()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.cache.stats(),
+            "dirtySymbols": len(self._dirty),
+            "symbolRefreshes": self.symbol_refreshes,
+            "streamReads": self.stream_reads,
+            "version": self.versions.version,
+        }
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,173 @@
+"""Shared position/PnL delta feed fanned out to push (SSE) subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+from app.core.config import (
+    POSITION_FEED_HEARTBEAT,
+    POSITION_FEED_INTERVAL,
+    POSITION_FEED_QUEUE_SIZE,
+)
+from app.models.schemas import Position
+from app.services.position import PositionService, position_service
+from app.services.position_versions import PositionVersions
+from app.services.user_stream import leg_name, position_key
+from app.utils.tasks import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+
+def format_sse(event: dict[str, Any]) -> str:
+    """피드 이벤트를 text/event-stream 프레임으로 직렬화"""
+    data = json.dumps(event, separators=(",", ":"))
+    return f"event: {event['type']}\nid: {event['version']}\ndata: {data}\n\n"
+
+
+class FeedSubscriber:
+    """구독자별 유계 큐.
+
+    느린 구독자의 큐가 가득 차면 밀린 델타를 버리고 다음 차례에 전체
+    스냅샷 한 건으로 따라잡게 해, 구독자 수와 무관하게 메모리가 제한된다.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize)
+        self.needs_snapshot = True
+        self.overflows = 0
+
+    def offer(self, event: dict[str, Any]) -> bool:
+        if self.needs_snapshot:
+            return True  # 어차피 다음에 전체 스냅샷을 받음
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.needs_snapshot = True
+            self.overflows += 1
+            return False
+
+
+class PositionFeed:
+    """포지션/PnL 변경분을 모든 구독자에게 나눠 주는 공용 피드.
+
+    구독자가 한 명 이상일 때만 `interval`마다 한 번 `PositionService`를
+    조회하고(스트림 상태 또는 캐시 - 업스트림 비용은 구독자 수와 무관),
+    서비스의 `PositionVersions`가 올린 버전과 변경분을 그대로 발행한다.
+    SSE 이벤트 id와 REST의 `X-Positions-Version`/ETag가 같은 버전이며,
+    미실현 손익도 REST 조회와 같은 값(마크프라이스 기준)이다.
+    """
+
+    def __init__(
+        self,
+        positions: Optional[PositionService] = None,
+        interval: float = POSITION_FEED_INTERVAL,
+        heartbeat: float = POSITION_FEED_HEARTBEAT,
+        queue_size: int = POSITION_FEED_QUEUE_SIZE,
+    ) -> None:
+        self.positions = positions or position_service
+        self.heartbeat = heartbeat
+        self.queue_size = queue_size
+        self._subscribers: set[FeedSubscriber] = set()
+        self._loop = PeriodicTask("position-feed", self._poll, interval)
+        self._ready = asyncio.Event()
+        # 구독자에게 마지막으로 발행한 버전 (0이면 아직 기준 없음)
+        self.version = 0
+        self.published = 0
+        self.dropped = 0
+
+    @property
+    def versions(self) -> PositionVersions:
+        return self.positions.versions
+
+    @staticmethod
+    def _payload(position: Position) -> dict[str, Any]:
+        payload = position.model_dump()
+        # 클라이언트는 이 키로 포지션을 합침 (헤지 모드는 SYMBOL:SIDE, closed와 같은 형식)
+        payload["key"] = leg_name(position_key(position))
+        return payload
+
+    async def _poll(self) -> None:
+        # 조회가 서비스의 버전 추적기에 현재 스냅샷을 관측시킴
+        await self.positions.get_positions()
+        versions = self.versions
+        if versions.version != self.version:
+            delta = versions.changes_since(self.version) if self.version else None
+            self.version = versions.version
+            if delta is None:
+                # 기준 버전이 없으면 델타를 만들 수 없음 - 모두 전체 스냅샷으로 맞춤
+                for subscriber in self._subscribers:
+                    subscriber.needs_snapshot = True
+            else:
+                changed, closed = delta
+                self._publish(
+                    {
+                        "type": "delta",
+                        "version": self.version,
+                        "changed": [self._payload(p) for p in changed],
+                        "closed": closed,
+                    }
+                )
+        self._ready.set()
+
+    def _publish(self, event: dict[str, Any]) -> None:
+        self.published += 1
+        for subscriber in self._subscribers:
+            if not subscriber.offer(event):
+                self.dropped += 1
+
+    def snapshot_event(self) -> dict[str, Any]:
+        versions = self.versions
+        return {
+            "type": "snapshot",
+            "version": versions.version,
+            "positions": [self._payload(p) for p in versions.positions()],
+        }
+
+    async def next_event(self, subscriber: FeedSubscriber) -> dict[str, Any]:
+        """구독자의 다음 이벤트 (처음/밀린 뒤에는 전체 스냅샷)"""
+        if subscriber.needs_snapshot:
+            await self._ready.wait()
+            subscriber.needs_snapshot = False
+            return self.snapshot_event()
+        return await subscriber.queue.get()
+
+    @asynccontextmanager
+    async def subscription(self) -> AsyncIterator[FeedSubscriber]:
+        """구독 등록 - 첫 구독자가 공용 갱신 루프를 시작하고 마지막이 멈춤"""
+        subscriber = FeedSubscriber(self.queue_size)
+        self._subscribers.add(subscriber)
+        self._loop.start()
+        try:
+            yield subscriber
+        finally:
+            self._subscribers.discard(subscriber)
+            if not self._subscribers:
+                await self.stop()
+
+    async def stop(self) -> None:
+        await self._loop.stop()
+        # 다음 구독자는 새로 조회한 스냅샷을 받도록 준비 상태 초기화
+        self._ready.clear()
+        self.version = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "subscribers": len(self._subscribers),
+            "version": self.version,
+            "symbols": len(self.versions.positions()),
+            "published": self.published,
+            "dropped": self.dropped,
+            "running": self._loop.running,
+        }
+
+
+# 싱글톤 인스턴스
+position_feed = PositionFeed()
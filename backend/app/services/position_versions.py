@@ -0,0 +1,73 @@
+"""Monotonic position snapshot versions with per-symbol change tracking."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Mapping
+from typing import Optional
+
+from app.models.schemas import Position
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class PositionVersions:
+    """포지션 스냅샷 버전 추적기.
+
+    관측한 스냅샷이 직전과 다를 때만 버전을 올리고 심볼별 마지막 변경/종료
+    버전을 기록해 `since` 이후 변경분만 계산한다. 버전은 밀리초 시각에서
+    시작해 프로세스 재시작 후에도 단조 증가하므로, 이전 프로세스의 버전을
+    가진 클라이언트는 델타 대신 전체 스냅샷을 받는다.
+    """
+
+    def __init__(self) -> None:
+        self.version = _now_ms()
+        # 이 버전 이전 기준의 델타는 계산할 수 없음 (전체 스냅샷 필요)
+        self.base_version = self.version
+        self._current: dict[str, Position] = {}
+        self._changed_at: dict[str, int] = {}
+        self._closed_at: dict[str, int] = {}
+        self._changed = asyncio.Event()
+
+    def observe(self, positions: Mapping[str, Position]) -> int:
+        """현재 스냅샷 관측 - 달라졌으면 버전을 올리고 대기자를 깨움"""
+        changed = [s for s, p in positions.items() if self._current.get(s) != p]
+        closed = [s for s in self._current if s not in positions]
+        if not changed and not closed:
+            return self.version
+
+        self.version = max(self.version + 1, _now_ms())
+        for symbol in changed:
+            self._changed_at[symbol] = self.version
+            self._closed_at.pop(symbol, None)
+        for symbol in closed:
+            self._closed_at[symbol] = self.version
+            self._changed_at.pop(symbol, None)
+        self._current = dict(positions)
+
+        event, self._changed = self._changed, asyncio.Event()
+        event.set()
+        return self.version
+
+    def positions(self) -> list[Position]:
+        """현재 버전의 포지션 목록"""
+        return list(self._current.values())
+
+    def changes_since(self, since: int) -> Optional[tuple[list[Position], list[str]]]:
+        """since 이후 (변경된 포지션, 종료된 심볼). 계산 불가하면 None"""
+        if since < self.base_version or since > self.version:
+            return None
+        changed = [self._current[s] for s, v in self._changed_at.items() if v > since]
+        closed = [s for s, v in self._closed_at.items() if v > since]
+        return changed, closed
+
+    async def wait(self, timeout: float) -> bool:
+        """다음 버전 변경까지 최대 timeout초 대기 (변경되면 True)"""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+            return True
+        except TimeoutError:
+            return False
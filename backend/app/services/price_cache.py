@@ -0,0 +1,162 @@
+"""In-memory mark price table fed by the markPrice WebSocket stream."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Optional
+
+from app.clients.binance_client import BinanceFuturesClient, get_shared_client
+from app.clients.ws_stream import WebSocketStream
+from app.core.config import MARK_PRICE_MAX_AGE, MARK_PRICE_STREAM_ENABLED
+
+logger = logging.getLogger(__name__)
+
+MARK_PRICE_STREAM = "!markPrice@arr@1s"
+
+
+@dataclass(frozen=True)
+class MarkPrice:
+    """심볼별 마크프라이스/펀딩 정보"""
+
+    symbol: str
+    mark_price: Decimal
+    index_price: Decimal
+    funding_rate: Decimal
+    next_funding_time: int
+    event_time: int
+    received_at: float  # time.monotonic()
+
+    def age(self) -> float:
+        return time.monotonic() - self.received_at
+
+
+class PriceCache:
+    """`!markPrice@arr@1s` 스트림으로 갱신되는 마크프라이스 테이블.
+
+    주문 수량 계산은 테이블 값을 쓰고, 항목이 `max_age`보다 오래됐거나
+    없을 때만 REST `premiumIndex`로 폴백한다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[BinanceFuturesClient] = None,
+        max_age: float = MARK_PRICE_MAX_AGE,
+        stream_enabled: bool = MARK_PRICE_STREAM_ENABLED,
+        stream_url: Optional[str] = None,
+    ) -> None:
+        self._client = client
+        self.max_age = max_age
+        self.stream_enabled = stream_enabled
+        self._stream_url = stream_url
+        self._prices: dict[str, MarkPrice] = {}
+        self._stream: Optional[WebSocketStream] = None
+        self._listeners: list[Callable[[Any], None]] = []
+        self.stream_hits = 0
+        self.rest_fallbacks = 0
+
+    @property
+    def client(self) -> BinanceFuturesClient:
+        """주입된 클라이언트가 없으면 프로세스 공용 클라이언트 사용"""
+        return self._client or get_shared_client()
+
+    @property
+    def stream(self) -> Optional[WebSocketStream]:
+        return self._stream
+
+    def _store(self, data: dict[str, Any]) -> None:
+        symbol = data.get("s") or data.get("symbol")
+        mark = data.get("p") or data.get("markPrice")
+        if not symbol or mark is None:
+            return
+        self._prices[symbol] = MarkPrice(
+            symbol=symbol,
+            mark_price=Decimal(str(mark)),
+            index_price=Decimal(str(data.get("i") or data.get("indexPrice") or "0")),
+            funding_rate=Decimal(
+                str(data.get("r") or data.get("lastFundingRate") or "0")
+            ),
+            next_funding_time=int(data.get("T") or data.get("nextFundingTime") or 0),
+            event_time=int(data.get("E") or data.get("time") or 0),
+            received_at=time.monotonic(),
+        )
+
+    def apply_stream_update(self, payload: Any) -> None:
+        """스트림 메시지(배열 또는 combined stream 래퍼) 반영"""
+        if isinstance(payload, dict) and "data" in payload:
+            payload = payload["data"]
+        events = payload if isinstance(payload, list) else [payload]
+        for event in events:
+            if not isinstance(event, dict):
+                continue
+            try:
+                self._store(event)
+            except (ArithmeticError, ValueError, TypeError) as e:
+                logger.warning(f"Invalid markPrice event: {e}")
+        # 한 리스너의 오류가 다른 리스너와 스트림 수신 루프를 멈추지 않도록 격리
+        for callback in self._listeners:
+            try:
+                callback(events)
+            except Exception as e:
+                logger.error(f"Mark price listener failed: {e}")
+
+    def add_listener(self, callback: Callable[[Any], None]) -> None:
+        """스트림 메시지(이벤트 배열)를 받을 때마다 호출할 콜백 등록"""
+        self._listeners.append(callback)
+
+    def get(self, symbol: str) -> Optional[MarkPrice]:
+        return self._prices.get(symbol)
+
+    def is_fresh(self, entry: Optional[MarkPrice]) -> bool:
+        return entry is not None and entry.age() <= self.max_age
+
+    def fresh_mark_price(self, symbol: str) -> Optional[Decimal]:
+        """신선한 마크프라이스 (없거나 오래됐으면 None, REST 폴백 없음)"""
+        entry = self._prices.get(symbol)
+        return entry.mark_price if self.is_fresh(entry) else None
+
+    async def get_mark_price(self, symbol: str) -> Decimal:
+        """신선한 스트림 값 우선, 오래됐으면 REST premiumIndex로 폴백"""
+        entry = self._prices.get(symbol)
+        if self.is_fresh(entry):
+            self.stream_hits += 1
+            return entry.mark_price
+
+        self.rest_fallbacks += 1
+        data = await self.client.get_mark_price(symbol=symbol)
+        self._store(data)
+        return Decimal(str(data["markPrice"]))
+
+    def start(self) -> None:
+        if not self.stream_enabled:
+            return
+        if self._stream is None:
+            url = (
+                self._stream_url or f"{self.client.ws_base_url}/ws/{MARK_PRICE_STREAM}"
+            )
+            self._stream = WebSocketStream(
+                "mark-price-stream", url, self.apply_stream_update
+            )
+        self._stream.start()
+
+    async def stop(self) -> None:
+        if self._stream is not None:
+            await self._stream.stop()
+
+    def stats(self) -> dict[str, Any]:
+        fresh = sum(1 for entry in self._prices.values() if self.is_fresh(entry))
+        return {
+            "symbols": len(self._prices),
+            "fresh": fresh,
+            "maxAgeSec": self.max_age,
+            "streamHits": self.stream_hits,
+            "restFallbacks": self.rest_fallbacks,
+            "stream": self._stream.stats() if self._stream else None,
+        }
+
+
+# 싱글톤 인스턴스
+price_cache = PriceCache()
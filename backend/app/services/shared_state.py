@@ -0,0 +1,167 @@
+"""Share fetched market/account state from one fetcher to worker processes."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+from app.clients.clock_sync import ClockSync, clock_sync
+from app.clients.state_bus import StateBusClient, StateBusServer
+from app.core.config import STATE_BUS_PATH, STATE_BUS_QUEUE_SIZE
+from app.core.security import ApiKeyMonitor, api_key_monitor
+from app.services.journal import TradeJournal, trade_journal
+from app.services.price_cache import PriceCache, price_cache
+from app.services.symbol_meta import SymbolMetaCache, symbol_meta_cache
+from app.services.user_stream import UserDataStream, user_stream
+from app.utils.tasks import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+TOPIC_MARK_PRICES = "markPrices"
+TOPIC_EXCHANGE_INFO = "exchangeInfo"
+TOPIC_ACCOUNT = "account"
+# 서버 시각 오프셋/API 키 판정 - 워커마다 /time, 유휴 계좌 조회를 반복하지 않음
+TOPIC_CLOCK = "clock"
+TOPIC_API_KEY = "apiKey"
+# 워커 -> fetcher: 거래 기록 배치 (저널 파일/색인은 fetcher만 소유)
+TOPIC_TRADES = "trades"
+
+# 스트림 연결 상태 변화는 이벤트가 없으므로 주기적으로 확인해 발행
+_LIVENESS_INTERVAL = 1.0
+
+
+class SharedStatePublisher:
+    """fetcher 프로세스 측: 업스트림 연결을 소유한 캐시의 변경을 발행.
+
+    마크프라이스는 스트림 메시지마다, exchangeInfo는 색인이 바뀔 때만,
+    계좌 상태는 스냅샷/이벤트 반영 시와 스트림 연결 상태가 바뀔 때, 시각
+    오프셋과 API 키 판정은 측정/판정할 때마다 발행한다.
+    워커가 보낸 거래 기록은 이 프로세스의 저널에 추가한다.
+    """
+
+    def __init__(
+        self,
+        path: str = STATE_BUS_PATH,
+        prices: Optional[PriceCache] = None,
+        meta: Optional[SymbolMetaCache] = None,
+        stream: Optional[UserDataStream] = None,
+        queue_size: int = STATE_BUS_QUEUE_SIZE,
+        journal: Optional[TradeJournal] = None,
+        clock: Optional[ClockSync] = None,
+        api_key: Optional[ApiKeyMonitor] = None,
+    ) -> None:
+        self.prices = prices or price_cache
+        self.meta = meta or symbol_meta_cache
+        self.stream = stream or user_stream
+        self.journal = journal or trade_journal
+        self.clock = clock or clock_sync
+        self.api_key = api_key or api_key_monitor
+        self.bus = StateBusServer(
+            path, queue_size, handlers={TOPIC_TRADES: self.journal.enqueue}
+        )
+        self._liveness = PeriodicTask(
+            "shared-state-liveness", self._check_liveness, _LIVENESS_INTERVAL
+        )
+        self._published_live: Optional[bool] = None
+
+    def _publish_prices(self, events: list[Any]) -> None:
+        self.bus.publish(TOPIC_MARK_PRICES, events)
+
+    def _publish_exchange_info(self, *_: Any) -> None:
+        self.bus.publish(TOPIC_EXCHANGE_INFO, {"symbols": self.meta.raw_symbols})
+
+    def _publish_clock(self, sample: dict[str, Any]) -> None:
+        self.bus.publish(TOPIC_CLOCK, sample)
+
+    def _publish_api_key(self, status: dict[str, Any]) -> None:
+        self.bus.publish(TOPIC_API_KEY, status)
+
+    def _publish_account(self) -> None:
+        live = self.stream.is_live
+        self._published_live = live
+        payload = {**self.stream.state.export(), "live": True} if live else {}
+        self.bus.publish(TOPIC_ACCOUNT, payload or {"live": False})
+
+    async def _check_liveness(self) -> None:
+        if self.stream.is_live != self._published_live:
+            self._publish_account()
+
+    async def start(self) -> None:
+        await self.bus.start()
+        self.prices.add_listener(self._publish_prices)
+        self.meta.add_listener(self._publish_exchange_info)
+        self.stream.state.add_listener(self._publish_account)
+        self.clock.add_listener(self._publish_clock)
+        self.api_key.add_listener(self._publish_api_key)
+        if self.meta.loaded:
+            self._publish_exchange_info()
+        if (sample := self.clock.last_sample()) is not None:
+            self._publish_clock(sample)
+        if (status := self.api_key.export()) is not None:
+            self._publish_api_key(status)
+        self._publish_account()
+        self._liveness.start()
+
+    async def stop(self) -> None:
+        await self._liveness.stop()
+        await self.bus.stop()
+
+    def stats(self) -> dict[str, Any]:
+        return {"role": "fetcher", **self.bus.stats()}
+
+
+class SharedStateSubscriber:
+    """워커 프로세스 측: 공유 상태를 받아 로컬 캐시에 반영.
+
+    연결이 끊긴 동안에는 계좌 상태를 live가 아닌 것으로 돌려 기존 REST
+    경로(SWR 캐시)로 폴백하고, 재접속하면 토픽별 최신 값으로 다시 맞춘다.
+    """
+
+    def __init__(
+        self,
+        path: str = STATE_BUS_PATH,
+        prices: Optional[PriceCache] = None,
+        meta: Optional[SymbolMetaCache] = None,
+        stream: Optional[UserDataStream] = None,
+        clock: Optional[ClockSync] = None,
+        api_key: Optional[ApiKeyMonitor] = None,
+    ) -> None:
+        self.prices = prices or price_cache
+        self.meta = meta or symbol_meta_cache
+        self.stream = stream or user_stream
+        self.clock = clock or clock_sync
+        self.api_key = api_key or api_key_monitor
+        self.bus = StateBusClient(
+            path,
+            {
+                TOPIC_MARK_PRICES: self.prices.apply_stream_update,
+                TOPIC_EXCHANGE_INFO: self.meta.apply_exchange_info,
+                TOPIC_ACCOUNT: self.stream.apply_remote,
+                TOPIC_CLOCK: self.clock.apply_remote,
+                TOPIC_API_KEY: self.api_key.apply_remote,
+            },
+            on_state=self._on_state,
+        )
+
+    def _on_state(self, connected: bool) -> None:
+        if not connected:
+            self.stream.set_remote_live(False)
+            logger.warning("Shared state disconnected, falling back to REST")
+
+    async def forward_trades(self, rows: list[dict[str, str]]) -> None:
+        """저널 배치를 fetcher에 전달 (TradeJournal.forward_to 용)"""
+        if not await self.bus.send(TOPIC_TRADES, rows):
+            raise ConnectionError("state bus disconnected")
+
+    def start(self) -> None:
+        self.bus.start()
+
+    async def stop(self) -> None:
+        await self.bus.stop()
+
+    def stats(self) -> dict[str, Any]:
+        return {"role": "worker", **self.bus.stats()}
+
+
+# 싱글톤 인스턴스 (WORKER_ROLE=worker에서만 시작)
+shared_state = SharedStateSubscriber()
@@ -0,0 +1,70 @@
+"""Pre-built /api/symbols response refreshed with the symbol metadata index."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+from app.models.schemas import Symbol, SymbolsResponse
+from app.services.symbol_meta import SymbolMeta, SymbolMetaCache, symbol_meta_cache
+from app.utils.http_cache import EncodedBody
+
+logger = logging.getLogger(__name__)
+
+
+class SymbolCatalog:
+    """거래 가능한 심볼 목록 응답을 메타데이터가 바뀔 때만 다시 만드는 카탈로그.
+
+    필터링/모델 생성/JSON 직렬화/gzip·brotli 압축을 색인 갱신 시 한 번만 하고,
+    요청 경로는 미리 만든 바이트를 그대로 돌려준다.
+    """
+
+    def __init__(
+        self, meta: Optional[SymbolMetaCache] = None, quote_asset: str = "USDT"
+    ) -> None:
+        self.meta = meta or symbol_meta_cache
+        self.quote_asset = quote_asset
+        self._body: Optional[EncodedBody] = None
+        self.rebuilds = 0
+        self.meta.add_listener(self._on_meta_change)
+
+    def _on_meta_change(self, changed: list[SymbolMeta], removed: list[str]) -> None:
+        self._rebuild()
+
+    def _rebuild(self) -> EncodedBody:
+        response = SymbolsResponse(
+            symbols=[
+                Symbol(
+                    symbol=meta.symbol,
+                    baseAsset=meta.base_asset,
+                    quoteAsset=meta.quote_asset,
+                )
+                for meta in self.meta.loaded_trading_symbols(self.quote_asset)
+            ]
+        )
+        self._body = EncodedBody.build(response.model_dump_json().encode())
+        self.rebuilds += 1
+        logger.info(
+            f"Symbol catalog rebuilt: {len(response.symbols)} symbols, "
+            f"{len(self._body.identity)} bytes"
+        )
+        return self._body
+
+    async def get_body(self) -> EncodedBody:
+        """사전 직렬화된 응답 본문 (메타 미로드 시 최초 1회 로드)"""
+        if self._body is None:
+            await self.meta.ensure_loaded()
+        return self._body or self._rebuild()
+
+    def stats(self) -> dict[str, Any]:
+        body = self._body
+        return {
+            "rebuilds": self.rebuilds,
+            "bytes": len(body.identity) if body else None,
+            "gzipBytes": len(body.gzip) if body else None,
+            "brBytes": len(body.br) if body and body.br is not None else None,
+        }
+
+
+# 싱글톤 인스턴스
+symbol_catalog = SymbolCatalog()
@@ -0,0 +1,205 @@
+"""Indexed symbol metadata cache built from Binance exchangeInfo."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import ROUND_DOWN, Decimal
+from typing import Any, Optional
+
+from app.clients.binance_client import BinanceFuturesClient, get_shared_client
+from app.core.config import SYMBOL_META_REFRESH_INTERVAL
+from app.utils.errors import AppError
+from app.utils.tasks import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+_ZERO = Decimal("0")
+
+SymbolChangeListener = Callable[[list["SymbolMeta"], list[str]], None]
+
+
+@dataclass(frozen=True)
+class SymbolMeta:
+    """주문 수량 계산에 필요한 심볼 필터 (모두 Decimal로 사전 변환)"""
+
+    symbol: str
+    base_asset: str
+    quote_asset: str
+    status: str
+    quantity_precision: int
+    price_precision: int
+    step_size: Decimal
+    min_qty: Decimal
+    max_qty: Decimal
+    market_step_size: Decimal
+    market_min_qty: Decimal
+    market_max_qty: Decimal
+    min_notional: Decimal
+    tick_size: Decimal
+    min_price: Decimal
+    max_price: Decimal
+
+    @property
+    def is_trading(self) -> bool:
+        return self.status == "TRADING"
+
+    def round_quantity(self, quantity: Decimal, market: bool = True) -> Decimal:
+        """stepSize 단위로 내림 후 quantityPrecision 자릿수로 정규화"""
+        step = self.market_step_size if market else self.step_size
+        if step > 0:
+            quantity = (quantity / step).to_integral_value(rounding=ROUND_DOWN) * step
+        quantizer = Decimal(1).scaleb(-self.quantity_precision)
+        return quantity.quantize(quantizer, rounding=ROUND_DOWN)
+
+
+def _dec(value: Any, default: Decimal = _ZERO) -> Decimal:
+    try:
+        return Decimal(str(value)) if value is not None else default
+    except ArithmeticError:
+        return default
+
+
+def parse_symbol_meta(info: dict[str, Any]) -> SymbolMeta:
+    """exchangeInfo의 단일 심볼 항목을 SymbolMeta로 변환"""
+    filters = {f.get("filterType"): f for f in info.get("filters", [])}
+    lot = filters.get("LOT_SIZE", {})
+    # MARKET_LOT_SIZE가 없으면 LOT_SIZE를 그대로 사용
+    market_lot = filters.get("MARKET_LOT_SIZE", lot)
+    price = filters.get("PRICE_FILTER", {})
+    notional = filters.get("MIN_NOTIONAL", {})
+
+    return SymbolMeta(
+        symbol=info.get("symbol", ""),
+        base_asset=info.get("baseAsset", ""),
+        quote_asset=info.get("quoteAsset", ""),
+        status=info.get("status", ""),
+        quantity_precision=int(info.get("quantityPrecision", 0)),
+        price_precision=int(info.get("pricePrecision", 0)),
+        step_size=_dec(lot.get("stepSize")),
+        min_qty=_dec(lot.get("minQty"), Decimal("0.001")),
+        max_qty=_dec(lot.get("maxQty")),
+        market_step_size=_dec(market_lot.get("stepSize")),
+        market_min_qty=_dec(market_lot.get("minQty"), Decimal("0.001")),
+        market_max_qty=_dec(market_lot.get("maxQty")),
+        # 선물 exchangeInfo는 "notional", 현물 호환 응답은 "minNotional" 키 사용
+        min_notional=_dec(notional.get("notional", notional.get("minNotional"))),
+        tick_size=_dec(price.get("tickSize")),
+        min_price=_dec(price.get("minPrice")),
+        max_price=_dec(price.get("maxPrice")),
+    )
+
+
+class SymbolMetaCache:
+    """심볼별로 색인된 exchangeInfo 캐시.
+
+    주문마다 수백 KB의 exchangeInfo를 받아 선형 탐색하던 것을 O(1) 조회로
+    대체한다. 백그라운드 루프가 주기적으로 갱신하며, 아직 로드되지 않은
+    상태에서의 동시 조회는 한 번의 업스트림 호출로 합쳐진다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[BinanceFuturesClient] = None,
+        refresh_interval: float = SYMBOL_META_REFRESH_INTERVAL,
+    ) -> None:
+        self._client = client
+        self._by_symbol: dict[str, SymbolMeta] = {}
+        # 다른 워커 프로세스에 그대로 전달하기 위한 원본 심볼 항목
+        self.raw_symbols: list[dict[str, Any]] = []
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._task = PeriodicTask("symbol-meta-refresh", self.refresh, refresh_interval)
+        self._listeners: list[SymbolChangeListener] = []
+
+    @property
+    def client(self) -> BinanceFuturesClient:
+        """주입된 클라이언트가 없으면 프로세스 공용 클라이언트 사용"""
+        return self._client or get_shared_client()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def age(self) -> Optional[float]:
+        if self._loaded_at is None:
+            return None
+        return time.monotonic() - self._loaded_at
+
+    async def refresh(self) -> None:
+        """exchangeInfo를 다시 받아 색인 전체를 교체"""
+        self.apply_exchange_info(await self.client.get_exchange_info())
+
+    def apply_exchange_info(self, exchange_info: dict[str, Any]) -> None:
+        """exchangeInfo 응답(또는 공유 상태로 받은 사본)으로 색인 교체"""
+        index: dict[str, SymbolMeta] = {}
+        for info in exchange_info.get("symbols", []):
+            try:
+                meta = parse_symbol_meta(info)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Failed to parse symbol info {info.get('symbol')}: {e}")
+                continue
+            index[meta.symbol] = meta
+        # 참조 교체만으로 갱신 - 조회 경로는 락 불필요
+        previous, self._by_symbol = self._by_symbol, index
+        self.raw_symbols = list(exchange_info.get("symbols", []))
+        self._loaded_at = time.monotonic()
+        logger.info(f"Symbol metadata refreshed: {len(index)} symbols")
+
+        changed = [m for s, m in index.items() if previous.get(s) != m]
+        removed = [s for s in previous if s not in index]
+        if changed or removed:
+            for callback in self._listeners:
+                try:
+                    callback(changed, removed)
+                except Exception as e:
+                    logger.warning(f"Symbol metadata listener failed: {e}")
+
+    def add_listener(self, callback: SymbolChangeListener) -> None:
+        """색인이 바뀔 때마다 (변경/추가된 메타, 제거된 심볼)로 호출할 콜백 등록"""
+        self._listeners.append(callback)
+
+    async def ensure_loaded(self) -> None:
+        if self.loaded:
+            return
+        async with self._lock:
+            if not self.loaded:
+                await self.refresh()
+
+    async def get(self, symbol: str) -> SymbolMeta:
+        """심볼 메타 조회 (미로드 시 최초 1회 로드)"""
+        await self.ensure_loaded()
+        meta = self._by_symbol.get(symbol)
+        if meta is None:
+            raise AppError(f"Symbol {symbol} not found.")
+        return meta
+
+    def peek(self, symbol: str) -> Optional[SymbolMeta]:
+        """네트워크 호출 없이 현재 색인에서만 조회"""
+        return self._by_symbol.get(symbol)
+
+    def loaded_trading_symbols(self, quote_asset: str = "USDT") -> list[SymbolMeta]:
+        """현재 색인 기준 TRADING 상태이고 지정한 quote 자산 페어인 심볼 목록"""
+        return [
+            meta
+            for meta in self._by_symbol.values()
+            if meta.is_trading and meta.quote_asset == quote_asset
+        ]
+
+    async def trading_symbols(self, quote_asset: str = "USDT") -> list[SymbolMeta]:
+        """TRADING 상태이고 지정한 quote 자산 페어인 심볼 목록 (미로드 시 로드)"""
+        await self.ensure_loaded()
+        return self.loaded_trading_symbols(quote_asset)
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+
+# 싱글톤 인스턴스
+symbol_meta_cache = SymbolMetaCache()
@@ -0,0 +1,181 @@
+"""Prefix/substring symbol search index with optional volume ranking."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+from decimal import Decimal
+from typing import Any, Optional
+
+from app.clients.binance_client import BinanceFuturesClient, get_shared_client
+from app.core.config import SYMBOL_TICKER_TTL
+from app.models.schemas import SymbolMatch
+from app.services.symbol_meta import SymbolMeta, SymbolMetaCache, symbol_meta_cache
+from app.utils.cache import SWRCache
+
+logger = logging.getLogger(__name__)
+
+_TICKER_KEY = "ticker_24hr"
+
+# 일치 등급 (작을수록 상위)
+_EXACT, _SYMBOL_PREFIX, _BASE_PREFIX, _SUBSTRING = range(4)
+
+
+def _prefix_range(keys: list[tuple[str, str]], prefix: str) -> list[str]:
+    """정렬된 (키, 심볼) 목록에서 키가 prefix로 시작하는 심볼들 (bisect)"""
+    start = bisect.bisect_left(keys, (prefix, ""))
+    matches: list[str] = []
+    for key, symbol in keys[start:]:
+        if not key.startswith(prefix):
+            break
+        matches.append(symbol)
+    return matches
+
+
+class SymbolSearchIndex:
+    """symbol/baseAsset 정렬 배열 기반 심볼 검색 색인.
+
+    접두 검색은 정렬된 키 배열에서 bisect로 범위만 읽고, 접두 일치만으로
+    결과가 부족할 때만 심볼 부분 문자열 검색으로 보충한다. exchangeInfo가
+    바뀌면 메타 캐시 리스너로 변경/제거된 심볼만 배열에서 교체한다.
+    거래량 정렬은 24시간 티커를 SWR 캐시로 보관해 사용한다.
+    """
+
+    def __init__(
+        self,
+        meta: Optional[SymbolMetaCache] = None,
+        client: Optional[BinanceFuturesClient] = None,
+        quote_asset: str = "USDT",
+        ticker_ttl: float = SYMBOL_TICKER_TTL,
+    ) -> None:
+        self.meta = meta or symbol_meta_cache
+        self._client = client
+        self.quote_asset = quote_asset
+        self._entries: dict[str, SymbolMeta] = {}
+        self._symbol_keys: list[tuple[str, str]] = []
+        self._base_keys: list[tuple[str, str]] = []
+        self._built = False
+        self.tickers: SWRCache[dict[str, Decimal]] = SWRCache(
+            ttl=ticker_ttl, stale_ttl=ticker_ttl * 5, maxsize=1
+        )
+        self.meta.add_listener(self._on_meta_change)
+
+    @property
+    def client(self) -> BinanceFuturesClient:
+        """주입된 클라이언트가 없으면 프로세스 공용 클라이언트 사용"""
+        return self._client or get_shared_client()
+
+    def _include(self, meta: SymbolMeta) -> bool:
+        return meta.is_trading and meta.quote_asset == self.quote_asset
+
+    def _add(self, meta: SymbolMeta) -> None:
+        self._entries[meta.symbol] = meta
+        bisect.insort(self._symbol_keys, (meta.symbol.upper(), meta.symbol))
+        bisect.insort(self._base_keys, (meta.base_asset.upper(), meta.symbol))
+
+    def _remove(self, symbol: str) -> None:
+        meta = self._entries.pop(symbol, None)
+        if meta is None:
+            return
+        for keys, key in (
+            (self._symbol_keys, (meta.symbol.upper(), symbol)),
+            (self._base_keys, (meta.base_asset.upper(), symbol)),
+        ):
+            i = bisect.bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+
+    def _on_meta_change(self, changed: list[SymbolMeta], removed: list[str]) -> None:
+        """변경/제거된 심볼만 색인에서 교체 (전체 재구성 없음)"""
+        if not self._built:
+            self._build()
+            return
+        for symbol in removed:
+            self._remove(symbol)
+        for meta in changed:
+            self._remove(meta.symbol)
+            if self._include(meta):
+                self._add(meta)
+        self._built = True
+
+    def _build(self) -> None:
+        self._entries.clear()
+        self._symbol_keys.clear()
+        self._base_keys.clear()
+        for meta in self.meta.loaded_trading_symbols(self.quote_asset):
+            self._add(meta)
+        self._built = True
+
+    async def _fetch_tickers(self) -> dict[str, Decimal]:
+        data = await self.client.get_24hr_ticker()
+        return {
+            row["symbol"]: Decimal(str(row.get("quoteVolume") or "0"))
+            for row in data
+            if isinstance(row, dict) and row.get("symbol")
+        }
+
+    async def _volumes(self) -> Optional[dict[str, Decimal]]:
+        try:
+            return await self.tickers.get(_TICKER_KEY, self._fetch_tickers)
+        except Exception as e:
+            # 티커 조회 실패 시 관련도 순으로 응답
+            logger.warning(f"Ticker fetch failed, falling back to relevance: {e}")
+            return None
+
+    def _match(self, query: str, limit: int) -> dict[str, int]:
+        """심볼 -> 일치 등급"""
+        ranks: dict[str, int] = {}
+        for symbol in _prefix_range(self._symbol_keys, query):
+            ranks[symbol] = _EXACT if symbol == query else _SYMBOL_PREFIX
+        for symbol in _prefix_range(self._base_keys, query):
+            base_exact = self._entries[symbol].base_asset.upper() == query
+            ranks.setdefault(symbol, _EXACT if base_exact else _BASE_PREFIX)
+        # 접두 일치가 limit 이상이면 부분 문자열 일치는 상위 N에 들 수 없음
+        if len(ranks) < limit:
+            for key, symbol in self._symbol_keys:
+                if query in key:
+                    ranks.setdefault(symbol, _SUBSTRING)
+        return ranks
+
+    async def search(
+        self, query: str, limit: int = 10, order: str = "relevance"
+    ) -> list[SymbolMatch]:
+        """등급 순 상위 limit개 (order="volume"이면 같은 등급 안에서 거래량 순)"""
+        if not self._built:
+            await self.meta.ensure_loaded()
+            if not self._built:
+                self._build()
+
+        query = query.strip().upper()
+        if not query:
+            return []
+        ranks = self._match(query, limit)
+
+        volumes = await self._volumes() if order == "volume" else None
+        if volumes is not None:
+            ordered = sorted(
+                ranks, key=lambda s: (ranks[s], -volumes.get(s, Decimal(0)), s)
+            )
+        else:
+            ordered = sorted(ranks, key=lambda s: (ranks[s], len(s), s))
+
+        results: list[SymbolMatch] = []
+        for symbol in ordered[:limit]:
+            meta = self._entries[symbol]
+            volume = volumes.get(symbol) if volumes is not None else None
+            results.append(
+                SymbolMatch(
+                    symbol=meta.symbol,
+                    baseAsset=meta.base_asset,
+                    quoteAsset=meta.quote_asset,
+                    quoteVolume=format(volume, "f") if volume is not None else None,
+                )
+            )
+        return results
+
+    def stats(self) -> dict[str, Any]:
+        return {"symbols": len(self._entries), "tickers": self.tickers.stats()}
+
+
+# 싱글톤 인스턴스
+symbol_search = SymbolSearchIndex()
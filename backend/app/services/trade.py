@@ -1,99 +1,158 @@
 # backend/app/services/trade.py
 
-import csv
+import asyncio
 import logging
-from datetime import datetime
-from decimal import ROUND_DOWN, Decimal
-from pathlib import Path
-from typing import Any
+import time
+from collections.abc import Awaitable
+from decimal import Decimal
+from typing import Any, Optional, TypeVar
 
 from app.clients.binance_client import BinanceFuturesClient
+from app.core.config import PRE_TRADE_TIMEOUT
 from app.models.schemas import TradeRequest
+from app.services.journal import TradeJournal, trade_journal
+from app.services.leverage import LeverageManager, leverage_manager
+from app.services.price_cache import PriceCache, price_cache
+from app.services.symbol_meta import SymbolMeta, SymbolMetaCache, symbol_meta_cache
 from app.utils.errors import AppError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class TradeService:
-    def __init__(self, binance_client: BinanceFuturesClient):
+    def __init__(
+        self,
+        binance_client: BinanceFuturesClient,
+        symbol_meta: Optional[SymbolMetaCache] = None,
+        prices: Optional[PriceCache] = None,
+        leverage: Optional[LeverageManager] = None,
+        journal: Optional[TradeJournal] = None,
+    ):
         self.client = binance_client
-        # CSV 파일 경로 설정
-        self.csv_file_path = Path(__file__).parent.parent.parent / "data" / "trades.csv"
-        self.csv_file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.symbol_meta = symbol_meta or symbol_meta_cache
+        self.prices = prices or price_cache
+        self.leverage = leverage or leverage_manager
+        self.pre_trade_timeout = PRE_TRADE_TIMEOUT
+        # 단계별 소요 시간(ms) - 클릭→주문접수 임계 경로 분석용
+        self.timings: dict[str, float] = {}
+        self.journal = journal or trade_journal
 
     def _save_trade_to_csv(self, trade_data: dict[str, Any]) -> None:
-        """거래 데이터를 CSV 파일에 저장"""
+        """거래 데이터를 저널 큐에 기록 (디스크 쓰기는 백그라운드에서 수행)"""
+        # 주문 응답은 origQty/avgPrice/type 키를 사용
+        self.journal.record(
+            trade_data,
+            quantity_key="origQty",
+            price_key="avgPrice",
+            order_type_key="type",
+        )
+
+    async def _get_symbol_info(self, symbol: str) -> SymbolMeta:
+        """Looks up cached, pre-parsed filters for a specific symbol."""
+        return await self.symbol_meta.get(symbol)
+
+    async def _timed(self, step: str, awaitable: Awaitable[T]) -> T:
+        """단계 실행 시간을 self.timings에 기록"""
+        started = time.perf_counter()
         try:
-            file_exists = self.csv_file_path.exists()
-
-            with open(
-                self.csv_file_path, mode="a", newline="", encoding="utf-8"
-            ) as file:
-                fieldnames = [
-                    "timestamp",
-                    "symbol",
-                    "side",
-                    "quantity",
-                    "price",
-                    "leverage",
-                    "order_id",
-                    "status",
-                    "binance_status",
-                    "order_type",
-                    "trade_result",
-                    "error_message",
-                    "user",
-                ]
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-
-                # 파일이 없으면 헤더 작성
-                if not file_exists:
-                    writer.writeheader()
-
-                # 현재 시간 가져오기
-                timestamp = datetime.now().isoformat()
-
-                # 거래 데이터 준비
-                row = {
-                    "timestamp": timestamp,
-                    "symbol": trade_data.get("symbol", ""),
-                    "side": trade_data.get("side", ""),
-                    "quantity": trade_data.get("origQty", ""),
-                    "price": trade_data.get("avgPrice", ""),
-                    "leverage": trade_data.get("leverage", ""),
-                    "order_id": str(trade_data.get("orderId", "")),
-                    "status": trade_data.get("status", ""),
-                    "binance_status": trade_data.get(
-                        "status", ""
-                    ),  # 바이낸스 원본 상태
-                    "order_type": trade_data.get("type", ""),
-                    "trade_result": trade_data.get("trade_result", ""),
-                    "error_message": trade_data.get("error_message", ""),
-                    "user": trade_data.get("user", ""),
-                }
+            return await awaitable
+        finally:
+            self.timings[step] = round((time.perf_counter() - started) * 1000, 1)
+
+    def _order_quantity(
+        self, symbol_info: SymbolMeta, mark_price: Decimal, size: float
+    ) -> str:
+        """USDT 주문 금액을 stepSize/정밀도에 맞춘 수량 문자열로 변환 (검증 포함)"""
+        quantity_precision = symbol_info.quantity_precision
+        min_qty = symbol_info.market_min_qty
+
+        if mark_price <= 0:
+            raise AppError("Invalid mark price.")
+
+        # 3. Calculate quantity from USDT size
+        size_in_usdt = Decimal(str(size))
+        quantity = size_in_usdt / mark_price
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Order sizing - quantity_precision: {quantity_precision}, "
+                f"min_qty: {min_qty}, mark_price: {mark_price}, "
+                f"size_usdt: {size_in_usdt}, quantity: {quantity}"
+            )
 
-                writer.writerow(row)
-                logger.info(
-                    f"Trade data saved to CSV: {trade_data.get('symbol', '')} {trade_data.get('side', '')}"
-                )
+        # 4. Check minimum quantity and adjust if needed
+        if quantity < min_qty:
+            logger.warning(
+                f"Calculated quantity {quantity} is less than minimum {min_qty}, adjusting to minimum"
+            )
+            quantity = min_qty
+            # Recalculate size based on minimum quantity
+            adjusted_size = quantity * mark_price
+            logger.info(
+                f"Adjusted quantity to {quantity}, size changed from {size_in_usdt} to {adjusted_size}"
+            )
 
-        except Exception as e:
-            logger.error(f"Failed to save trade to CSV: {e}")
-            # CSV 저장 실패해도 거래는 계속 진행
+        # 5. Format quantity based on stepSize and precision
+        formatted_quantity = str(symbol_info.round_quantity(quantity))
+        logger.info("Final formatted quantity: %s", formatted_quantity)
 
-    async def _get_symbol_info(self, symbol: str) -> dict[str, Any]:
-        """Fetches exchange information for a specific symbol."""
-        exchange_info = await self.client.get_exchange_info()
-        for s in exchange_info.get("symbols", []):
-            if s.get("symbol") == symbol:
-                return s
-        raise AppError(f"Symbol {symbol} not found.")
+        if Decimal(formatted_quantity) <= 0:
+            logger.error(
+                f"Quantity calculation resulted in zero or negative: {formatted_quantity}"
+            )
+            logger.error(
+                f"Debug info - size: {size_in_usdt}, mark_price: {mark_price}, precision: {quantity_precision}, min_qty: {min_qty}"
+            )
+            raise AppError(
+                f"Calculated quantity is zero or negative: {formatted_quantity}"
+            )
+        return formatted_quantity
+
+    async def _run_pre_trade(self, order_data: TradeRequest) -> str:
+        """Runs the pre-trade steps under one deadline and returns the quantity.
+
+        Symbol info and mark price are fetched concurrently; if either fails the
+        TaskGroup cancels the other and the first error is re-raised. Leverage is
+        only changed after the quantity has been validated, so a rejected order
+        never modifies the account's leverage.
+        """
+        symbol = order_data.symbol
+        try:
+            async with asyncio.timeout(self.pre_trade_timeout):
+                async with asyncio.TaskGroup() as tg:
+                    meta_task = tg.create_task(
+                        self._timed("symbol_info", self._get_symbol_info(symbol))
+                    )
+                    price_task = tg.create_task(
+                        self._timed("mark_price", self.prices.get_mark_price(symbol))
+                    )
+                quantity = self._order_quantity(
+                    meta_task.result(), price_task.result(), order_data.size
+                )
+                await self._timed(
+                    "leverage",
+                    self.leverage.ensure(
+                        symbol, order_data.leverage, client=self.client
+                    ),
+                )
+        except TimeoutError as e:
+            raise AppError(
+                f"Pre-trade steps exceeded {self.pre_trade_timeout}s deadline"
+            ) from e
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+        return quantity
 
     async def place_order(self, order_data: TradeRequest) -> dict[str, Any]:
         """Places a market order on Binance Futures."""
         try:
             logger.info(
-                f"Starting order placement for {order_data.symbol}, side: {order_data.side}, size: {order_data.size}, leverage: {order_data.leverage}"
+                "Starting order placement for %s, side: %s, size: %s, leverage: %s",
+                order_data.symbol,
+                order_data.side,
+                order_data.size,
+                order_data.leverage,
             )
 
             # 거래 시도 상태를 CSV에 기록
@@ -111,75 +170,27 @@ class TradeService:
             }
             self._save_trade_to_csv(attempt_trade_data)
 
-            # 1. Get symbol info (for quantity precision and min order size)
-            symbol_info = await self._get_symbol_info(order_data.symbol)
-            quantity_precision = int(symbol_info.get("quantityPrecision", 0))
-
-            # Get minimum quantity from LOT_SIZE filter
-            filters = symbol_info.get("filters", [])
-            min_qty = Decimal("0.001")  # default
-            for f in filters:
-                if f.get("filterType") == "LOT_SIZE":
-                    min_qty = Decimal(f.get("minQty", "0.001"))
-                    break
+            # 1-5. Symbol info/mark price (concurrent) -> quantity -> leverage
+            started = time.perf_counter()
+            formatted_quantity = await self._run_pre_trade(order_data)
+            self.timings["pre_trade"] = round((time.perf_counter() - started) * 1000, 1)
 
-            logger.debug(
-                f"Symbol info - quantity_precision: {quantity_precision}, min_qty: {min_qty}"
+            # 6. Place market order
+            order_result = await self._timed(
+                "order",
+                self.client.place_market_order(
+                    symbol=order_data.symbol,
+                    side=order_data.side.value.upper(),
+                    quantity=formatted_quantity,
+                ),
             )
-
-            # 2. Get mark price
-            mark_price_data = await self.client.get_mark_price(symbol=order_data.symbol)
-            mark_price = Decimal(mark_price_data["markPrice"])
-            logger.debug(f"Mark price: {mark_price}")
-            if mark_price <= 0:
-                raise AppError("Invalid mark price.")
-
-            # 3. Calculate quantity from USDT size
-            size_in_usdt = Decimal(str(order_data.size))
-            logger.debug(f"Size in USDT: {size_in_usdt}")
-            quantity = size_in_usdt / mark_price
-            logger.debug(f"Calculated quantity: {quantity}")
-
-            # 4. Check minimum quantity and adjust if needed
-            if quantity < min_qty:
-                logger.warning(
-                    f"Calculated quantity {quantity} is less than minimum {min_qty}, adjusting to minimum"
-                )
-                quantity = min_qty
-                # Recalculate size based on minimum quantity
-                adjusted_size = quantity * mark_price
+            self.timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    f"Adjusted quantity to {quantity}, size changed from {size_in_usdt} to {adjusted_size}"
+                    f"Order timings symbol={order_data.symbol} "
+                    + " ".join(f"{k}={v}ms" for k, v in self.timings.items())
                 )
 
-            # 5. Format quantity based on precision
-            quantizer = Decimal("1e-" + str(quantity_precision))
-            formatted_quantity = str(quantity.quantize(quantizer, rounding=ROUND_DOWN))
-            logger.info(f"Final formatted quantity: {formatted_quantity}")
-
-            if Decimal(formatted_quantity) <= 0:
-                logger.error(
-                    f"Quantity calculation resulted in zero or negative: {formatted_quantity}"
-                )
-                logger.error(
-                    f"Debug info - size: {size_in_usdt}, mark_price: {mark_price}, precision: {quantity_precision}, min_qty: {min_qty}"
-                )
-                raise AppError(
-                    f"Calculated quantity is zero or negative: {formatted_quantity}"
-                )
-
-            # 5. Set leverage
-            await self.client.set_leverage(
-                symbol=order_data.symbol, leverage=order_data.leverage
-            )
-
-            # 6. Place market order
-            order_result = await self.client.place_market_order(
-                symbol=order_data.symbol,
-                side=order_data.side.value.upper(),
-                quantity=formatted_quantity,
-            )
-
             # 7. Save trade data to CSV
             trade_csv_data = {
                 **order_result,  # 바이낸스 API 응답 데이터 포함 (먼저 추가해서 덮어쓰기 방지)
@@ -0,0 +1,254 @@
+"""Indexed SQLite (WAL) trade history store built from the CSV journal."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from app.core.config import TRADE_JOURNAL_PATH, TRADE_STORE_PATH
+from app.services.journal import TRADE_FIELDNAMES
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    symbol TEXT,
+    side TEXT,
+    quantity TEXT,
+    price TEXT,
+    leverage TEXT,
+    order_id TEXT,
+    status TEXT,
+    binance_status TEXT,
+    order_type TEXT,
+    trade_result TEXT,
+    error_message TEXT,
+    user TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_trades_user ON trades (user, id);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades (symbol, id);
+CREATE INDEX IF NOT EXISTS idx_trades_result ON trades (trade_result, id);
+CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades (timestamp);
+CREATE INDEX IF NOT EXISTS idx_trades_order_id ON trades (order_id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_INSERT = (
+    f"INSERT INTO trades ({', '.join(TRADE_FIELDNAMES)}) "
+    f"VALUES ({', '.join('?' for _ in TRADE_FIELDNAMES)})"
+)
+
+# CSV 중 어디까지 색인했는지 기록하는 meta 키 (바이트 오프셋)
+_OFFSET_KEY = "csv_offset"
+
+MAX_PAGE_SIZE = 500
+
+
+def normalize_timestamp(value: str) -> str:
+    """ISO-8601 범위 값을 저널 timestamp 형식(로컬 시각, 타임존 없음)으로 변환
+
+    저널은 `datetime.now().isoformat()`을 기록하므로 문자열 비교가 시간 순서와
+    같아지도록 날짜만 있는 값/`Z`/오프셋이 붙은 값을 같은 형식으로 맞춘다.
+    형식이 잘못되면 ValueError.
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.isoformat()
+
+
+def _complete_records(chunk: bytes) -> tuple[list[list[str]], int]:
+    """끝까지 기록된 CSV 레코드들과 마지막 완전한 레코드의 끝 바이트 위치
+
+    error_message 같은 따옴표 필드에는 줄바꿈이 들어갈 수 있으므로 줄 단위가
+    아니라 레코드 단위로 자른다. 레코드는 줄바꿈으로 끝나고 따옴표 짝이 맞을
+    때만 완전한 것으로 보며, 기록 중인 나머지는 다음 동기화에서 다시 읽는다.
+    """
+    consumed = 0
+
+    def lines() -> Iterator[str]:
+        nonlocal consumed
+        for line in io.BytesIO(chunk):
+            consumed += len(line)
+            yield line.decode("utf-8")
+
+    records: list[list[str]] = []
+    end = 0
+    for values in csv.reader(lines()):
+        raw = chunk[end:consumed]
+        if not raw.endswith(b"\n") or raw.count(b'"') % 2:
+            break
+        records.append(values)
+        end = consumed
+    return records, end
+
+
+class TradeStore:
+    """CSV 저널을 증분 색인하는 SQLite 거래 이력 저장소.
+
+    CSV는 계속 원본(append-only)으로 남기고, 저장소는 마지막으로 읽은 바이트
+    오프셋부터 새 행만 읽어 색인한다. 시작 시 기존 CSV 가져오기와 저널 배치
+    이후의 실시간 색인이 같은 경로(`sync_from_csv`)를 쓰므로 중복 삽입이 없다.
+    조회는 id 내림차순 커서 페이지네이션이라 수백만 행에서도 인덱스 범위만 읽는다.
+    """
+
+    def __init__(
+        self, path: Path = TRADE_STORE_PATH, csv_path: Path = TRADE_JOURNAL_PATH
+    ) -> None:
+        self.path = Path(path)
+        self.csv_path = Path(csv_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        # sqlite 연결은 to_thread 워커들이 공유 - 직렬화 필요
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _get_offset(self, conn: sqlite3.Connection) -> int:
+        row = conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (_OFFSET_KEY,)
+        ).fetchone()
+        return int(row["value"]) if row else 0
+
+    def _sync_from_csv(self) -> int:
+        if not self.csv_path.exists():
+            return 0
+        with self._lock:
+            conn = self._connect()
+            offset = self._get_offset(conn)
+            size = self.csv_path.stat().st_size
+            if size < offset:
+                # CSV가 교체/절삭됨 - 처음부터 다시 색인
+                logger.warning("Trade journal shrank, rebuilding trade store index")
+                conn.execute("DELETE FROM trades")
+                offset = 0
+            if size == offset:
+                return 0
+
+            with open(self.csv_path, "rb") as file:
+                file.seek(offset)
+                chunk = file.read(size - offset)
+            records, consumed = _complete_records(chunk)
+            if offset == 0:
+                if not records:
+                    return 0  # 헤더도 아직 다 기록되지 않음
+                fieldnames, records = records[0], records[1:]
+            else:
+                fieldnames = TRADE_FIELDNAMES
+            rows = []
+            for values in records:
+                record = dict(zip(fieldnames, values, strict=False))
+                if record.get("timestamp"):
+                    rows.append(
+                        tuple(record.get(field) or "" for field in TRADE_FIELDNAMES)
+                    )
+            with conn:
+                conn.executemany(_INSERT, rows)
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    (_OFFSET_KEY, str(offset + consumed)),
+                )
+            return len(rows)
+
+    async def sync_from_csv(self) -> int:
+        """CSV에서 아직 색인되지 않은 행을 가져와 삽입 (삽입 건수 반환)"""
+        inserted = await asyncio.to_thread(self._sync_from_csv)
+        if inserted:
+            logger.debug(f"Trade store indexed {inserted} rows")
+        return inserted
+
+    def _query(
+        self,
+        user: Optional[str],
+        symbol: Optional[str],
+        result: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+        cursor: Optional[int],
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("user", user),
+            ("symbol", symbol),
+            ("trade_result", result),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if start:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end:
+            clauses.append("timestamp < ?")
+            params.append(end)
+        if cursor is not None:
+            clauses.append("id < ?")
+            params.append(cursor)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT * FROM trades {where} ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    async def query(
+        self,
+        user: Optional[str] = None,
+        symbol: Optional[str] = None,
+        result: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        cursor: Optional[int] = None,
+        limit: int = 100,
+    ) -> tuple[list[dict[str, Any]], Optional[int]]:
+        """필터 + 커서 페이지네이션 조회. (행 목록, 다음 커서) 반환
+
+        start/end는 ISO-8601 문자열로, 저널 timestamp 형식으로 정규화해 비교한다
+        (잘못된 형식이면 ValueError).
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        start = normalize_timestamp(start) if start else None
+        end = normalize_timestamp(end) if end else None
+        # 한 건 더 읽어 다음 페이지 존재 여부 판단
+        rows = await asyncio.to_thread(
+            self._query, user, symbol, result, start, end, cursor, limit + 1
+        )
+        next_cursor = rows[limit - 1]["id"] if len(rows) > limit else None
+        return rows[:limit], next_cursor
+
+
+# 싱글톤 인스턴스
+trade_store = TradeStore()
+
+
+if __name__ == "__main__":
+    # 기존 CSV 일괄 가져오기: python -m app.services.trade_store
+    count = asyncio.run(trade_store.sync_from_csv())
+    print(f"Imported {count} rows from {trade_store.csv_path} into {trade_store.path}")
+    trade_store.close()
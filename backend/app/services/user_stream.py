@@ -0,0 +1,425 @@
+"""Account state kept current by the Binance user data stream (listenKey)."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from decimal import Decimal, InvalidOperation
+from typing import Any, Optional
+
+from app.clients.binance_client import BinanceFuturesClient, get_shared_client
+from app.clients.ws_stream import WebSocketStream
+from app.core.config import (
+    USER_STREAM_ENABLED,
+    USER_STREAM_KEEPALIVE_INTERVAL,
+    USER_STREAM_RECONCILE_INTERVAL,
+)
+from app.models.schemas import Balance, Position
+from app.services.account import (
+    AccountSnapshotService,
+    account_snapshot,
+    parse_balances,
+    parse_positions,
+)
+from app.services.leverage import leverage_manager
+from app.services.price_cache import PriceCache, price_cache
+from app.utils.tasks import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+# 더 이상 갱신되지 않는 주문 상태 - 미체결 목록에서 제거
+TERMINAL_ORDER_STATUSES = frozenset(
+    {"FILLED", "CANCELED", "EXPIRED", "EXPIRED_IN_MATCH", "REJECTED"}
+)
+
+
+# 포지션 키: 원웨이 모드는 (심볼, "BOTH"), 헤지 모드는 (심볼, "LONG"/"SHORT")
+PositionKey = tuple[str, str]
+
+_PNL_QUANT = Decimal("0.00000001")
+
+
+def position_key(position: Position) -> PositionKey:
+    return position.symbol, position.positionSide
+
+
+def leg_name(key: PositionKey) -> str:
+    """버전/푸시용 문자열 키 (원웨이는 심볼 그대로, 헤지 다리는 SYMBOL:SIDE)"""
+    symbol, side = key
+    return symbol if side == "BOTH" else f"{symbol}:{side}"
+
+
+def with_mark_pnl(position: Position, mark: Optional[Decimal]) -> Position:
+    """마크프라이스 기준 미실현 손익으로 바꾼 사본 (마크가 없으면 그대로)
+
+    REST 조회(`AccountState`)와 푸시 피드가 같은 계산을 쓰도록 공용으로 둔다.
+    """
+    if mark is None:
+        return position  # 신선한 마크프라이스 없음 - 마지막 이벤트/스냅샷 값
+    try:
+        pnl = (mark - Decimal(position.entryPrice)) * Decimal(position.positionAmt)
+    except InvalidOperation:
+        return position
+    return position.model_copy(
+        update={"unRealizedProfit": format(pnl.quantize(_PNL_QUANT), "f")}
+    )
+
+
+class ListenKeyExpired(Exception):
+    """스트림이 listenKeyExpired 이벤트를 보냄 - 새 키로 재연결 필요"""
+
+
+class AccountState:
+    """포지션/잔고/미체결 주문의 메모리 상태.
+
+    REST 계좌 스냅샷과 스트림 이벤트를 모두 반영하며, 항목별 거래 시각
+    (updateTime / 이벤트 T)을 비교해 늦게 도착한 오래된 스냅샷이 더 최신의
+    이벤트 값을 덮어쓰지 않게 한다. 포지션은 (심볼, positionSide)별로 보관해
+    헤지 모드의 LONG/SHORT 다리가 서로 덮어쓰지 않는다.
+
+    ACCOUNT_UPDATE의 미실현 손익은 계좌 변동 시에만 오므로, 조회 시 신선한
+    마크프라이스가 있으면 `mark_price`로 다시 계산한다.
+    """
+
+    def __init__(
+        self, mark_price: Optional[Callable[[str], Optional[Decimal]]] = None
+    ) -> None:
+        self.positions: dict[PositionKey, Position] = {}
+        self.balances: dict[str, Balance] = {}
+        self.orders: dict[int, dict[str, Any]] = {}
+        self.leverage: dict[str, int] = {}
+        self._mark_price = mark_price
+        self._updated: dict[tuple[str, Any], int] = {}
+        self._listeners: list[Callable[[], None]] = []
+        self.events = 0
+        self.fills = 0
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """계좌 스냅샷/스트림 이벤트가 반영될 때마다 호출할 콜백 등록"""
+        self._listeners.append(callback)
+
+    def _notify(self) -> None:
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Account state listener failed: {e}")
+
+    def _is_newer(self, kind: str, key: Any, ts: int) -> bool:
+        if ts < self._updated.get((kind, key), -1):
+            return False
+        self._updated[(kind, key)] = ts
+        return True
+
+    def _set_position(self, key: PositionKey, row: dict[str, Any]) -> None:
+        parsed = parse_positions([row])
+        if parsed:
+            self.positions[key] = parsed[0]
+        else:
+            self.positions.pop(key, None)  # 수량 0 - 포지션 종료
+
+    def _set_balance(self, asset: str, row: dict[str, Any]) -> None:
+        parsed = parse_balances([row])
+        if parsed:
+            self.balances[asset] = parsed[0]
+
+    def apply_account(self, account: dict[str, Any]) -> None:
+        """`/fapi/v2/account` 스냅샷 반영 (계좌 스냅샷 리스너)"""
+        for row in account.get("positions", []):
+            symbol = row.get("symbol")
+            if not symbol:
+                continue
+            if row.get("leverage"):
+                self.leverage[symbol] = int(row["leverage"])
+            key = (symbol, row.get("positionSide") or "BOTH")
+            if self._is_newer("P", key, int(row.get("updateTime") or 0)):
+                self._set_position(key, row)
+        for row in account.get("assets", []):
+            asset = row.get("asset")
+            if asset and self._is_newer("B", asset, int(row.get("updateTime") or 0)):
+                self._set_balance(asset, row)
+        self._notify()
+
+    def apply_event(self, event: Any) -> None:
+        """사용자 데이터 스트림 이벤트 반영"""
+        if not isinstance(event, dict):
+            return
+        kind = event.get("e")
+        ts = int(event.get("T") or event.get("E") or 0)
+        if kind == "ACCOUNT_UPDATE":
+            self._apply_account_update(event.get("a") or {}, ts)
+        elif kind == "ORDER_TRADE_UPDATE":
+            self._apply_order_update(event.get("o") or {})
+        elif kind == "ACCOUNT_CONFIG_UPDATE":
+            self._apply_config_update(event.get("ac") or {})
+        elif kind == "listenKeyExpired":
+            raise ListenKeyExpired("listenKey expired")
+        else:
+            return
+        self.events += 1
+        self._notify()
+
+    def _apply_account_update(self, update: dict[str, Any], ts: int) -> None:
+        for item in update.get("B", []):
+            asset = item.get("a")
+            if not asset or not self._is_newer("B", asset, ts):
+                continue
+            # 이벤트에는 지갑 잔고만 있으므로 나머지 필드는 이전 값 유지
+            current = self.balances.get(asset)
+            row = current.model_dump() if current else {"asset": asset}
+            row.update(
+                balance=item.get("wb", "0"), crossWalletBalance=item.get("cw", "0")
+            )
+            self._set_balance(asset, row)
+        for item in update.get("P", []):
+            symbol = item.get("s")
+            key = (symbol, item.get("ps") or "BOTH")
+            if not symbol or not self._is_newer("P", key, ts):
+                continue
+            row = {
+                "symbol": symbol,
+                "positionAmt": item.get("pa", "0"),
+                "entryPrice": item.get("ep", "0"),
+                "unRealizedProfit": item.get("up", "0"),
+                "marginType": item.get("mt", "cross"),
+                "positionSide": key[1],
+                "leverage": self.leverage.get(symbol, 0),
+            }
+            self._set_position(key, row)
+
+    def _apply_order_update(self, order: dict[str, Any]) -> None:
+        order_id = order.get("i")
+        if order_id is None:
+            return
+        status = order.get("X", "")
+        if status in TERMINAL_ORDER_STATUSES:
+            self.orders.pop(order_id, None)
+            if status == "FILLED":
+                self.fills += 1
+            return
+        self.orders[order_id] = {
+            "orderId": order_id,
+            "symbol": order.get("s", ""),
+            "side": order.get("S", ""),
+            "type": order.get("o", ""),
+            "status": status,
+            "origQty": order.get("q", "0"),
+            "executedQty": order.get("z", "0"),
+            "price": order.get("p", "0"),
+            "avgPrice": order.get("ap", "0"),
+            "updateTime": order.get("T", 0),
+        }
+
+    def _apply_config_update(self, config: dict[str, Any]) -> None:
+        symbol, leverage = config.get("s"), config.get("l")
+        if not symbol or leverage is None:
+            return
+        self.leverage[symbol] = int(leverage)
+        leverage_manager.record(symbol, int(leverage))
+        for key, position in self.positions.items():
+            if key[0] == symbol:
+                self.positions[key] = position.model_copy(
+                    update={"leverage": int(leverage)}
+                )
+
+    def export(self) -> dict[str, Any]:
+        """다른 워커 프로세스로 보낼 JSON 직렬화 가능한 사본"""
+        return {
+            "positions": [p.model_dump() for p in self.positions.values()],
+            "balances": [b.model_dump() for b in self.balances.values()],
+            "orders": list(self.orders.values()),
+            "leverage": self.leverage,
+        }
+
+    def load(self, data: dict[str, Any]) -> None:
+        """`export()` 사본으로 상태 전체 교체 (구독 워커 측)"""
+        self.positions = {
+            position_key(p): p
+            for p in (Position(**row) for row in data.get("positions", []))
+        }
+        self.balances = {
+            b.asset: b for b in (Balance(**row) for row in data.get("balances", []))
+        }
+        self.orders = {row["orderId"]: row for row in data.get("orders", [])}
+        self.leverage = dict(data.get("leverage", {}))
+        # fetcher가 받은 ACCOUNT_CONFIG_UPDATE를 워커의 레버리지 캐시에도 반영
+        for symbol, leverage in self.leverage.items():
+            leverage_manager.record(symbol, leverage)
+
+    def _with_mark_pnl(self, position: Position) -> Position:
+        mark = self._mark_price(position.symbol) if self._mark_price else None
+        return with_mark_pnl(position, mark)
+
+    def legs(self) -> dict[str, Position]:
+        """다리 이름(`leg_name`)별 포지션 (미실현 손익은 마크프라이스 기준)"""
+        return {
+            leg_name(key): self._with_mark_pnl(p) for key, p in self.positions.items()
+        }
+
+    def position_list(self, symbol: Optional[str] = None) -> list[Position]:
+        return [
+            self._with_mark_pnl(p)
+            for (sym, _), p in self.positions.items()
+            if symbol is None or sym == symbol
+        ]
+
+    def balance_list(self, asset: Optional[str] = None) -> list[Balance]:
+        if asset is None:
+            return list(self.balances.values())
+        balance = self.balances.get(asset)
+        return [balance] if balance is not None else []
+
+
+class UserDataStream:
+    """listenKey 기반 사용자 데이터 스트림 관리자.
+
+    (재)연결 직후 계좌 스냅샷 REST 1회로 끊긴 동안의 공백을 메우고, 이후에는
+    스트림 이벤트만으로 `state`를 갱신한다. 연결이 살아 있고 재동기화가 끝난
+    동안(`is_live`) 포지션/잔고 조회는 업스트림 호출 없이 메모리에서 응답한다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[BinanceFuturesClient] = None,
+        account: Optional[AccountSnapshotService] = None,
+        enabled: bool = USER_STREAM_ENABLED,
+        keepalive_interval: float = USER_STREAM_KEEPALIVE_INTERVAL,
+        stream_base_url: Optional[str] = None,
+        prices: Optional[PriceCache] = None,
+        reconcile_interval: float = USER_STREAM_RECONCILE_INTERVAL,
+    ) -> None:
+        self._client = client
+        self.enabled = enabled
+        self._stream_base_url = stream_base_url
+        self.prices = prices or price_cache
+        self.state = AccountState(mark_price=self._fresh_mark_price)
+        # REST 계좌 조회 결과는 경로와 무관하게 메모리 상태에도 반영
+        self.account = account or account_snapshot
+        self.account.add_listener(self.state.apply_account)
+        self._stream: Optional[WebSocketStream] = None
+        self._keepalive = PeriodicTask(
+            "user-stream-keepalive", self._keepalive_once, keepalive_interval
+        )
+        # 스트림 이벤트에 없는 잔고 필드(availableBalance/maxWithdrawAmount/
+        # crossUnPnl)는 저빈도 REST 스냅샷으로 맞춤
+        self._reconcile = PeriodicTask(
+            "user-stream-reconcile", self._reconcile_once, reconcile_interval
+        )
+        self._listen_key: Optional[str] = None
+        self._synced = False
+        # 다른 프로세스(fetcher)가 스트림을 소유하고 상태를 공유해 주는 중인지
+        self._remote_live = False
+        self.resyncs = 0
+        self.reconciles = 0
+        self.keepalive_failures = 0
+
+    @property
+    def client(self) -> BinanceFuturesClient:
+        """주입된 클라이언트가 없으면 프로세스 공용 클라이언트 사용"""
+        return self._client or get_shared_client()
+
+    @property
+    def stream(self) -> Optional[WebSocketStream]:
+        return self._stream
+
+    @property
+    def is_live(self) -> bool:
+        """연결 중이고 연결 이후 REST 재동기화까지 끝났는지 (또는 공유 상태 수신 중)"""
+        if self._remote_live:
+            return True
+        return self._stream is not None and self._stream.connected and self._synced
+
+    def _fresh_mark_price(self, symbol: str) -> Optional[Decimal]:
+        return self.prices.fresh_mark_price(symbol)
+
+    def apply_remote(self, data: dict[str, Any]) -> None:
+        """fetcher 프로세스가 공유한 계좌 상태 반영 (live=False면 REST 폴백)"""
+        if data.get("live"):
+            self.state.load(data)
+        self._remote_live = bool(data.get("live"))
+
+    def set_remote_live(self, live: bool) -> None:
+        self._remote_live = live
+
+    async def _stream_url(self) -> str:
+        """연결마다 listenKey 발급 (유효한 키가 있으면 같은 키가 돌아옴)"""
+        self._synced = False
+        self._listen_key = await self.client.create_listen_key()
+        base = self._stream_base_url or self.client.ws_base_url
+        return f"{base}/ws/{self._listen_key}"
+
+    async def _on_connect(self) -> None:
+        # 끊긴 동안 놓친 이벤트가 있을 수 있으므로 REST 스냅샷으로 재동기화
+        await self.account.get_account(bypass=True)
+        self.resyncs += 1
+        self._synced = True
+
+    async def _reconcile_once(self) -> None:
+        # 연결 직후 재동기화와 겹치지 않도록 live 상태에서만 조회
+        if self._stream is None or not self._stream.connected or not self._synced:
+            return
+        await self.account.get_account(bypass=True)
+        self.reconciles += 1
+
+    async def _keepalive_once(self) -> None:
+        if self._listen_key is None or self._stream is None:
+            return
+        try:
+            await self.client.keepalive_listen_key()
+        except Exception as e:
+            # 키가 이미 만료됐을 수 있음 - 새 키로 재연결 (재동기화 포함)
+            self.keepalive_failures += 1
+            logger.warning(f"listenKey keepalive failed, reconnecting: {e}")
+            self._synced = False
+            await self._stream.restart()
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+        if not self.client.api_key:
+            logger.info("User data stream disabled: API key not configured")
+            return
+        if self._stream is None:
+            self._stream = WebSocketStream(
+                "user-data-stream",
+                self._stream_url,
+                self.state.apply_event,
+                on_connect=self._on_connect,
+                # 계좌 이벤트는 드물게 오므로 수신 타임아웃 없이 ping으로 연결 확인
+                idle_timeout=None,
+            )
+        self._stream.start()
+        self._keepalive.start()
+        self._reconcile.start()
+
+    async def stop(self) -> None:
+        await self._keepalive.stop()
+        await self._reconcile.stop()
+        if self._stream is not None:
+            await self._stream.stop()
+        self._synced = False
+        if self._listen_key is not None:
+            try:
+                await self.client.close_listen_key()
+            except Exception as e:
+                logger.warning(f"Failed to close listenKey: {e}")
+            self._listen_key = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "live": self.is_live,
+            "remote": self._remote_live,
+            "resyncs": self.resyncs,
+            "reconciles": self.reconciles,
+            "keepaliveFailures": self.keepalive_failures,
+            "positions": len(self.state.positions),
+            "balances": len(self.state.balances),
+            "openOrders": len(self.state.orders),
+            "events": self.state.events,
+            "fills": self.state.fills,
+            "stream": self._stream.stats() if self._stream else None,
+        }
+
+
+# 싱글톤 인스턴스
+user_stream = UserDataStream()
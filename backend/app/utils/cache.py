@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, Optional, TypeVar
+
+from cachetools import LRUCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SWRCache(Generic[T]):
+    """Single-flight + stale-while-revalidate 비동기 캐시.
+
+    - TTL 내 항목은 그대로 반환 (hit)
+    - TTL은 지났지만 `stale_ttl` 이내면 오래된 값을 즉시 반환하고
+      백그라운드에서 한 번만 갱신 (stale hit)
+    - 그 외에는 업스트림 조회 - 같은 키의 동시 요청은 하나의 호출로 합침
+    항목 수는 LRU로 `maxsize`까지만 유지한다.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = 0.0, maxsize: int = 256) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        # 무효화 세대 - 무효화 이전에 시작된 조회 결과는 캐시에 쓰지 않음
+        self._generation = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def peek(self, key: Hashable) -> Optional[tuple[T, float]]:
+        """(값, 경과 시간) 조회 - 만료 여부와 무관, 통계에 반영하지 않음"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        return value, time.monotonic() - stored_at
+
+    def set(self, key: Hashable, value: T) -> None:
+        self._entries[key] = (value, time.monotonic())
+
+    def replace(self, key: Hashable, value: T) -> bool:
+        """기존 항목의 값만 교체 (저장 시각 유지) - 항목이 없으면 False"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        self._entries[key] = (value, entry[1])
+        return True
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        self._generation += 1
+        if key is None:
+            self._entries.clear()
+            self._inflight.clear()
+        else:
+            self._entries.pop(key, None)
+            self._inflight.pop(key, None)
+
+    def _fetch(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> asyncio.Task:
+        """같은 키의 진행 중 조회가 있으면 재사용, 없으면 새로 시작"""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        generation = self._generation
+
+        async def run() -> T:
+            try:
+                value = await loader()
+                if generation == self._generation:
+                    self.set(key, value)
+                return value
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+
+        task = asyncio.create_task(run())
+        self._inflight[key] = task
+        return task
+
+    def _refresh_in_background(
+        self, key: Hashable, loader: Callable[[], Awaitable[T]]
+    ) -> None:
+        if key in self._inflight:
+            return
+        self.refreshes += 1
+        task = self._fetch(key, loader)
+
+        def log_failure(done: asyncio.Task) -> None:
+            # 백그라운드 실패는 로그만 남기고 다음 요청에서 재시도
+            if not done.cancelled() and done.exception() is not None:
+                logger.warning(
+                    f"Background refresh failed for {key}: {done.exception()}"
+                )
+
+        task.add_done_callback(log_failure)
+
+    async def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        bypass: bool = False,
+        allow_stale: bool = True,
+    ) -> T:
+        if not bypass:
+            found = self.peek(key)
+            if found is not None:
+                value, age = found
+                if age < self.ttl:
+                    self.hits += 1
+                    return value
+                if allow_stale and age < self.ttl + self.stale_ttl:
+                    self.stale_hits += 1
+                    self._refresh_in_background(key, loader)
+                    return value
+        self.misses += 1
+        # shield: 한 호출자가 취소돼도 합쳐진 다른 호출자의 조회는 계속
+        return await asyncio.shield(self._fetch(key, loader))
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self._entries.maxsize,
+            "hits": self.hits,
+            "staleHits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "hitRatio": round((self.hits + self.stale_hits) / lookups, 4)
+            if lookups
+            else None,
+        }
@@ -0,0 +1,96 @@
+"""Pre-serialized, pre-compressed response bodies with strong ETags."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Response
+
+try:
+    # Optional: brotli 변형은 brotli 패키지가 있을 때만 생성
+    import brotli  # type: ignore
+
+    _BROTLI_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+    _BROTLI_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class EncodedBody:
+    """한 번 직렬화/압축해 두고 요청마다 그대로 내보내는 응답 본문"""
+
+    identity: bytes
+    gzip: bytes
+    br: Optional[bytes]
+    digest: str
+
+    @classmethod
+    def build(cls, body: bytes) -> EncodedBody:
+        return cls(
+            identity=body,
+            gzip=gzip.compress(body, compresslevel=9, mtime=0),
+            br=brotli.compress(body, quality=11) if _BROTLI_AVAILABLE else None,
+            digest=hashlib.sha256(body).hexdigest()[:32],
+        )
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        # 인코딩별 표현이 다르므로 강한 ETag도 인코딩마다 구분
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Accept-Encoding에서 q=0(거부)이 아닌 인코딩 이름 집합"""
+    accepted: set[str] = set()
+    for part in header.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        key, _, value = params.strip().partition("=")
+        try:
+            rejected = key.strip() == "q" and float(value) == 0
+        except ValueError:
+            rejected = False
+        if name and not rejected:
+            accepted.add(name)
+    return accepted
+
+
+def _if_none_match(header: str) -> set[str]:
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+def precompressed_response(
+    headers: Mapping[str, str],
+    body: EncodedBody,
+    media_type: str = "application/json",
+    cache_control: str = "no-cache",
+) -> Response:
+    """Accept-Encoding에 맞는 사전 압축 본문 선택, If-None-Match 일치 시 304"""
+    accepted = _accepted_encodings(headers.get("accept-encoding", ""))
+    if body.br is not None and "br" in accepted:
+        encoding, content = "br", body.br
+    elif "gzip" in accepted:
+        encoding, content = "gzip", body.gzip
+    else:
+        encoding, content = None, body.identity
+
+    response_headers = {
+        "ETag": body.etag(encoding),
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    # 이번 요청에서 협상된 표현의 ETag와만 비교 (다른 인코딩의 캐시로 304 금지)
+    if_none_match = headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or response_headers["ETag"] in _if_none_match(if_none_match)
+    ):
+        return Response(status_code=304, headers=response_headers)
+
+    if encoding:
+        response_headers["Content-Encoding"] = encoding
+    return Response(content=content, media_type=media_type, headers=response_headers)
@@ -0,0 +1,217 @@
+"""In-process metrics registry rendered in the Prometheus text format."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+from collections.abc import Callable, Iterable
+from typing import Optional
+
+Labels = tuple[str, ...]
+SampleCallback = Callable[[], dict[Labels, float]]
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 800ms SLO 경계가 버킷 경계와 일치하도록 0.8 포함
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    0.8,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ",".join(
+        f'{n}="{_escape(str(v))}"' for n, v in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """라벨별 누적 카운터"""
+
+    def __init__(self, name: str, help: str, labelnames: Labels = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(
+                f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+            )
+        return lines
+
+
+class Histogram:
+    """라벨별 지연시간 히스토그램.
+
+    관측 시에는 bisect로 찾은 버킷 하나와 합계만 갱신하고(락/할당 없음),
+    Prometheus가 요구하는 누적 버킷 값은 스크레이프 시점에 계산한다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, float] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        counts = self._counts.get(labels)
+        if counts is None:
+            # 마지막 칸은 +Inf
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+            self._sums[labels] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[labels] += value
+
+    def count(self, labels: Labels = ()) -> int:
+        return sum(self._counts.get(labels, ()))
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        names = (*self.labelnames, "le")
+        for labels, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts, strict=True):
+                cumulative += count
+                le = bound if isinstance(bound, str) else _number(bound)
+                lines.append(
+                    f"{self.name}_bucket{_labels(names, (*labels, le))} {cumulative}"
+                )
+            series = _labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{series} {_number(self._sums[labels])}")
+            lines.append(f"{self.name}_count{series} {cumulative}")
+        return lines
+
+
+class CallbackMetric:
+    """스크레이프 시점에만 콜백으로 값을 읽는 게이지/카운터 (핫패스 비용 없음)"""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        kind: str,
+        labelnames: Labels,
+        callback: SampleCallback,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.labelnames = labelnames
+        self.callback = callback
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        try:
+            samples = self.callback()
+        except Exception as e:
+            logger.warning(f"Metric callback {self.name} failed: {e}")
+            samples = {}
+        for labels, value in sorted(samples.items()):
+            lines.append(
+                f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+            )
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 등록/렌더링 (이름 중복 등록 시 기존 인스턴스 반환)"""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram | CallbackMetric] = {}
+
+    def counter(self, name: str, help: str, labelnames: Labels = ()) -> Counter:
+        return self._register(name, lambda: Counter(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(name, lambda: Histogram(name, help, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        help: str,
+        callback: SampleCallback,
+        labelnames: Labels = (),
+        kind: str = "gauge",
+    ) -> CallbackMetric:
+        metric = CallbackMetric(name, help, kind, labelnames, callback)
+        self._metrics[name] = metric
+        return metric
+
+    def _register(self, name: str, factory: Callable[[], object]):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = factory()
+        return metric
+
+    def get(self, name: str) -> Optional[Counter | Histogram | CallbackMetric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 공용 레지스트리와 공통 메트릭
+registry = MetricsRegistry()
+
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+upstream_request_duration = registry.histogram(
+    "binance_request_duration_seconds",
+    "Binance REST request latency by path",
+    ("method", "path", "status"),
+)
+upstream_retries = registry.counter(
+    "binance_retries_total",
+    "Binance client calls retried by tenacity",
+    ("call",),
+)
@@ -1,48 +1,141 @@
 from __future__ import annotations
 
+import json
 import logging
 import time
 import uuid
-from collections.abc import Callable
+from typing import Optional
 
-from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import http_request_duration
+from app.utils.profiling import PROFILE_HEADER, request_profiler
+from app.utils.tracing import RequestTrace, end_trace, start_trace
 
 logger = logging.getLogger(__name__)
 
 
-async def access_log_middleware(request: Request, call_next: Callable):
-    req_id = str(uuid.uuid4())
-    request.state.request_id = req_id
-    start = time.perf_counter()
-
-    try:
-        response = await call_next(request)
-    except HTTPException:
-        # let FastAPI handle HTTPException
-        raise
-    except Exception as e:
-        # standard error envelope on unexpected errors
-        elapsed = int((time.perf_counter() - start) * 1000)
-        logger.error(
-            f"reqId={req_id} route={request.url.path} code=UNHANDLED_ERROR cause={e}"
+def _route_label(scope: Scope) -> str:
+    """경로 파라미터가 있어도 라벨 수가 늘지 않도록 라우트 템플릿 사용"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def _header(scope: Scope, name: bytes) -> Optional[str]:
+    for key, value in scope.get("headers", ()):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class AccessLogMiddleware:
+    """요청 ID/에러 엔벨로프/지연시간 로깅을 담당하는 순수 ASGI 미들웨어.
+
+    BaseHTTPMiddleware와 달리 요청마다 태스크나 메모리 스트림을 만들지 않고
+    `send`만 감싸 응답 시작 메시지에 헤더를 붙인다. 본문 메시지는 그대로
+    통과하므로 SSE 같은 스트리밍 응답도 버퍼링되지 않는다. 지연시간은
+    응답 헤더가 나가는 시점(스트리밍은 첫 바이트까지)을 기준으로 기록한다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        req_id = str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = req_id
+        method, path = scope["method"], scope["path"]
+        start = time.perf_counter()
+        trace, token = start_trace(req_id)
+        status = 500
+        duration = 0.0
+        started = False
+
+        token_header = _header(scope, PROFILE_HEADER.encode())
+        profile = (
+            request_profiler.start(req_id, method, path, token_header is not None)
+            if request_profiler.wants(path, token_header)
+            else None
         )
-        return JSONResponse(
-            status_code=500,
-            content={
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, duration, started
+            if message["type"] == "http.response.start":
+                started = True
+                status = message["status"]
+                duration = time.perf_counter() - start
+                http_request_duration.observe(
+                    (method, _route_label(scope), str(status)), duration
+                )
+                # 헤더 이후 구간(스트리밍 본문)은 기록하지 않아 트레이스가 유계.
+                # 컨텍스트 변수 복원은 finally에서 - StreamingResponse는 자식
+                # 태스크(다른 Context)에서 send를 호출함
+                trace.closed = True
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", trace.server_timing(duration * 1000))
+                if profile is not None:
+                    headers.append("X-Profile-Id", profile.id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            logger.error(f"reqId={req_id} route={path} code=UNHANDLED_ERROR cause={e}")
+            if started:
+                raise  # 이미 응답을 보내기 시작함 - 연결 종료는 서버에 맡김
+            # standard error envelope on unexpected errors
+            await self._send_error(send_wrapper, req_id)
+        finally:
+            end_trace(trace, token)
+            if profile is not None:
+                request_profiler.finish(profile, status)
+                logger.info("reqId=%s route=%s profileId=%s", req_id, path, profile.id)
+
+        self._log(req_id, path, status, duration, trace)
+
+    @staticmethod
+    async def _send_error(send: Send, req_id: str) -> None:
+        body = json.dumps(
+            {
                 "requestId": req_id,
                 "code": "UNHANDLED_ERROR",
                 "message": "Internal server error",
-            },
-        )
-    elapsed = int((time.perf_counter() - start) * 1000)
-    # 모든 요청 로깅 (디버깅용)
-    if response.status_code >= 400:
-        logger.error(
-            f"reqId={req_id} route={request.url.path} status={response.status_code} latencyMs={elapsed}"
+            }
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 500,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
         )
-    else:
-        logger.info(
-            f"reqId={req_id} route={request.url.path} status={response.status_code} latencyMs={elapsed}"
-        )
-    return response
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    def _log(
+        req_id: str, path: str, status: int, duration: float, trace: RequestTrace
+    ) -> None:
+        elapsed = int(duration * 1000)
+        if trace.spans and logger.isEnabledFor(logging.INFO):
+            # 업스트림 구간별 소요 시간 (어느 호출이 느렸는지 구분)
+            logger.info(f"reqId={req_id} route={path} upstream {trace.summary()}")
+        # 모든 요청 로깅 (디버깅용)
+        if status >= 400:
+            logger.error(
+                f"reqId={req_id} route={path} status={status} latencyMs={elapsed}"
+            )
+        else:
+            logger.info(
+                "reqId=%s route=%s status=%s latencyMs=%s",
+                req_id,
+                path,
+                status,
+                elapsed,
+            )
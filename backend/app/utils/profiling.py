@@ -0,0 +1,184 @@
+"""On-demand cProfile capture of single requests (token-gated)."""
+
+from __future__ import annotations
+
+import cProfile
+import hmac
+import io
+import marshal
+import pstats
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from app.core.config import PROFILING_MAX_PROFILES, PROFILING_TOKEN
+
+PROFILE_HEADER = "x-profile-token"
+# 프로파일 조회/다운로드 요청 자체는 프로파일하지 않음
+ADMIN_PREFIX = "/api/admin/profiling"
+
+
+@dataclass(frozen=True)
+class RequestProfile:
+    """한 요청의 프로파일 결과 (pstats 원본 + 메타데이터)"""
+
+    id: str
+    request_id: str
+    method: str
+    path: str
+    status: int
+    duration_ms: float
+    created_at: float
+    stats: dict[Any, Any]
+
+    def pstats_bytes(self) -> bytes:
+        """`pstats.Stats(path)` / snakeviz로 열 수 있는 덤프"""
+        return marshal.dumps(self.stats)
+
+    def report(self, sort: str = "cumulative", limit: int = 60) -> str:
+        buffer = io.StringIO()
+        stats = pstats.Stats(_Loaded(self.stats), stream=buffer)
+        stats.sort_stats(sort).print_stats(limit)
+        return buffer.getvalue()
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "requestId": self.request_id,
+            "method": self.method,
+            "path": self.path,
+            "status": self.status,
+            "durationMs": round(self.duration_ms, 1),
+            "createdAt": self.created_at,
+        }
+
+
+@dataclass
+class ActiveProfile:
+    """진행 중인 프로파일 (응답 헤더에 쓸 id를 미리 발급)"""
+
+    id: str
+    request_id: str
+    method: str
+    path: str
+    profiler: cProfile.Profile
+    started: float
+
+
+class _Loaded:
+    """저장된 stats dict를 pstats.Stats에 넘기기 위한 어댑터"""
+
+    def __init__(self, stats: dict[Any, Any]) -> None:
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class RequestProfiler:
+    """요청 단위 결정적 프로파일러.
+
+    `X-Profile-Token` 헤더가 설정된 토큰과 일치하거나 관리자 엔드포인트로
+    경로를 무장(arm)해 둔 경우에만 해당 요청 하나를 cProfile로 감싼다.
+    이벤트 루프 스레드 전체를 계측하므로 같은 시점의 다른 코루틴도 섞일 수
+    있어, 한 번에 한 요청만 프로파일한다. 결과는 최근 N개만 메모리에 보관.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = PROFILING_TOKEN,
+        max_profiles: int = PROFILING_MAX_PROFILES,
+    ) -> None:
+        self.token = token or ""
+        self.profiles: deque[RequestProfile] = deque(maxlen=max_profiles)
+        self._armed: dict[str, int] = {}
+        self._active: Optional[ActiveProfile] = None
+        self.skipped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.token)
+
+    def authorized(self, token: Optional[str]) -> bool:
+        return self.enabled and hmac.compare_digest(
+            (token or "").encode(), self.token.encode()
+        )
+
+    def arm(self, path: str, count: int = 1) -> None:
+        """다음 `count`개의 `path` 요청을 헤더 없이도 프로파일"""
+        self._armed[path] = self._armed.get(path, 0) + count
+
+    def disarm(self, path: Optional[str] = None) -> None:
+        if path is None:
+            self._armed.clear()
+        else:
+            self._armed.pop(path, None)
+
+    def wants(self, path: str, token: Optional[str]) -> bool:
+        if not self.enabled or path.startswith(ADMIN_PREFIX):
+            return False
+        if token is not None:
+            return self.authorized(token)
+        return self._armed.get(path, 0) > 0
+
+    def _consume(self, path: str) -> None:
+        remaining = self._armed.get(path, 0) - 1
+        if remaining > 0:
+            self._armed[path] = remaining
+        else:
+            self._armed.pop(path, None)
+
+    def start(
+        self, request_id: str, method: str, path: str, from_header: bool
+    ) -> Optional[ActiveProfile]:
+        """프로파일 시작 (다른 프로파일 진행 중이면 None - 그냥 실행)"""
+        if self._active is not None:
+            self.skipped += 1
+            return None
+        if not from_header:
+            self._consume(path)
+        active = ActiveProfile(
+            id=uuid.uuid4().hex[:12],
+            request_id=request_id,
+            method=method,
+            path=path,
+            profiler=cProfile.Profile(),
+            started=time.perf_counter(),
+        )
+        self._active = active
+        active.profiler.enable()
+        return active
+
+    def finish(self, active: ActiveProfile, status: int) -> RequestProfile:
+        active.profiler.disable()
+        self._active = None
+        active.profiler.create_stats()
+        result = RequestProfile(
+            id=active.id,
+            request_id=active.request_id,
+            method=active.method,
+            path=active.path,
+            status=status,
+            duration_ms=(time.perf_counter() - active.started) * 1000,
+            created_at=time.time(),
+            stats=active.profiler.stats,
+        )
+        self.profiles.append(result)
+        return result
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        return next((p for p in self.profiles if p.id == profile_id), None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "armed": dict(self._armed),
+            "skipped": self.skipped,
+            "profiles": [p.summary() for p in reversed(self.profiles)],
+        }
+
+
+# 싱글톤 인스턴스
+request_profiler = RequestProfiler()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """주기적으로 코루틴을 실행하는 백그라운드 태스크 (lifespan에서 start/stop)
+
+    실패 시 `retry_interval` 후 재시도하고, 취소는 그대로 전파해 종료가 깔끔하다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        interval: float,
+        retry_interval: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self._func = func
+        self.interval = interval
+        self.retry_interval = (
+            retry_interval if retry_interval is not None else min(interval, 5.0)
+        )
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """루프 시작 (이미 실행 중이면 무시)"""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self._func()
+                await asyncio.sleep(self.interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"{self.name} failed: {str(e)}")
+                await asyncio.sleep(self.retry_interval)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,69 @@
+"""Per-request upstream span collection (in-process, contextvar based)."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Optional
+
+_current: ContextVar[Optional[RequestTrace]] = ContextVar("request_trace", default=None)
+
+
+class RequestTrace:
+    """한 요청 동안 발생한 업스트림 호출 구간 (이름, 소요 ms) 목록"""
+
+    def __init__(self, request_id: str) -> None:
+        self.request_id = request_id
+        self.spans: list[tuple[str, float]] = []
+        self.closed = False
+
+    def add(self, name: str, duration_ms: float) -> None:
+        # 요청이 끝난 뒤 컨텍스트를 물려받은 백그라운드 태스크의 구간은 무시
+        if not self.closed:
+            self.spans.append((name, duration_ms))
+
+    def server_timing(self, total_ms: Optional[float] = None) -> str:
+        """Server-Timing 헤더 값 (같은 이름이 여러 번 나오면 순번을 붙임)"""
+        seen: dict[str, int] = {}
+        parts: list[str] = []
+        for name, duration in self.spans:
+            seen[name] = seen.get(name, 0) + 1
+            label = name if seen[name] == 1 else f"{name}-{seen[name]}"
+            parts.append(f"{label};dur={duration:.1f}")
+        if total_ms is not None:
+            parts.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(parts)
+
+    def summary(self) -> str:
+        """로그용 구간 요약 (name=12.3ms ...)"""
+        return " ".join(f"{name}={duration:.1f}ms" for name, duration in self.spans)
+
+
+def start_trace(request_id: str) -> tuple[RequestTrace, Token]:
+    trace = RequestTrace(request_id)
+    return trace, _current.set(trace)
+
+
+def end_trace(trace: RequestTrace, token: Token) -> None:
+    trace.closed = True
+    _current.reset(token)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    return _current.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """현재 요청 트레이스에 구간 기록 (요청 밖에서는 아무것도 하지 않음)"""
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, (time.perf_counter() - start) * 1000)
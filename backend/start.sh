@@ -0,0 +1,26 @@
+#!/bin/sh
+# WEB_WORKERS=1 (기본): 단일 프로세스가 스트림/폴러와 요청 처리를 모두 담당
+# WEB_WORKERS>1: fetcher 프로세스 하나가 Binance 연결과 거래 저널을 소유하고,
+#                uvicorn 워커들은 상태 버스(Unix 소켓)로 공유 상태를 구독하며
+#                거래 기록을 fetcher에 전달
+set -e
+
+WEB_WORKERS="${WEB_WORKERS:-1}"
+# fetcher/워커 모두 레이트리밋 몫 계산에 사용 (config.RATE_LIMIT_SHARES)
+export WEB_WORKERS
+
+if [ "$WEB_WORKERS" -le 1 ]; then
+    exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-3000}"
+fi
+
+# fetcher가 죽으면 재시작 (그동안 워커는 REST 경로로 폴백)
+(
+    while true; do
+        WORKER_ROLE=fetcher python -m app.fetcher || true
+        sleep 1
+    done
+) &
+
+export WORKER_ROLE=worker
+exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-3000}" \
+    --workers "$WEB_WORKERS"
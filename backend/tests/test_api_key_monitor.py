@@ -0,0 +1,141 @@
+"""실제 서명 요청 응답으로 API 키 상태를 판정하는 모니터 테스트"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.clients.binance_client import BinanceFuturesClient
+from app.clients.clock_sync import ClockSync
+from app.core.security import ApiKeyMonitor
+from app.services.account import AccountSnapshotService
+
+ACCOUNT = {"positions": [], "assets": []}
+
+
+def _setup(handler, idle_probe_interval=300.0):
+    calls = []
+
+    def recording(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/fapi/v1/time":
+            return httpx.Response(200, json={"serverTime": 1_700_000_000_000})
+        calls.append(request.url.path)
+        return handler(request)
+
+    client = BinanceFuturesClient(
+        api_key="k", api_secret="s", clock=ClockSync(interval_seconds=60)
+    )
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(recording)
+    )
+    monitor = ApiKeyMonitor(
+        client=client,
+        account=AccountSnapshotService(client),
+        idle_probe_interval=idle_probe_interval,
+    )
+    client.add_response_listener(monitor.observe)
+    return client, monitor, calls
+
+
+def test_signed_traffic_marks_key_valid_without_probe():
+    def handler(request):
+        return httpx.Response(200, json=[], headers={"X-MBX-USED-WEIGHT-1M": "100"})
+
+    client, monitor, calls = _setup(handler)
+
+    async def scenario():
+        await client.get_position_risk()
+        return await monitor.get_api_key_status()
+
+    status = asyncio.run(scenario())
+    assert status.is_valid and status.has_futures_permission
+    # 남은 가중치는 응답 헤더로 보정된 레이트리미터 값
+    assert status.rate_limit_remaining == client.rate_limiter.remaining_weight
+    assert calls == ["/fapi/v2/positionRisk"]
+    assert monitor.probes == 0
+
+
+def test_auth_error_code_marks_key_invalid():
+    def handler(request):
+        return httpx.Response(
+            401, json={"code": -2015, "msg": "Invalid API-key, IP, or permissions"}
+        )
+
+    client, monitor, _ = _setup(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.get_position_risk())
+    assert monitor.status.is_valid is False
+    assert monitor.status.error_message == "Invalid API-key, IP, or permissions"
+
+
+def test_business_and_server_errors_keep_key_valid():
+    responses = iter(
+        [
+            httpx.Response(200, json=[]),
+            httpx.Response(400, json={"code": -2019, "msg": "Margin is insufficient"}),
+            httpx.Response(503, text="unavailable"),
+        ]
+    )
+    client, monitor, _ = _setup(lambda request: next(responses))
+
+    async def scenario():
+        await client.get_position_risk()
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_position_risk()
+
+    asyncio.run(scenario())
+    assert monitor.status.is_valid is True
+    assert monitor.observed == 2  # 5xx는 판정에 쓰지 않음
+
+
+def test_cold_status_probes_account_once():
+    client, monitor, calls = _setup(lambda request: httpx.Response(200, json=ACCOUNT))
+
+    async def scenario():
+        first = await monitor.get_api_key_status()
+        second = await monitor.get_api_key_status()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first.is_valid and second.is_valid
+    assert calls == ["/fapi/v2/account"]
+    assert monitor.probes == 1
+
+
+def test_idle_probe_only_after_quiet_period():
+    client, monitor, calls = _setup(
+        lambda request: httpx.Response(200, json=ACCOUNT), idle_probe_interval=60
+    )
+
+    async def scenario():
+        await monitor._probe_if_idle()  # 최초 확인
+        await monitor._probe_if_idle()  # 방금 확인됨 - 조회 없음
+        monitor._verified_at -= 61
+        await monitor._probe_if_idle()
+
+    asyncio.run(scenario())
+    assert calls == ["/fapi/v2/account", "/fapi/v2/account"]
+    assert monitor.probes == 2
+
+
+def test_missing_keys_reported_without_request():
+    client, monitor, calls = _setup(lambda request: httpx.Response(200))
+    client.api_key = ""
+    status = asyncio.run(monitor.get_api_key_status())
+    assert status.is_valid is False
+    assert status.error_message == "API keys not configured"
+    assert calls == []
+
+
+def test_monitor_task_is_cancelled_on_stop():
+    client, monitor, _ = _setup(lambda request: httpx.Response(200, json=ACCOUNT))
+
+    async def scenario():
+        monitor.start()
+        await asyncio.sleep(0)
+        assert monitor._task.running
+        await monitor.stop()
+        return monitor._task.running
+
+    assert asyncio.run(scenario()) is False
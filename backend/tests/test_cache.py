@@ -0,0 +1,59 @@
+"""SWRCache single-flight / stale-while-revalidate 테스트"""
+
+import asyncio
+
+from app.utils.cache import SWRCache
+
+
+class Loader:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.calls
+
+
+def test_concurrent_misses_are_coalesced():
+    cache = SWRCache(ttl=10)
+    loader = Loader()
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get("k", loader) for _ in range(20)))
+
+    assert asyncio.run(scenario()) == [1] * 20
+    assert loader.calls == 1
+    assert cache.stats()["coalesced"] == 19
+
+
+def test_stale_value_served_while_refreshing():
+    cache = SWRCache(ttl=0, stale_ttl=10)
+    loader = Loader()
+
+    async def scenario():
+        assert await cache.get("k", loader) == 1
+        assert await cache.get("k", loader) == 1  # 오래된 값 즉시 반환
+        await asyncio.sleep(0.05)  # 백그라운드 갱신 완료
+        assert cache.peek("k")[0] == 2
+        assert await cache.get("k", loader, allow_stale=False) == 3
+
+    asyncio.run(scenario())
+    assert cache.stats()["refreshes"] == 1
+
+
+def test_invalidate_discards_inflight_result_and_bounds_size():
+    cache = SWRCache(ttl=10, maxsize=2)
+    loader = Loader()
+
+    async def scenario():
+        task = asyncio.create_task(cache.get("k", loader))
+        await asyncio.sleep(0)
+        cache.invalidate("k")
+        await task
+        assert cache.peek("k") is None
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+
+    asyncio.run(scenario())
+    assert cache.stats()["size"] == 2
@@ -0,0 +1,105 @@
+"""서버 시각 오프셋(RTT/2 보정)과 서명 요청 timestamp 처리 테스트"""
+
+import asyncio
+import hashlib
+import hmac
+
+import httpx
+
+from app.clients import clock_sync as clock_module
+from app.clients.binance_client import BinanceFuturesClient
+from app.clients.clock_sync import ClockSync
+
+
+class FakeClock:
+    """time.time / time.perf_counter 대체 - 요청 중에만 시간이 흐름"""
+
+    def __init__(self, wall: float) -> None:
+        self.wall = wall
+        self.perf = 0.0
+
+    def time(self) -> float:
+        return self.wall
+
+    def perf_counter(self) -> float:
+        return self.perf
+
+    def advance(self, seconds: float) -> None:
+        self.wall += seconds
+        self.perf += seconds
+
+
+def _patch(monkeypatch, fake: FakeClock) -> None:
+    monkeypatch.setattr(clock_module.time, "time", fake.time)
+    monkeypatch.setattr(clock_module.time, "perf_counter", fake.perf_counter)
+
+
+def test_offset_is_corrected_by_half_rtt(monkeypatch):
+    fake = FakeClock(wall=1_000.0)
+    _patch(monkeypatch, fake)
+    clock = ClockSync(interval_seconds=60)
+
+    async def fetch() -> int:
+        fake.advance(0.2)  # RTT 200ms, 서버는 중간 지점(+100ms)에 응답 생성
+        return 1_000_150
+
+    sample = asyncio.run(clock.sync(fetch))
+
+    assert sample.rtt_ms == 200
+    # 로컬 중간 지점 1_000_100ms 대비 서버가 50ms 앞섬
+    assert sample.offset_ms == 50
+    assert clock.is_synced
+    assert clock.now_ms() == 1_000_200 + 50
+
+
+def test_drift_tracks_consecutive_samples(monkeypatch):
+    fake = FakeClock(wall=1_000.0)
+    _patch(monkeypatch, fake)
+    clock = ClockSync(interval_seconds=60, history_size=2)
+
+    async def fetch(server_ms: int) -> int:
+        return server_ms
+
+    asyncio.run(clock.sync(lambda: fetch(1_000_300)))
+    asyncio.run(clock.sync(lambda: fetch(1_000_250)))
+
+    assert clock.offset_ms == 250
+    assert clock.drift_ms() == -50
+    assert [s["offsetMs"] for s in clock.snapshot()["history"]] == [300, 250]
+
+
+def test_signed_request_uses_server_timestamp(monkeypatch):
+    fake = FakeClock(wall=1_700_000_000.0)
+    _patch(monkeypatch, fake)
+    server_ms = 1_700_000_002_000  # 서버가 2초 앞섬
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/fapi/v1/time":
+            return httpx.Response(200, json={"serverTime": server_ms})
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    client = BinanceFuturesClient(
+        api_key="k", api_secret="s", clock=ClockSync(interval_seconds=60)
+    )
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    async def run():
+        # 콜드 스타트: 첫 서명 요청 전에 한 번 동기화
+        await client._signed_request("GET", "/fapi/v2/account", {"recvWindow": 5000})
+        await client._signed_request("GET", "/fapi/v2/account")
+        await client.close()
+
+    asyncio.run(run())
+
+    assert client.clock.offset_ms == 2_000
+    first, second = (dict(r.url.params) for r in seen)
+    assert int(first["timestamp"]) == server_ms
+    assert first["recvWindow"] == "5000"  # 호출자가 준 recvWindow는 그대로 서명됨
+    assert "recvWindow" not in second
+    query, _, signature = str(seen[0].url.query, "ascii").rpartition("&signature=")
+    expected = hmac.new(b"s", query.encode(), hashlib.sha256).hexdigest()
+    assert signature == expected
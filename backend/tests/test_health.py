@@ -0,0 +1,136 @@
+"""백그라운드 헬스 스냅샷 판정 테스트"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.core.security import ApiKeyStatus
+from app.services.health import HealthMonitor
+
+
+class FakeClock:
+    interval = 60.0
+
+    def __init__(self, age=1.0, offset_ms=12):
+        self.age = age
+        self.offset_ms = offset_ms
+
+    def last_sync_age(self):
+        return self.age
+
+
+class FakeLimiter:
+    weight_limit = 2400
+
+    def __init__(self, remaining=2000, banned_ms=0):
+        self.remaining_weight = remaining
+        self.banned_ms = banned_ms
+
+    def metrics(self):
+        return {"bannedForMs": self.banned_ms}
+
+
+class FakeMarketStream:
+    def __init__(self, connected=True, lag=0.2):
+        self.connected = connected
+        self._lag = lag
+
+    def lag(self):
+        return self._lag
+
+
+def _key(valid=True):
+    return ApiKeyStatus(
+        is_valid=valid,
+        has_futures_permission=valid,
+        rate_limit_remaining=0,
+        last_check=datetime(2024, 1, 1),
+        error_message=None if valid else "Invalid API key",
+    )
+
+
+def _monitor(
+    clock=None, key=None, limiter=None, market=None, role="standalone", **kwargs
+):
+    client = SimpleNamespace(use_testnet=True, rate_limiter=limiter or FakeLimiter())
+    prices = SimpleNamespace(
+        stream=market if market is not None else FakeMarketStream(),
+        stream_enabled=True,
+    )
+    return HealthMonitor(
+        client=client,
+        clock=clock or FakeClock(),
+        keys=SimpleNamespace(status=_key() if key is None else key),
+        prices=prices,
+        stream=SimpleNamespace(is_live=True),
+        shared=SimpleNamespace(bus=SimpleNamespace(connected=False)),
+        interval=5.0,
+        max_stream_lag=5.0,
+        min_weight_headroom=0.1,
+        role=role,
+        **kwargs,
+    )
+
+
+def test_snapshot_unknown_before_first_refresh():
+    snapshot = _monitor().snapshot()
+    assert snapshot["status"] == "unknown"
+    assert snapshot["ageSec"] is None
+
+
+def test_snapshot_all_ok():
+    monitor = _monitor()
+    asyncio.run(monitor._refresh())
+    snapshot = monitor.snapshot()
+    assert snapshot["status"] == "ok"
+    assert snapshot["ageSec"] == 0.0
+    binance = snapshot["components"]["binance"]
+    assert binance["reachable"] is True
+    assert binance["tsOffsetMs"] == 12
+    assert binance["testnet"] is True
+
+
+def test_unreachable_binance_and_invalid_key_are_errors():
+    monitor = _monitor(clock=FakeClock(age=None), key=_key(valid=False))
+    asyncio.run(monitor._refresh())
+    snapshot = monitor.snapshot()
+    assert snapshot["status"] == "error"
+    assert snapshot["components"]["binance"]["status"] == "error"
+    assert snapshot["components"]["apiKey"]["errorMessage"] == "Invalid API key"
+
+
+def test_lagging_stream_and_low_headroom_degrade():
+    monitor = _monitor(
+        market=FakeMarketStream(connected=True, lag=30.0),
+        limiter=FakeLimiter(remaining=100),
+    )
+    asyncio.run(monitor._refresh())
+    snapshot = monitor.snapshot()
+    assert snapshot["status"] == "degraded"
+    assert snapshot["components"]["streams"]["status"] == "degraded"
+    assert snapshot["components"]["rateLimit"]["status"] == "degraded"
+
+
+def test_unchecked_api_key_reports_degraded():
+    monitor = _monitor(key=False)
+    monitor.keys.status = None
+    asyncio.run(monitor._refresh())
+    snapshot = monitor.snapshot()
+    assert snapshot["components"]["apiKey"]["status"] == "unknown"
+    assert snapshot["status"] == "degraded"
+
+
+def test_stale_snapshot_reports_degraded():
+    monitor = _monitor()
+    asyncio.run(monitor._refresh())
+    monitor._computed_at -= 60  # 계산 루프가 멈춘 상황
+    snapshot = monitor.snapshot()
+    assert snapshot["status"] == "degraded"
+    assert snapshot["ageSec"] >= 60
+
+
+def test_worker_checks_shared_state_instead_of_streams():
+    monitor = _monitor(role="worker")
+    asyncio.run(monitor._refresh())
+    streams = monitor.snapshot()["components"]["streams"]
+    assert streams == {"status": "degraded", "sharedState": False}
@@ -0,0 +1,28 @@
+"""사전 압축 응답의 인코딩 협상/ETag 조건부 요청 테스트"""
+
+import gzip
+
+from app.utils.http_cache import EncodedBody, precompressed_response
+
+BODY = EncodedBody.build(b'{"symbols": []}')
+
+
+def test_gzip_negotiated_with_per_encoding_etag():
+    resp = precompressed_response({"accept-encoding": "gzip"}, BODY)
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["etag"] == BODY.etag("gzip")
+    assert gzip.decompress(resp.body) == BODY.identity
+
+
+def test_not_modified_only_for_negotiated_representation():
+    gzip_etag = BODY.etag("gzip")
+    resp = precompressed_response(
+        {"accept-encoding": "gzip", "if-none-match": gzip_etag}, BODY
+    )
+    assert resp.status_code == 304
+
+    # gzip 표현의 ETag로 identity 표현을 요청하면 본문을 보내야 함
+    resp = precompressed_response({"if-none-match": gzip_etag}, BODY)
+    assert resp.status_code == 200
+    assert resp.body == BODY.identity
+    assert resp.headers["etag"] == BODY.etag()
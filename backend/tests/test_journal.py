@@ -0,0 +1,38 @@
+"""TradeJournal 배치 기록/종료 시 flush 테스트"""
+
+import asyncio
+import csv
+
+from app.services.journal import TRADE_FIELDNAMES, TradeJournal
+
+
+def test_batches_rows_and_flushes_on_stop(tmp_path):
+    path = tmp_path / "trades.csv"
+    journal = TradeJournal(path=path, batch_size=10, flush_interval=0.01)
+
+    async def scenario():
+        journal.start()
+        for i in range(25):
+            journal.record({"symbol": "BTCUSDT", "orderId": i, "trade_result": "OK"})
+        assert not path.exists() or journal.queue_depth > 0  # 요청 경로는 큐잉만
+        await journal.stop()
+
+    asyncio.run(scenario())
+
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert [r["order_id"] for r in rows] == [str(i) for i in range(25)]
+    assert list(rows[0].keys()) == TRADE_FIELDNAMES
+    assert journal.stats()["rowsWritten"] == 25
+
+
+def test_records_synchronously_when_not_started(tmp_path):
+    path = tmp_path / "trades.csv"
+    journal = TradeJournal(path=path, fsync_policy="none")
+
+    journal.record({"symbol": "ETHUSDT", "origQty": "1.5"}, quantity_key="origQty")
+
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert rows[0]["symbol"] == "ETHUSDT"
+    assert rows[0]["quantity"] == "1.5"
@@ -0,0 +1,78 @@
+"""심볼별 레버리지 캐시 (중복 set_leverage 생략/오류 시 무효화) 테스트"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.leverage import LeverageManager
+from app.services.user_stream import AccountState
+
+
+def _error(status, body):
+    request = httpx.Request("POST", "https://fapi/fapi/v1/leverage")
+    response = httpx.Response(status, json=body, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class FakeClient:
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+
+    async def set_leverage(self, symbol, leverage):
+        self.calls.append((symbol, leverage))
+        if self.error is not None:
+            raise self.error
+        return {"symbol": symbol, "leverage": leverage}
+
+
+def test_skips_call_when_cached_leverage_matches():
+    client = FakeClient()
+    manager = LeverageManager(client=client, ttl=30)
+    manager.seed([{"symbol": "BTCUSDT", "leverage": "10"}])
+
+    assert asyncio.run(manager.ensure("BTCUSDT", 10)) is False
+    assert client.calls == []
+    assert asyncio.run(manager.ensure("BTCUSDT", 20)) is True
+    assert asyncio.run(manager.ensure("BTCUSDT", 20)) is False
+    assert client.calls == [("BTCUSDT", 20)]
+    assert manager.stats() == {"symbols": 1, "skipped": 2, "updated": 1}
+
+
+def test_expired_entry_is_set_again():
+    client = FakeClient()
+    manager = LeverageManager(client=client, ttl=0)
+    manager.record("BTCUSDT", 10)
+    assert asyncio.run(manager.ensure("BTCUSDT", 10)) is True
+    assert client.calls == [("BTCUSDT", 10)]
+
+
+def test_not_modified_response_counts_as_set():
+    client = FakeClient(error=_error(400, {"code": -4028, "msg": "Not modified"}))
+    manager = LeverageManager(client=client, ttl=30)
+
+    assert asyncio.run(manager.ensure("BTCUSDT", 5)) is False
+    assert manager.get("BTCUSDT") == 5
+    assert asyncio.run(manager.ensure("BTCUSDT", 5)) is False
+    assert len(client.calls) == 1
+
+
+def test_error_invalidates_cached_value():
+    client = FakeClient(error=_error(400, {"code": -4161, "msg": "Leverage reduction"}))
+    manager = LeverageManager(client=client, ttl=30)
+    manager.record("BTCUSDT", 10)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(manager.ensure("BTCUSDT", 20))
+    assert manager.get("BTCUSDT") is None  # 실제 값을 모르므로 다음 주문에서 다시 설정
+
+
+def test_account_config_update_replaces_cached_value():
+    from app.services.leverage import leverage_manager
+
+    leverage_manager.record("ETHUSDT", 10)
+    AccountState().apply_event(
+        {"e": "ACCOUNT_CONFIG_UPDATE", "T": 1, "ac": {"s": "ETHUSDT", "l": 25}}
+    )
+    assert leverage_manager.get("ETHUSDT") == 25
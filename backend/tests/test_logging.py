@@ -0,0 +1,67 @@
+"""로그 라이터 스레드(QueueListener) 수명 주기와 종료 시 플러시 테스트"""
+
+import io
+import logging
+import threading
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import logging as app_logging
+from app.core.logging import setup_logger, start_logging, stop_logging
+
+
+class SlowStream(io.StringIO):
+    """라이터 스레드가 큐를 비우는 중에 종료가 호출되도록 출력을 지연"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: set[str] = set()
+        self.gate = threading.Event()
+
+    def write(self, s: str) -> int:
+        self.threads.add(threading.current_thread().name)
+        self.gate.wait(0.01)
+        return super().write(s)
+
+
+def test_listener_follows_app_lifespan_and_flushes_on_shutdown():
+    logger = setup_logger()
+    stream = SlowStream()
+    previous = app_logging._stream_handler.setStream(stream)
+    try:
+        stop_logging()
+
+        @asynccontextmanager
+        async def lifespan(app):
+            start_logging()
+            try:
+                yield
+            finally:
+                stop_logging()
+
+        app = FastAPI(lifespan=lifespan)
+        test_logger = logging.getLogger("app.test_logging")
+
+        with TestClient(app):
+            assert app_logging._listener is not None
+            assert app_logging._queue_handler in logger.handlers
+            for i in range(20):
+                test_logger.warning("queued %d", i)
+
+        # 종료 시 큐에 남은 기록까지 모두 출력되고 라이터 스레드는 정리됨
+        lines = stream.getvalue().splitlines()
+        assert [line.rsplit("msg=", 1)[1] for line in lines] == [
+            f"queued {i}" for i in range(20)
+        ]
+        assert threading.main_thread().name not in stream.threads
+        assert app_logging._listener is None
+
+        # 종료 이후의 로그는 스트림 핸들러가 직접 출력
+        test_logger.warning("after shutdown")
+        assert stream.getvalue().endswith("msg=after shutdown\n")
+        assert threading.main_thread().name in stream.threads
+    finally:
+        app_logging._stream_handler.setStream(previous)
+        start_logging()
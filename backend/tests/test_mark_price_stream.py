@@ -0,0 +1,92 @@
+"""PriceCache + 마크프라이스 스트림 테스트 (로컬 WebSocket 서버 사용)"""
+
+import asyncio
+import json
+from decimal import Decimal
+
+from websockets.asyncio.server import serve
+
+from app.services.price_cache import PriceCache
+
+
+def mark_event(symbol: str, price: str) -> dict:
+    return {
+        "e": "markPriceUpdate",
+        "E": 1562305380000,
+        "s": symbol,
+        "p": price,
+        "i": price,
+        "r": "0.00038167",
+        "T": 1562306400000,
+    }
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_mark_price(self, symbol=None):
+        self.calls += 1
+        return {"symbol": symbol, "markPrice": "100.5", "time": 1}
+
+
+def test_stream_fills_table_and_reconnects():
+    connections = []
+
+    async def handler(ws):
+        connections.append(ws)
+        price = "50000.1" if len(connections) == 1 else "50100.2"
+        await ws.send(json.dumps([mark_event("BTCUSDT", price)]))
+        if len(connections) == 1:
+            await ws.close()  # 첫 연결은 끊어 재연결 유도
+            return
+        await ws.wait_closed()
+
+    async def scenario():
+        async with serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            cache = PriceCache(client=FakeClient(), stream_url=f"ws://127.0.0.1:{port}")
+            cache.start()
+            cache.stream._reconnect_min = 0.01
+            try:
+                for _ in range(100):
+                    entry = cache.get("BTCUSDT")
+                    if entry and entry.mark_price == Decimal("50100.2"):
+                        break
+                    await asyncio.sleep(0.02)
+                assert cache.get("BTCUSDT").mark_price == Decimal("50100.2")
+                assert cache.stream.reconnects >= 1
+                assert await cache.get_mark_price("BTCUSDT") == Decimal("50100.2")
+                assert cache.rest_fallbacks == 0
+            finally:
+                await cache.stop()
+
+    asyncio.run(scenario())
+
+
+def test_stale_entry_falls_back_to_rest():
+    client = FakeClient()
+    cache = PriceCache(client=client, max_age=0.0, stream_enabled=False)
+    cache.apply_stream_update({"stream": "x", "data": [mark_event("ETHUSDT", "1")]})
+
+    price = asyncio.run(cache.get_mark_price("ETHUSDT"))
+
+    assert price == Decimal("100.5")
+    assert client.calls == 1
+    assert cache.stats()["restFallbacks"] == 1
+
+
+def test_failing_listener_does_not_block_others():
+    cache = PriceCache(client=FakeClient(), stream_enabled=False)
+    received = []
+
+    def broken(events):
+        raise RuntimeError("boom")
+
+    cache.add_listener(broken)
+    cache.add_listener(received.append)
+    cache.apply_stream_update([mark_event("BTCUSDT", "100")])
+    cache.apply_stream_update([mark_event("BTCUSDT", "101")])
+
+    assert [events[0]["p"] for events in received] == ["100", "101"]
+    assert cache.get("BTCUSDT") is not None
@@ -0,0 +1,104 @@
+"""Prometheus 메트릭 레지스트리/미들웨어/업스트림 계측 테스트"""
+
+import asyncio
+
+import httpx
+
+from app.clients.binance_client import BinanceFuturesClient
+from app.utils.metrics import (
+    MetricsRegistry,
+    upstream_request_duration,
+    upstream_retries,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    hist = registry.histogram("lat_seconds", "latency", ("route",), buckets=(0.1, 0.8))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        hist.observe(("/api/x",), value)
+    registry.callback("depth", "queue depth", lambda: {(): 3})
+
+    text = registry.render()
+    assert 'lat_seconds_bucket{route="/api/x",le="0.1"} 2' in text
+    assert 'lat_seconds_bucket{route="/api/x",le="0.8"} 3' in text
+    assert 'lat_seconds_bucket{route="/api/x",le="+Inf"} 4' in text
+    assert 'lat_seconds_count{route="/api/x"} 4' in text
+    assert "# TYPE depth gauge\ndepth 3" in text
+
+
+def test_upstream_latency_and_retries_recorded():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"symbols": []})
+
+    client = BinanceFuturesClient(api_key="k", api_secret="s")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    labels = ("GET", "/fapi/v1/exchangeInfo", "503")
+    before = upstream_request_duration.count(labels)
+    retries = upstream_retries.value(("get_exchange_info",))
+
+    assert asyncio.run(client.get_exchange_info()) == {"symbols": []}
+    assert upstream_request_duration.count(labels) == before + 1
+    assert upstream_retries.value(("get_exchange_info",)) == retries + 1
+
+
+def test_metrics_endpoint_uses_route_templates():
+    from app.main import app
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            await c.get("/healthz")
+            return await c.get("/metrics")
+
+    resp = asyncio.run(scenario())
+    assert resp.status_code == 200
+    assert resp.headers["server-timing"].startswith("total;dur=")
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/healthz",status="200"}'
+        in resp.text
+    )
+    assert "journal_queue_depth 0" in resp.text
+    assert "# TYPE cache_lookups_total counter" in resp.text
+
+
+def test_server_timing_lists_upstream_spans():
+    from app.utils.tracing import end_trace, span, start_trace
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[])
+
+    client = BinanceFuturesClient(api_key="k", api_secret="s")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    async def scenario():
+        trace, token = start_trace("req-1")
+        with span("leverage"):
+            pass
+        await client.get_mark_price("BTCUSDT")
+        await client.get_mark_price("ETHUSDT")
+        end_trace(trace, token)
+        await client.get_mark_price("BTCUSDT")  # 종료 후 구간은 무시
+        return trace
+
+    trace = asyncio.run(scenario())
+    assert [name for name, _ in trace.spans] == [
+        "leverage",
+        "premiumIndex",
+        "premiumIndex",
+    ]
+    header = trace.server_timing(12.0)
+    assert header.startswith("leverage;dur=")
+    assert "premiumIndex-2;dur=" in header
+    assert header.endswith("total;dur=12.0")
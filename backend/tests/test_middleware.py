@@ -0,0 +1,95 @@
+"""순수 ASGI 접근 로그 미들웨어 테스트 (에러 엔벨로프, 스트리밍 통과)"""
+
+import asyncio
+import json
+
+import httpx
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.utils.metrics import http_request_duration
+from app.utils.middleware import AccessLogMiddleware
+
+
+def _scope(path="/stream"):
+    return {"type": "http", "method": "GET", "path": path, "headers": []}
+
+
+def _run(app, scope):
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(AccessLogMiddleware(app)(scope, receive, send))
+    return sent
+
+
+def test_streaming_body_passes_through_unbuffered():
+    chunks = [b"event: a\n\n", b"event: b\n\n", b""]
+
+    async def app(scope, receive, send):
+        assert scope["state"]["request_id"]
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for i, chunk in enumerate(chunks):
+            more = i < len(chunks) - 1
+            await send({"type": "http.response.body", "body": chunk, "more_body": more})
+
+    before = http_request_duration.count(("GET", "unmatched", "200"))
+    sent = _run(app, _scope())
+    start, *bodies = sent
+    assert dict(start["headers"])[b"server-timing"].startswith(b"total;dur=")
+    assert [m["body"] for m in bodies] == chunks  # 메시지 단위 그대로 전달
+    assert http_request_duration.count(("GET", "unmatched", "200")) == before + 1
+
+
+def test_unhandled_error_returns_envelope():
+    async def app(scope, receive, send):
+        raise RuntimeError("boom")
+
+    start, body = _run(app, _scope("/api/order"))
+    assert start["status"] == 500
+    payload = json.loads(body["body"])
+    assert payload["code"] == "UNHANDLED_ERROR"
+    assert payload["requestId"]
+
+
+def test_non_http_scopes_are_untouched():
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(scope["type"])
+
+    _run(app, {"type": "lifespan"})
+    assert seen == ["lifespan"]
+
+
+def test_starlette_streaming_response_sent_from_child_task():
+    # StreamingResponse는 (ASGI < 2.4에서) 자식 태스크에서 send를 호출하므로
+    # send 안에서 컨텍스트 변수를 되돌리면 다른 Context 오류가 난다
+    async def events():
+        yield b"event: a\n\n"
+        yield b"event: b\n\n"
+
+    async def stream(request):
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    async def plain(request):
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route("/stream", stream), Route("/plain", plain)])
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=AccessLogMiddleware(app))
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await c.get("/plain"), await c.get("/stream")
+
+    plain_resp, stream_resp = asyncio.run(scenario())
+    assert plain_resp.status_code == 200
+    assert stream_resp.status_code == 200
+    assert stream_resp.text == "event: a\n\nevent: b\n\n"
+    assert stream_resp.headers["server-timing"].startswith("total;dur=")
@@ -0,0 +1,93 @@
+"""PositionFeed 공용 갱신/델타 팬아웃/느린 구독자 처리 테스트"""
+
+import asyncio
+
+from app.models.schemas import Position
+from app.services.position_feed import PositionFeed, format_sse
+from app.services.position_versions import PositionVersions
+from app.services.user_stream import leg_name, position_key
+
+
+def _position(symbol, amt, side="BOTH"):
+    return Position(
+        symbol=symbol,
+        positionAmt=amt,
+        entryPrice="100",
+        leverage=5,
+        unRealizedProfit="0",
+        marginType="cross",
+        positionSide=side,
+    )
+
+
+class FakePositions:
+    """PositionService 대역 - 조회할 때마다 버전 추적기에 관측"""
+
+    def __init__(self):
+        self.current = [_position("BTCUSDT", "1"), _position("ETHUSDT", "2")]
+        self.versions = PositionVersions()
+        self.calls = 0
+
+    async def get_positions(self):
+        self.calls += 1
+        self.versions.observe({leg_name(position_key(p)): p for p in self.current})
+        return list(self.current)
+
+
+def test_deltas_fan_out_from_one_poll_loop():
+    positions = FakePositions()
+    feed = PositionFeed(positions=positions, interval=0.01)
+
+    async def scenario():
+        async with feed.subscription() as fast, feed.subscription() as slow:
+            slow.queue = asyncio.Queue(1)  # 느린 구독자
+            first = await feed.next_event(fast)
+            assert first["type"] == "snapshot"
+            # SSE 버전은 REST(ETag/X-Positions-Version)와 같은 카운터
+            assert first["version"] == positions.versions.version
+            assert {p["key"] for p in first["positions"]} == {"BTCUSDT", "ETHUSDT"}
+            slow.needs_snapshot = False
+
+            positions.current = [_position("BTCUSDT", "3")]
+            delta = await feed.next_event(fast)
+            assert delta["type"] == "delta"
+            assert delta["version"] == positions.versions.version > first["version"]
+            assert [p["positionAmt"] for p in delta["changed"]] == ["3"]
+            assert delta["closed"] == ["ETHUSDT"]
+
+            positions.current = [_position("BTCUSDT", "4")]
+            await feed.next_event(fast)
+            await asyncio.sleep(0.05)
+            # 큐가 넘친 구독자는 밀린 델타 대신 최신 전체 스냅샷을 받음
+            caught_up = await feed.next_event(slow)
+            assert caught_up["type"] == "snapshot"
+            assert caught_up["version"] == positions.versions.version
+            assert "event: snapshot" in format_sse(caught_up)
+
+        assert not feed.stats()["running"]  # 마지막 구독자가 떠나면 루프 정지
+
+    asyncio.run(scenario())
+    assert feed.dropped >= 1
+    assert positions.calls < 50  # 구독자 수가 아닌 주기에 비례
+
+
+def test_hedge_legs_carry_their_own_key():
+    positions = FakePositions()
+    positions.current = [
+        _position("BTCUSDT", "1", "LONG"),
+        _position("BTCUSDT", "-2", "SHORT"),
+    ]
+    feed = PositionFeed(positions=positions, interval=0.01)
+
+    async def scenario():
+        async with feed.subscription() as subscriber:
+            snapshot = await feed.next_event(subscriber)
+            legs = {p["key"] for p in snapshot["positions"]}
+            assert legs == {"BTCUSDT:LONG", "BTCUSDT:SHORT"}
+
+            positions.current = [_position("BTCUSDT", "1", "LONG")]
+            delta = await feed.next_event(subscriber)
+            # closed는 changed 항목의 key와 같은 형식
+            assert delta["closed"] == ["BTCUSDT:SHORT"]
+
+    asyncio.run(scenario())
@@ -0,0 +1,87 @@
+"""계좌 스냅샷 기반 포지션/잔고 캐시 및 심볼별 무효화 테스트"""
+
+import asyncio
+
+from app.services.account import AccountSnapshotService
+from app.services.balance import BalanceService
+from app.services.position import PositionService
+
+
+def _row(symbol, amt):
+    return {"symbol": symbol, "positionAmt": amt, "entryPrice": "1", "leverage": "5"}
+
+
+class FakeClient:
+    def __init__(self):
+        self.rows = {"BTCUSDT": "0.010", "ETHUSDT": "-0.5", "XRPUSDT": "0"}
+        self.calls = []
+
+    async def get_account_info(self):
+        self.calls.append("account")
+        await asyncio.sleep(0.01)
+        return {
+            "positions": [
+                {**_row(s, amt), "unrealizedProfit": "2", "isolated": True}
+                for s, amt in self.rows.items()
+            ],
+            "assets": [{"asset": "USDT", "walletBalance": "100"}, {"asset": "BNB"}],
+        }
+
+    async def get_position_risk(self, symbol=None):
+        self.calls.append(symbol)
+        return [_row(symbol, self.rows[symbol])]
+
+
+def _services(client):
+    account = AccountSnapshotService(client=client)
+    return (
+        account,
+        PositionService(client=client, account=account),
+        BalanceService(account=account),
+    )
+
+
+def test_one_account_call_fills_positions_and_balances():
+    client = FakeClient()
+    account, positions, balances = _services(client)
+
+    async def scenario():
+        return await asyncio.gather(positions.get_positions(), balances.get_balances())
+
+    everything, assets = asyncio.run(scenario())
+    assert client.calls == ["account"]  # 동시 만료된 두 뷰가 한 호출을 공유
+    assert {p.symbol for p in everything} == {"BTCUSDT", "ETHUSDT"}
+    assert everything[0].marginType == "isolated"
+    assert everything[0].unRealizedProfit == "2"
+    assert [b.balance for b in assets] == ["100", "0"]
+    assert account.stats()["fetches"] == 1
+
+
+def test_symbol_views_share_one_snapshot_and_invalidate_per_symbol():
+    client = FakeClient()
+    _, service, _ = _services(client)
+
+    async def scenario():
+        await service.get_positions()
+        btc = await service.get_positions("BTCUSDT")
+        assert [p.positionAmt for p in btc] == ["0.010"]
+        assert await service.get_positions("XRPUSDT") == []
+        assert client.calls == ["account"]  # 심볼별 조회는 스냅샷에서 응답
+
+        client.rows["BTCUSDT"] = "0"
+        client.rows["ETHUSDT"] = "-1.0"
+        service.invalidate("BTCUSDT")
+        assert await service.get_positions("BTCUSDT") == []
+        assert client.calls == ["account", "BTCUSDT"]  # 낡은 심볼만 다시 조회
+        # 다른 심볼은 기존 스냅샷 값 유지
+        eth = await service.get_positions("ETHUSDT")
+        assert [p.positionAmt for p in eth] == ["-0.5"]
+
+        service.invalidate("ETHUSDT")
+        everything = await service.get_positions()
+        assert [p.positionAmt for p in everything] == ["-1.0"]
+        assert client.calls == ["account", "BTCUSDT", "account"]
+
+    asyncio.run(scenario())
+    assert service.stats()["symbolRefreshes"] == 1
+    assert service.stats()["dirtySymbols"] == 0
@@ -0,0 +1,135 @@
+"""포지션 스냅샷 버전/델타/롱폴/ETag 테스트"""
+
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.v1.endpoints import positions as positions_endpoint
+from app.services.account import AccountSnapshotService
+from app.services.position import PositionService
+from app.services.position_feed import PositionFeed
+from app.services.price_cache import PriceCache
+from app.services.user_stream import UserDataStream
+
+
+class FakeClient:
+    def __init__(self):
+        self.rows = {"BTCUSDT": "0.1", "ETHUSDT": "1"}
+
+    def account(self):
+        return {
+            "positions": [
+                {"symbol": s, "positionAmt": amt, "entryPrice": "1", "leverage": "5"}
+                for s, amt in self.rows.items()
+            ]
+        }
+
+    async def get_account_info(self):
+        return self.account()
+
+
+def _service():
+    client = FakeClient()
+    account = AccountSnapshotService(client=client)
+    return client, account, PositionService(client=client, account=account)
+
+
+def test_versions_track_changed_and_closed_symbols():
+    client, _, service = _service()
+
+    async def scenario():
+        await service.get_positions()
+        first = service.versions.version
+        await service.get_positions()
+        assert service.versions.version == first  # 변경 없으면 버전 유지
+        assert service.versions.changes_since(first) == ([], [])
+
+        client.rows = {"BTCUSDT": "0.2"}
+        service.invalidate()
+        await service.get_positions()
+        changed, closed = service.versions.changes_since(first)
+        assert service.versions.version > first
+        assert [p.positionAmt for p in changed] == ["0.2"]
+        assert closed == ["ETHUSDT"]
+        assert service.versions.changes_since(0) is None  # 이전 프로세스 버전
+
+    asyncio.run(scenario())
+
+
+def test_long_poll_wakes_on_account_snapshot():
+    client, account, service = _service()
+
+    async def scenario():
+        await service.get_positions()
+        since = service.versions.version
+        started = time.monotonic()
+        waiter = asyncio.create_task(service.wait_for_change(since, timeout=5))
+        await asyncio.sleep(0.05)
+        client.rows["BTCUSDT"] = "0.5"
+        account.apply(client.account())  # 다른 경로의 계좌 조회가 대기자를 깨움
+        assert await waiter > since
+        assert time.monotonic() - started < 1
+
+    asyncio.run(scenario())
+
+
+def test_cached_path_uses_mark_pnl_and_feed_shares_version():
+    client = FakeClient()
+    account = AccountSnapshotService(client=client)
+    prices = PriceCache(client=client, stream_enabled=False, max_age=60)
+    stream = UserDataStream(
+        client=client, account=account, enabled=False, prices=prices
+    )
+    service = PositionService(client=client, account=account, stream=stream)
+    feed = PositionFeed(positions=service, interval=0.01)
+
+    async def scenario():
+        prices.apply_stream_update([{"s": "BTCUSDT", "p": "3", "E": 1}])
+        [btc] = await service.get_positions(symbol="BTCUSDT")
+        # 스트림 경로와 같은 계산: 0.1 * (3 - 1)
+        assert btc.unRealizedProfit == "0.20000000"
+        before = service.versions.version
+
+        async with feed.subscription() as subscriber:
+            snapshot = await feed.next_event(subscriber)
+            assert snapshot["version"] == service.versions.version
+            # 마크프라이스가 움직이면 REST 버전이 오르고 SSE 델타가 같은 버전으로 나감
+            prices.apply_stream_update([{"s": "BTCUSDT", "p": "5", "E": 2}])
+            delta = await feed.next_event(subscriber)
+            assert delta["version"] == service.versions.version > before
+            assert [p["unRealizedProfit"] for p in delta["changed"]] == ["0.40000000"]
+
+    asyncio.run(scenario())
+
+
+def test_endpoint_etag_and_delta(monkeypatch):
+    client, _, service = _service()
+    monkeypatch.setattr(positions_endpoint, "position_service", service)
+    app = FastAPI()
+    app.include_router(positions_endpoint.router, prefix="/api")
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as http:
+            resp = await http.get("/api/positions")
+            assert len(resp.json()) == 2
+            etag = resp.headers["etag"]
+
+            resp = await http.get("/api/positions", headers={"If-None-Match": etag})
+            assert resp.status_code == 304
+
+            version = int(resp.headers["x-positions-version"])
+            client.rows.pop("ETHUSDT")
+            service.invalidate()
+            resp = await http.get("/api/positions", params={"since": version})
+            body = resp.json()
+            assert (body["full"], body["changed"], body["closed"]) == (
+                False,
+                [],
+                ["ETHUSDT"],
+            )
+            assert resp.headers["etag"] != etag
+
+    asyncio.run(scenario())
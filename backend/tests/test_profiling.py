@@ -0,0 +1,66 @@
+"""요청 단위 프로파일링 훅 테스트 (헤더/무장/다운로드)"""
+
+import asyncio
+import marshal
+
+import httpx
+
+from app.utils.profiling import request_profiler
+
+
+def _run(requests):
+    from app.main import app
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return [await c.request(*args, **kwargs) for args, kwargs in requests]
+
+    return asyncio.run(scenario())
+
+
+def test_profiling_disabled_without_token(monkeypatch):
+    monkeypatch.setattr(request_profiler, "token", "")
+    plain, admin = _run(
+        [
+            (("GET", "/healthz"), {"headers": {"X-Profile-Token": "x"}}),
+            (("GET", "/api/admin/profiling"), {}),
+        ]
+    )
+    assert "x-profile-id" not in plain.headers
+    assert admin.status_code == 404
+
+
+def test_header_and_armed_requests_are_profiled(monkeypatch):
+    monkeypatch.setattr(request_profiler, "token", "secret")
+    auth = {"X-Profile-Token": "secret"}
+    wrong, by_header, arm, armed, after, listing = _run(
+        [
+            (("GET", "/healthz"), {"headers": {"X-Profile-Token": "nope"}}),
+            (("GET", "/healthz"), {"headers": auth}),
+            (
+                ("POST", "/api/admin/profiling/arm"),
+                {"params": {"path": "/healthz"}, "headers": auth},
+            ),
+            (("GET", "/healthz"), {}),
+            (("GET", "/healthz"), {}),
+            (("GET", "/api/admin/profiling"), {"headers": auth}),
+        ]
+    )
+    assert "x-profile-id" not in wrong.headers
+    assert arm.json()["armed"] == {"/healthz": 1}
+    assert "x-profile-id" not in after.headers  # 무장은 1회만 소모
+    ids = [p["id"] for p in listing.json()["profiles"]]
+    assert ids[:2] == [armed.headers["x-profile-id"], by_header.headers["x-profile-id"]]
+
+    dump, report = _run(
+        [
+            (("GET", f"/api/admin/profiling/{ids[0]}"), {"headers": auth}),
+            (
+                ("GET", f"/api/admin/profiling/{ids[0]}"),
+                {"params": {"format": "text"}, "headers": auth},
+            ),
+        ]
+    )
+    assert isinstance(marshal.loads(dump.content), dict)
+    assert "function calls" in report.text
@@ -0,0 +1,89 @@
+"""WeightRateLimiter 동작 테스트"""
+
+import asyncio
+
+from app.clients.rate_limiter import Priority, WeightRateLimiter, endpoint_weight
+
+
+class FakeClock:
+    def __init__(self, now_ms: int = 0):
+        self.now = now_ms
+
+    def __call__(self) -> int:
+        return self.now
+
+
+def test_endpoint_weight_depends_on_symbol():
+    assert endpoint_weight("/fapi/v1/premiumIndex", {"symbol": "BTCUSDT"}) == 1
+    assert endpoint_weight("/fapi/v1/premiumIndex") == 10
+    assert endpoint_weight("/fapi/v2/positionRisk") == 5
+    assert endpoint_weight("/fapi/v1/unknown") == 1
+
+
+def test_headers_override_local_usage():
+    limiter = WeightRateLimiter(weight_limit=100, read_reserve=10, now_ms=FakeClock())
+    limiter.update_from_headers(
+        {"x-mbx-used-weight-1m": "42", "x-mbx-order-count-10s": "3"}
+    )
+    metrics = limiter.metrics()
+    assert metrics["usedWeight1m"] == 42
+    assert metrics["remainingWeight"] == 58
+    assert metrics["orderCount10s"] == 3
+
+
+def test_reads_stop_at_reserve_but_orders_proceed():
+    clock = FakeClock()
+    limiter = WeightRateLimiter(weight_limit=100, read_reserve=20, now_ms=clock)
+    limiter.update_from_headers({"x-mbx-used-weight-1m": "80"})
+
+    async def scenario():
+        read = asyncio.create_task(
+            limiter.acquire("/fapi/v2/positionRisk", 5, Priority.READ)
+        )
+        await asyncio.sleep(0.01)
+        assert not read.done()  # 예비분 침범 불가
+
+        await asyncio.wait_for(
+            limiter.acquire("/fapi/v1/leverage", 1, Priority.ORDER), timeout=0.1
+        )
+
+        # 다음 분 윈도우로 넘어가면 대기 중인 조회도 진행
+        clock.now = 60_000
+        async with limiter._cond:
+            limiter._cond.notify_all()
+        await asyncio.wait_for(read, timeout=0.5)
+
+    asyncio.run(scenario())
+    assert limiter.metrics()["usedWeight1m"] == 5
+
+
+def test_throttle_blocks_until_retry_after():
+    clock = FakeClock()
+    limiter = WeightRateLimiter(now_ms=clock)
+    limiter.record_throttled(429, {"retry-after": "2"})
+    assert limiter.metrics()["bannedForMs"] == 2000
+    clock.now = 2_000
+    assert limiter.metrics()["bannedForMs"] == 0
+
+
+def test_shares_split_limits_and_clamp_to_ip_headroom():
+    # fetcher + 워커 3개 = 4몫: 프로세스마다 전체 한도의 1/4만 사용
+    limiter = WeightRateLimiter(
+        weight_limit=2400,
+        read_reserve=200,
+        order_limit_10s=300,
+        order_limit_1m=1200,
+        now_ms=FakeClock(),
+        shares=4,
+    )
+    assert limiter.weight_limit == 600
+    assert limiter.read_reserve == 50
+    assert limiter.order_limit_10s == 75
+
+    asyncio.run(limiter.acquire("/fapi/v2/account", 5))
+    # 전체 사용량이 낮으면 다른 프로세스 몫으로 보고 로컬 사용량 유지
+    limiter.update_from_headers({"x-mbx-used-weight-1m": "900"})
+    assert limiter.remaining_weight == 595
+    # 전체 잔여분(2400 - 2300 = 100)이 내 몫보다 작으면 그만큼으로 제한
+    limiter.update_from_headers({"x-mbx-used-weight-1m": "2300"})
+    assert limiter.remaining_weight == 100
@@ -0,0 +1,45 @@
+"""프로세스 공용 BinanceFuturesClient 재사용/재생성 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.clients import binance_client
+from app.clients.binance_client import close_shared_client, get_shared_client
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_client(monkeypatch):
+    monkeypatch.setattr(binance_client, "_shared_client", None)
+
+
+def test_shared_client_is_reused_until_closed():
+    first = get_shared_client()
+    assert get_shared_client() is first
+
+    asyncio.run(close_shared_client())
+    assert first.is_closed
+
+    second = get_shared_client()
+    assert second is not first
+    assert not second.is_closed
+    asyncio.run(close_shared_client())
+
+
+def test_recreated_client_keeps_response_listeners():
+    seen = []
+
+    def listener(resp):
+        seen.append(resp)
+
+    first = get_shared_client()
+    first.add_response_listener(listener)
+    first.add_response_listener(listener)  # 중복 등록은 무시
+    assert first._response_listeners == [listener]
+
+    asyncio.run(close_shared_client())
+    second = get_shared_client()
+
+    assert second is not first
+    assert second._response_listeners == [listener]
+    asyncio.run(close_shared_client())
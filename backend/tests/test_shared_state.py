@@ -0,0 +1,206 @@
+"""fetcher -> worker 공유 상태 (Unix 소켓 pub/sub) 테스트"""
+
+import asyncio
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+
+import httpx
+
+from app.clients.clock_sync import ClockSync
+from app.core.security import ApiKeyMonitor
+from app.services.account import AccountSnapshotService
+from app.services.journal import TradeJournal
+from app.services.price_cache import PriceCache
+from app.services.shared_state import SharedStatePublisher, SharedStateSubscriber
+from app.services.symbol_meta import SymbolMetaCache
+from app.services.user_stream import AccountState, UserDataStream
+from tests.test_symbol_meta import BTC_INFO
+
+ACCOUNT = {
+    "positions": [
+        {
+            "symbol": "BTCUSDT",
+            "positionAmt": "0.010",
+            "entryPrice": "60000",
+            "unrealizedProfit": "5",
+            "leverage": "10",
+            "isolated": False,
+            "updateTime": 1,
+        }
+    ],
+    "assets": [],
+}
+
+
+class FakeClient:
+    api_key = ""
+
+    async def get_exchange_info(self):
+        return {"symbols": [BTC_INFO]}
+
+
+class FetcherStream:
+    """fetcher 측 사용자 스트림 대역 (연결 여부만 흉내)"""
+
+    def __init__(self):
+        self.state = AccountState()
+        self.is_live = False
+
+
+async def _until(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_worker_mirrors_fetcher_state(tmp_path):
+    path = str(tmp_path / "state.sock")
+    client = FakeClient()
+    fetcher_meta = SymbolMetaCache(client=client)
+    fetcher_prices = PriceCache(client=client, stream_enabled=False)
+    fetcher_stream = FetcherStream()
+    publisher = SharedStatePublisher(
+        path, prices=fetcher_prices, meta=fetcher_meta, stream=fetcher_stream
+    )
+
+    worker_meta = SymbolMetaCache(client=client)
+    worker_prices = PriceCache(client=client, stream_enabled=False)
+    worker_stream = UserDataStream(
+        client=client, account=AccountSnapshotService(client=client), enabled=False
+    )
+    subscriber = SharedStateSubscriber(
+        path, prices=worker_prices, meta=worker_meta, stream=worker_stream
+    )
+
+    async def scenario():
+        await fetcher_meta.refresh()  # 발행자 시작 전 로드된 값도 전달
+        await publisher.start()
+        subscriber.start()
+        await _until(lambda: worker_meta.peek("BTCUSDT") is not None)
+        assert not worker_stream.is_live  # fetcher 스트림이 아직 live 아님
+
+        fetcher_prices.apply_stream_update([{"s": "BTCUSDT", "p": "61000.5", "E": 1}])
+        await _until(lambda: worker_prices.get("BTCUSDT") is not None)
+        assert worker_prices.get("BTCUSDT").mark_price == Decimal("61000.5")
+
+        fetcher_stream.is_live = True
+        fetcher_stream.state.apply_account(ACCOUNT)
+        await _until(lambda: worker_stream.is_live)
+        [position] = worker_stream.state.position_list("BTCUSDT")
+        assert position.positionAmt == "0.010"
+
+        # fetcher가 사라지면 워커는 REST 경로로 폴백
+        await publisher.stop()
+        await _until(lambda: not worker_stream.is_live)
+        await subscriber.stop()
+
+    asyncio.run(scenario())
+
+
+def test_worker_trades_are_written_by_fetcher_journal(tmp_path):
+    path = str(tmp_path / "state.sock")
+    client = FakeClient()
+    fetcher_journal = TradeJournal(
+        path=tmp_path / "trades.csv", flush_interval=0.01, fsync_policy="none"
+    )
+    publisher = SharedStatePublisher(
+        path,
+        prices=PriceCache(client=client, stream_enabled=False),
+        meta=SymbolMetaCache(client=client),
+        stream=FetcherStream(),
+        journal=fetcher_journal,
+    )
+    worker_stream = UserDataStream(
+        client=client, account=AccountSnapshotService(client=client), enabled=False
+    )
+    subscriber = SharedStateSubscriber(
+        path,
+        prices=PriceCache(client=client, stream_enabled=False),
+        meta=SymbolMetaCache(client=client),
+        stream=worker_stream,
+    )
+    worker_journal = TradeJournal(
+        path=tmp_path / "worker.csv", flush_interval=0.01, fsync_policy="none"
+    )
+    worker_journal.forward_to(subscriber.forward_trades)
+
+    async def scenario():
+        fetcher_journal.start()
+        await publisher.start()
+        subscriber.start()
+        await _until(lambda: subscriber.bus.connected)
+        worker_journal.start()
+        worker_journal.record({"symbol": "BTCUSDT", "orderId": 1})
+        worker_journal.record({"symbol": "ETHUSDT", "orderId": 2})
+        await worker_journal.stop()
+        await _until(
+            lambda: fetcher_journal.queue_depth == 0 and fetcher_journal.batches
+        )
+        await subscriber.stop()
+        await publisher.stop()
+        await fetcher_journal.stop()
+
+    asyncio.run(scenario())
+    assert worker_journal.stats()["rowsForwarded"] == 2
+    assert not (tmp_path / "worker.csv").exists()  # 워커는 파일에 쓰지 않음
+    lines = (tmp_path / "trades.csv").read_text().splitlines()
+    assert [line.split(",")[1] for line in lines[1:]] == ["BTCUSDT", "ETHUSDT"]
+
+
+def test_worker_shares_fetcher_clock_and_api_key_status(tmp_path):
+    path = str(tmp_path / "state.sock")
+    client = FakeClient()
+    limiter_client = SimpleNamespace(
+        rate_limiter=SimpleNamespace(remaining_weight=2400)
+    )
+    fetcher_clock, worker_clock = ClockSync(interval_seconds=60), ClockSync(60)
+    fetcher_key = ApiKeyMonitor(
+        client=limiter_client, account=AccountSnapshotService(client)
+    )
+    worker_key = ApiKeyMonitor(
+        client=limiter_client, account=AccountSnapshotService(client)
+    )
+    publisher = SharedStatePublisher(
+        path,
+        prices=PriceCache(client=client, stream_enabled=False),
+        meta=SymbolMetaCache(client=client),
+        stream=FetcherStream(),
+        clock=fetcher_clock,
+        api_key=fetcher_key,
+    )
+    subscriber = SharedStateSubscriber(
+        path,
+        prices=PriceCache(client=client, stream_enabled=False),
+        meta=SymbolMetaCache(client=client),
+        stream=UserDataStream(
+            client=client, account=AccountSnapshotService(client=client), enabled=False
+        ),
+        clock=worker_clock,
+        api_key=worker_key,
+    )
+
+    async def server_time():
+        return int(time.time() * 1000) + 1_500
+
+    async def scenario():
+        await fetcher_clock.sync(server_time)  # 발행자 시작 전 측정값도 전달
+        await publisher.start()
+        subscriber.start()
+        await _until(lambda: worker_clock.is_synced)
+        assert worker_clock.offset_ms == fetcher_clock.offset_ms
+
+        # fetcher가 본 인증 오류가 워커의 판정으로 전달됨 (워커는 직접 조회하지 않음)
+        fetcher_key.observe(
+            httpx.Response(401, json={"code": -2015, "msg": "Invalid API-key"})
+        )
+        await _until(lambda: worker_key.status is not None)
+        assert worker_key.status.is_valid is False
+        assert worker_key.status.error_message == "Invalid API-key"
+        assert worker_key.probes == 0
+
+        await publisher.stop()
+        await subscriber.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,31 @@
+"""StateBusServer 종료 순서 (접속 중인 구독자가 있어도 멈추지 않음) 테스트"""
+
+import asyncio
+
+from app.clients.state_bus import StateBusClient, StateBusServer
+
+
+def test_stop_with_connected_subscriber_does_not_hang(tmp_path):
+    path = str(tmp_path / "bus.sock")
+    server = StateBusServer(path)
+    received = []
+    client = StateBusClient(path, {"prices": received.append}, reconnect_min=10)
+
+    async def scenario():
+        await server.start()
+        server.publish("prices", {"BTCUSDT": "100"})
+        client.start()
+        while not received:
+            await asyncio.sleep(0.01)
+        handler = next(iter(server._subscribers)).task
+
+        await asyncio.wait_for(server.stop(), timeout=2)
+
+        # 접속 핸들러는 취소로 끝나고 구독자 목록은 비워짐
+        assert handler.cancelled()
+        assert server.stats()["subscribers"] == 0
+        await client.stop()
+
+    asyncio.run(scenario())
+    assert received == [{"BTCUSDT": "100"}]
+    assert not (tmp_path / "bus.sock").exists()
@@ -0,0 +1,73 @@
+"""사전 직렬화/압축 심볼 목록 응답과 ETag/304 테스트"""
+
+import asyncio
+import gzip
+import json
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.v1.endpoints import symbols as symbols_endpoint
+from app.services.symbol_catalog import SymbolCatalog
+from app.services.symbol_meta import SymbolMetaCache
+from tests.test_symbol_meta import BTC_INFO
+
+
+class FakeClient:
+    def __init__(self):
+        self.symbols = [BTC_INFO, {**BTC_INFO, "symbol": "ETHBTC", "quoteAsset": "BTC"}]
+
+    async def get_exchange_info(self):
+        return {"symbols": list(self.symbols)}
+
+
+def test_catalog_rebuilds_only_when_metadata_changes():
+    client = FakeClient()
+    meta = SymbolMetaCache(client=client)
+    catalog = SymbolCatalog(meta=meta)
+
+    async def scenario():
+        body = await catalog.get_body()
+        assert json.loads(body.identity) == {
+            "symbols": [{"symbol": "BTCUSDT", "baseAsset": "BTC", "quoteAsset": "USDT"}]
+        }
+        assert gzip.decompress(body.gzip) == body.identity
+
+        await meta.refresh()  # 변경 없음 - 다시 만들지 않음
+        assert await catalog.get_body() is body
+
+        client.symbols.append({**BTC_INFO, "symbol": "ETHUSDT", "baseAsset": "ETH"})
+        await meta.refresh()
+        assert (await catalog.get_body()).etag() != body.etag()
+
+    asyncio.run(scenario())
+    assert catalog.rebuilds == 2
+
+
+def test_endpoint_negotiates_encoding_and_returns_304(monkeypatch):
+    catalog = SymbolCatalog(meta=SymbolMetaCache(client=FakeClient()))
+    monkeypatch.setattr(symbols_endpoint, "symbol_catalog", catalog)
+    app = FastAPI()
+    app.include_router(symbols_endpoint.router, prefix="/api")
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as http:
+            resp = await http.get("/api/symbols", headers={"Accept-Encoding": "gzip"})
+            assert resp.headers["content-encoding"] == "gzip"
+            assert resp.json()["symbols"][0]["symbol"] == "BTCUSDT"
+            etag = resp.headers["etag"]
+
+            resp = await http.get(
+                "/api/symbols",
+                headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+            )
+            assert resp.status_code == 304
+            assert resp.headers["etag"] == etag
+
+            resp = await http.get(
+                "/api/symbols", headers={"Accept-Encoding": "identity"}
+            )
+            assert "content-encoding" not in resp.headers
+
+    asyncio.run(scenario())
@@ -0,0 +1,83 @@
+"""SymbolMeta 파싱/수량 반올림 테스트"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from app.services.symbol_meta import SymbolMetaCache, parse_symbol_meta
+from app.utils.errors import AppError
+
+BTC_INFO = {
+    "symbol": "BTCUSDT",
+    "status": "TRADING",
+    "baseAsset": "BTC",
+    "quoteAsset": "USDT",
+    "pricePrecision": 2,
+    "quantityPrecision": 3,
+    "filters": [
+        {
+            "filterType": "PRICE_FILTER",
+            "minPrice": "556.80",
+            "maxPrice": "4529764",
+            "tickSize": "0.10",
+        },
+        {
+            "filterType": "LOT_SIZE",
+            "stepSize": "0.001",
+            "maxQty": "1000",
+            "minQty": "0.001",
+        },
+        {
+            "filterType": "MARKET_LOT_SIZE",
+            "stepSize": "0.002",
+            "maxQty": "120",
+            "minQty": "0.002",
+        },
+        {"filterType": "MIN_NOTIONAL", "notional": "100"},
+    ],
+}
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_exchange_info(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return {
+            "symbols": [BTC_INFO, {**BTC_INFO, "symbol": "ETHBTC", "quoteAsset": "BTC"}]
+        }
+
+
+def test_parse_symbol_meta_filters_as_decimals():
+    meta = parse_symbol_meta(BTC_INFO)
+    assert meta.quantity_precision == 3
+    assert meta.step_size == Decimal("0.001")
+    assert meta.market_min_qty == Decimal("0.002")
+    assert meta.market_max_qty == Decimal("120")
+    assert meta.min_notional == Decimal("100")
+    assert meta.tick_size == Decimal("0.10")
+
+
+def test_round_quantity_floors_to_step():
+    meta = parse_symbol_meta(BTC_INFO)
+    assert meta.round_quantity(Decimal("0.0079")) == Decimal("0.006")
+    assert meta.round_quantity(Decimal("0.0079"), market=False) == Decimal("0.007")
+
+
+def test_cache_loads_once_and_indexes_by_symbol():
+    client = FakeClient()
+    cache = SymbolMetaCache(client=client)
+
+    async def scenario():
+        metas = await asyncio.gather(*(cache.get("BTCUSDT") for _ in range(5)))
+        assert {m.symbol for m in metas} == {"BTCUSDT"}
+        usdt = await cache.trading_symbols("USDT")
+        assert [m.symbol for m in usdt] == ["BTCUSDT"]
+        with pytest.raises(AppError):
+            await cache.get("NOPE")
+
+    asyncio.run(scenario())
+    assert client.calls == 1
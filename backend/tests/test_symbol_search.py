@@ -0,0 +1,75 @@
+"""심볼 검색 색인 접두/부분 일치, 거래량 정렬, 증분 갱신 테스트"""
+
+import asyncio
+
+from app.services.symbol_meta import SymbolMetaCache
+from app.services.symbol_search import SymbolSearchIndex
+from tests.test_symbol_meta import BTC_INFO
+
+
+def _info(symbol, base, status="TRADING", quote="USDT"):
+    return {
+        **BTC_INFO,
+        "symbol": symbol,
+        "baseAsset": base,
+        "quoteAsset": quote,
+        "status": status,
+    }
+
+
+class FakeClient:
+    def __init__(self):
+        self.symbols = [
+            _info("BTCUSDT", "BTC"),
+            _info("BTCDOMUSDT", "BTCDOM"),
+            _info("ETHUSDT", "ETH"),
+            _info("ETHFIUSDT", "ETHFI"),
+            _info("1000SHIBUSDT", "1000SHIB"),
+            _info("SHIBBTC", "SHIB", quote="BTC"),
+        ]
+        self.ticker_calls = 0
+
+    async def get_exchange_info(self):
+        return {"symbols": list(self.symbols)}
+
+    async def get_24hr_ticker(self):
+        self.ticker_calls += 1
+        return [
+            {"symbol": "ETHUSDT", "quoteVolume": "100"},
+            {"symbol": "ETHFIUSDT", "quoteVolume": "900"},
+        ]
+
+
+def test_prefix_substring_and_volume_ranking():
+    client = FakeClient()
+    index = SymbolSearchIndex(meta=SymbolMetaCache(client=client), client=client)
+
+    async def scenario():
+        found = [m.symbol for m in await index.search("btc")]
+        assert found == ["BTCUSDT", "BTCDOMUSDT"]  # 정확 일치 우선, USDT만
+        found = [m.symbol for m in await index.search("shib")]
+        assert found == ["1000SHIBUSDT"]  # 부분 문자열 보충
+        assert [m.symbol for m in await index.search("eth", limit=1)] == ["ETHUSDT"]
+
+        by_volume = await index.search("ethf", order="volume")
+        assert [(m.symbol, m.quoteVolume) for m in by_volume] == [("ETHFIUSDT", "900")]
+        await index.search("eth", order="volume")
+        assert client.ticker_calls == 1  # 티커는 캐시에서 재사용
+
+    asyncio.run(scenario())
+
+
+def test_index_updates_incrementally_on_metadata_change():
+    client = FakeClient()
+    meta = SymbolMetaCache(client=client)
+    index = SymbolSearchIndex(meta=meta, client=client)
+
+    async def scenario():
+        assert len(await index.search("e")) == 2
+        client.symbols = [s for s in client.symbols if s["symbol"] != "ETHFIUSDT"]
+        client.symbols.append(_info("ENAUSDT", "ENA"))
+        client.symbols.append(_info("ETHUSDT", "ETH", status="SETTLING"))
+        await meta.refresh()
+        assert [m.symbol for m in await index.search("e")] == ["ENAUSDT"]
+
+    asyncio.run(scenario())
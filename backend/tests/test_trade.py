@@ -0,0 +1,132 @@
+"""주문 전 단계(심볼 정보/마크프라이스/레버리지) 데드라인·실패 전파 테스트"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from app.models.schemas import OrderSide, TradeRequest
+from app.services.journal import TradeJournal
+from app.services.symbol_meta import parse_symbol_meta
+from app.services.trade import TradeService
+from app.utils.errors import AppError
+from tests.test_symbol_meta import BTC_INFO
+
+BTC_META = parse_symbol_meta(BTC_INFO)
+
+
+class StubMeta:
+    def __init__(self, error=None, delay=0.0):
+        self.error = error
+        self.delay = delay
+        self.cancelled = False
+
+    async def get(self, symbol):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return BTC_META
+
+
+class StubPrices:
+    def __init__(self, price="50000", error=None, delay=0.0):
+        self.price = Decimal(price)
+        self.error = error
+        self.delay = delay
+        self.cancelled = False
+
+    async def get_mark_price(self, symbol):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return self.price
+
+
+class StubLeverage:
+    def __init__(self):
+        self.calls = []
+
+    async def ensure(self, symbol, leverage, client=None):
+        self.calls.append((symbol, leverage))
+
+
+class StubClient:
+    def __init__(self):
+        self.orders = []
+
+    async def place_market_order(self, symbol, side, quantity):
+        self.orders.append(quantity)
+        return {"orderId": 1, "status": "NEW", "origQty": quantity}
+
+
+def _service(tmp_path, meta=None, prices=None, timeout=1.0):
+    service = TradeService(
+        StubClient(),
+        symbol_meta=meta or StubMeta(),
+        prices=prices or StubPrices(),
+        leverage=StubLeverage(),
+        journal=TradeJournal(path=tmp_path / "trades.csv", fsync_policy="none"),
+    )
+    service.pre_trade_timeout = timeout
+    return service
+
+
+ORDER = TradeRequest(
+    symbol="BTCUSDT", side=OrderSide.BUY, size=200, leverage=5, user="u1"
+)
+
+
+def test_quantity_validated_before_leverage_is_set(tmp_path):
+    service = _service(tmp_path)
+    assert asyncio.run(service._run_pre_trade(ORDER)) == "0.004"
+    assert service.leverage.calls == [("BTCUSDT", 5)]
+
+    rejected = _service(tmp_path, prices=StubPrices(price="0"))
+    with pytest.raises(AppError, match="Invalid mark price"):
+        asyncio.run(rejected._run_pre_trade(ORDER))
+    assert rejected.leverage.calls == []  # 거부된 주문은 레버리지를 바꾸지 않음
+
+
+def test_deadline_raises_app_error_and_cancels_steps(tmp_path):
+    prices = StubPrices(delay=5)
+    service = _service(tmp_path, prices=prices, timeout=0.05)
+    with pytest.raises(AppError, match="deadline"):
+        asyncio.run(service._run_pre_trade(ORDER))
+    assert prices.cancelled
+    assert service.leverage.calls == []
+
+
+def test_single_failure_cancels_sibling_and_surfaces_original_error(tmp_path):
+    prices = StubPrices(delay=5)
+    service = _service(
+        tmp_path, meta=StubMeta(error=KeyError("BTCUSDT")), prices=prices
+    )
+    with pytest.raises(KeyError):
+        asyncio.run(service._run_pre_trade(ORDER))
+    assert prices.cancelled
+
+
+def test_multiple_failures_surface_first_error(tmp_path):
+    service = _service(
+        tmp_path,
+        meta=StubMeta(error=KeyError("BTCUSDT")),
+        prices=StubPrices(error=ConnectionError("premiumIndex")),
+    )
+    with pytest.raises(KeyError) as exc_info:
+        asyncio.run(service._run_pre_trade(ORDER))
+    assert not isinstance(exc_info.value, ExceptionGroup)
+
+
+def test_place_order_wraps_failure_and_skips_order(tmp_path):
+    service = _service(tmp_path, prices=StubPrices(price="0"))
+    with pytest.raises(AppError, match="Failed to place order"):
+        asyncio.run(service.place_order(ORDER))
+    assert service.client.orders == []
@@ -0,0 +1,157 @@
+"""TradeStore CSV 증분 색인/커서 페이지네이션 테스트"""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from app.services.journal import TRADE_FIELDNAMES, TradeJournal
+from app.services.trade_store import TradeStore
+
+
+def test_incremental_import_and_cursor_pagination(tmp_path):
+    csv_path = tmp_path / "trades.csv"
+    journal = TradeJournal(path=csv_path, fsync_policy="none")
+    store = TradeStore(path=tmp_path / "trades.db", csv_path=csv_path)
+
+    for i in range(5):
+        journal.record(
+            {"symbol": "BTCUSDT" if i % 2 else "ETHUSDT", "orderId": i, "user": "u1"}
+        )
+
+    async def scenario():
+        assert await store.sync_from_csv() == 5
+        assert await store.sync_from_csv() == 0  # 이미 색인된 구간은 건너뜀
+
+        journal.record({"symbol": "BTCUSDT", "orderId": 5, "user": "u2"})
+        assert await store.sync_from_csv() == 1
+
+        page, cursor = await store.query(symbol="BTCUSDT", limit=2)
+        assert [r["order_id"] for r in page] == ["5", "3"]
+        page, cursor = await store.query(symbol="BTCUSDT", cursor=cursor, limit=2)
+        assert [r["order_id"] for r in page] == ["1"]
+        assert cursor is None
+
+        page, _ = await store.query(user="u2")
+        assert [r["order_id"] for r in page] == ["5"]
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        store.close()
+
+
+def test_journal_flush_listener_indexes_new_rows(tmp_path):
+    csv_path = tmp_path / "trades.csv"
+    journal = TradeJournal(path=csv_path, flush_interval=0.01, fsync_policy="none")
+    store = TradeStore(path=tmp_path / "trades.db", csv_path=csv_path)
+    journal.add_flush_listener(store.sync_from_csv)
+
+    async def scenario():
+        journal.start()
+        for batch in range(3):
+            journal.record({"symbol": "BTCUSDT", "orderId": batch, "user": "u1"})
+            while journal.batches <= batch:  # 배치마다 리스너가 다시 호출되어야 함
+                await asyncio.sleep(0.01)
+        await journal.stop()
+        page, _ = await store.query(symbol="BTCUSDT")
+        return [r["order_id"] for r in page]
+
+    try:
+        assert asyncio.run(scenario()) == ["2", "1", "0"]
+    finally:
+        store.close()
+
+
+def test_partial_trailing_line_is_imported_once_complete(tmp_path):
+    csv_path = tmp_path / "trades.csv"
+    header = ",".join(TRADE_FIELDNAMES)
+    row = "2025-08-31T14:29:10.424561,BTCUSDT,BUY,0.001,,10,1,NEW,NEW,MARKET,COMPLETED,,u1"
+    csv_path.write_text(f"{header}\n{row}\n2025-08-31T14:30:00,ETH", encoding="utf-8")
+    store = TradeStore(path=tmp_path / "trades.db", csv_path=csv_path)
+
+    async def scenario():
+        # 기록 중인 마지막 줄은 건너뛰고 오프셋도 완전한 줄까지만 전진
+        assert await store.sync_from_csv() == 1
+        with open(csv_path, "a", encoding="utf-8") as file:
+            file.write("USDT,SELL,0.01,,5,2,NEW,NEW,MARKET,COMPLETED,,u2\n")
+        assert await store.sync_from_csv() == 1
+        page, _ = await store.query()
+        return [(r["symbol"], r["order_id"], r["user"]) for r in page]
+
+    try:
+        assert asyncio.run(scenario()) == [
+            ("ETHUSDT", "2", "u2"),
+            ("BTCUSDT", "1", "u1"),
+        ]
+    finally:
+        store.close()
+
+
+def test_multiline_error_message_split_across_syncs(tmp_path):
+    csv_path = tmp_path / "trades.csv"
+    header = ",".join(TRADE_FIELDNAMES)
+    ok = "2025-08-31T14:29:10,BTCUSDT,BUY,0.001,,10,1,NEW,NEW,MARKET,COMPLETED,,u1"
+    # httpx 오류 메시지처럼 줄바꿈이 든 따옴표 필드를 줄 경계에서 끊어 기록 중인 상태
+    failed = (
+        "2025-08-31T14:30:00,ETHUSDT,SELL,,,5,,FAILED,,,FAILED,"
+        "\"Client error '400 Bad Request'\nFor more information"
+    )
+    csv_path.write_text(f"{header}\n{ok}\n{failed}\n", encoding="utf-8")
+    store = TradeStore(path=tmp_path / "trades.db", csv_path=csv_path)
+
+    async def scenario():
+        # 줄은 끝났지만 레코드는 끝나지 않음 - 완전한 레코드까지만 색인
+        assert await store.sync_from_csv() == 1
+        with open(csv_path, "a", encoding="utf-8") as file:
+            file.write(' check the docs",u2\n')
+        assert await store.sync_from_csv() == 1
+        assert await store.sync_from_csv() == 0
+        page, _ = await store.query()
+        return page
+
+    try:
+        page = asyncio.run(scenario())
+    finally:
+        store.close()
+    assert [(r["order_id"], r["user"]) for r in page] == [("", "u2"), ("1", "u1")]
+    assert page[0]["error_message"] == (
+        "Client error '400 Bad Request'\nFor more information\n check the docs"
+    )
+
+
+def test_time_range_accepts_iso_variants(tmp_path):
+    csv_path = tmp_path / "trades.csv"
+    stamps = [
+        "2025-08-30T23:59:59.999999",
+        "2025-08-31T00:00:00",
+        "2025-08-31T14:29:10.424561",
+        "2025-09-01T00:00:00.000001",
+    ]
+    lines = [",".join(TRADE_FIELDNAMES)] + [
+        f"{ts},BTCUSDT,BUY,,,10,{i},NEW,NEW,MARKET,COMPLETED,,u1"
+        for i, ts in enumerate(stamps)
+    ]
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    store = TradeStore(path=tmp_path / "trades.db", csv_path=csv_path)
+    local = datetime(2025, 8, 31).astimezone()  # 로컬 자정의 오프셋 표기
+
+    async def ids(**bounds):
+        page, _ = await store.query(**bounds)
+        return sorted(r["order_id"] for r in page)
+
+    async def scenario():
+        await store.sync_from_csv()
+        # 날짜만 준 값은 자정으로 해석
+        assert await ids(start="2025-08-31", end="2025-09-01") == ["1", "2"]
+        # 타임존이 붙은 값은 저널과 같은 로컬 시각으로 변환
+        assert await ids(start=local.isoformat()) == ["1", "2", "3"]
+        utc = local.astimezone(UTC).isoformat().replace("+00:00", "Z")
+        assert await ids(end=utc) == ["0"]
+        with pytest.raises(ValueError):
+            await store.query(start="yesterday")
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        store.close()
@@ -0,0 +1,187 @@
+"""사용자 데이터 스트림 상태 반영/재연결 재동기화 테스트 (로컬 WebSocket 서버 사용)"""
+
+import asyncio
+import json
+
+from websockets.asyncio.server import serve
+
+from app.services.account import AccountSnapshotService
+from app.services.balance import BalanceService
+from app.services.position import PositionService
+from app.services.price_cache import PriceCache
+from app.services.user_stream import AccountState, UserDataStream
+
+
+class FakeClient:
+    api_key = "test-key"
+
+    def __init__(self):
+        self.calls = []
+
+    async def create_listen_key(self):
+        self.calls.append("listenKey")
+        return "key1"
+
+    async def keepalive_listen_key(self):
+        self.calls.append("keepalive")
+
+    async def close_listen_key(self):
+        self.calls.append("close")
+
+    async def get_account_info(self):
+        self.calls.append("account")
+        return {
+            "positions": [
+                {
+                    "symbol": "BTCUSDT",
+                    "positionAmt": "0.1",
+                    "entryPrice": "50000",
+                    "leverage": "10",
+                    "isolated": False,
+                    "updateTime": 1000,
+                }
+            ],
+            "assets": [{"asset": "USDT", "walletBalance": "100", "updateTime": 1000}],
+        }
+
+
+ACCOUNT_UPDATE = {
+    "e": "ACCOUNT_UPDATE",
+    "E": 2001,
+    "T": 2000,
+    "a": {
+        "m": "ORDER",
+        "B": [{"a": "USDT", "wb": "90", "cw": "90", "bc": "0"}],
+        "P": [{"s": "BTCUSDT", "pa": "0.3", "ep": "50500", "up": "1", "mt": "cross"}],
+    },
+}
+
+
+def order_event(status):
+    return {
+        "e": "ORDER_TRADE_UPDATE",
+        "E": 2001,
+        "T": 2000,
+        "o": {
+            "s": "BTCUSDT",
+            "S": "BUY",
+            "o": "LIMIT",
+            "q": "0.2",
+            "X": status,
+            "i": 7,
+        },
+    }
+
+
+def test_events_update_state_and_reconnect_resyncs():
+    connections = []
+
+    async def handler(ws):
+        connections.append(ws.request.path)
+        if len(connections) == 1:
+            await ws.send(json.dumps(ACCOUNT_UPDATE))
+            await ws.send(json.dumps(order_event("NEW")))
+            await ws.close()  # 끊어서 재연결 + REST 재동기화 유도
+            return
+        await ws.send(json.dumps(order_event("FILLED")))
+        await ws.wait_closed()
+
+    async def scenario():
+        async with serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            client = FakeClient()
+            account = AccountSnapshotService(client=client)
+            stream = UserDataStream(
+                client=client,
+                account=account,
+                enabled=True,
+                stream_base_url=f"ws://127.0.0.1:{port}",
+            )
+            positions = PositionService(client=client, account=account, stream=stream)
+            balances = BalanceService(account=account, stream=stream)
+            stream.start()
+            stream.stream._reconnect_min = 0.01
+            try:
+                for _ in range(200):
+                    if stream.is_live and stream.state.fills == 1:
+                        break
+                    await asyncio.sleep(0.01)
+                assert stream.is_live
+                assert connections == ["/ws/key1", "/ws/key1"]
+                assert client.calls.count("account") == 2  # 연결마다 1회 재동기화
+
+                # 재동기화 스냅샷(updateTime=1000)이 더 최신 이벤트(T=2000)를 덮지 않음
+                calls = len(client.calls)
+                [btc] = await positions.get_positions("BTCUSDT")
+                assert (btc.positionAmt, btc.leverage) == ("0.3", 10)
+                [usdt] = await balances.get_balances("USDT")
+                assert usdt.balance == "90"
+                assert stream.state.orders == {}  # FILLED 주문은 미체결 목록에서 제거
+                assert len(client.calls) == calls  # 메모리에서 응답
+            finally:
+                await stream.stop()
+            assert client.calls[-1] == "close"
+
+    asyncio.run(scenario())
+
+
+def test_hedge_mode_legs_do_not_overwrite_each_other():
+    state = AccountState()
+    state.apply_account(
+        {
+            "positions": [
+                {"symbol": "BTCUSDT", "positionSide": "LONG", "positionAmt": "0.2"},
+                {"symbol": "BTCUSDT", "positionSide": "SHORT", "positionAmt": "-0.1"},
+            ],
+            "assets": [],
+        }
+    )
+    state.apply_event(
+        {
+            "e": "ACCOUNT_UPDATE",
+            "T": 5,
+            "a": {"P": [{"s": "BTCUSDT", "ps": "SHORT", "pa": "0", "ep": "0"}]},
+        }
+    )
+    [long_leg] = state.position_list("BTCUSDT")  # SHORT 다리만 종료
+    assert (long_leg.positionSide, long_leg.positionAmt) == ("LONG", "0.2")
+    assert list(state.legs()) == ["BTCUSDT:LONG"]
+
+
+def test_unrealized_pnl_follows_fresh_mark_price():
+    prices = PriceCache(client=FakeClient(), stream_enabled=False)
+    stream = UserDataStream(
+        client=FakeClient(),
+        account=AccountSnapshotService(client=FakeClient()),
+        enabled=False,
+        prices=prices,
+    )
+    stream.state.apply_event(ACCOUNT_UPDATE)
+    [btc] = stream.state.position_list("BTCUSDT")
+    assert btc.unRealizedProfit == "1"  # 마크프라이스 없음 - 이벤트 값
+
+    prices.apply_stream_update([{"s": "BTCUSDT", "p": "51000", "E": 1}])
+    [btc] = stream.state.position_list("BTCUSDT")
+    assert btc.unRealizedProfit == "150.00000000"  # 0.3 * (51000 - 50500)
+
+
+def test_reconcile_refreshes_balances_only_while_live():
+    client = FakeClient()
+    account = AccountSnapshotService(client=client)
+    stream = UserDataStream(client=client, account=account, enabled=False)
+
+    async def scenario():
+        await stream._reconcile_once()  # 연결 전 - 조회 없음
+        assert client.calls == []
+
+        class Connected:
+            connected = True
+
+        stream._stream, stream._synced = Connected(), True
+        await stream._reconcile_once()
+
+    asyncio.run(scenario())
+    assert client.calls == ["account"]
+    assert stream.reconciles == 1
+    [usdt] = stream.state.balance_list("USDT")
+    assert usdt.balance == "100"
@@ -103,6 +103,7 @@ export const Header: React.FC<HeaderProps> = ({
   const getStatusColor = (status: string) => {
     if (status === 'ok' || status === 'valid') return 'var(--buy)';
     if (status === 'error' || status === 'invalid') return 'var(--sell)';
+    if (status === 'degraded') return 'var(--binance-yellow)';
     return 'var(--text-muted)';
   };
 
@@ -44,11 +44,11 @@ export const MarketOrder: React.FC<MarketOrderProps> = ({
         healthErrors.push('백엔드 서버 상태가 비정상입니다');
       }
 
-      // 2. 바이낸스 연결 상태
+      // 2. 바이낸스 연결 상태 (degraded는 도달 가능하므로 주문 허용)
       if (
         !binanceHealthStatus ||
-        binanceHealthStatus.status !== 'ok' ||
-        !binanceHealthStatus.binance.reachable
+        binanceHealthStatus.status === 'error' ||
+        !binanceHealthStatus.binance?.reachable
       ) {
         healthErrors.push('바이낸스 서버 연결이 불가능합니다');
       }
@@ -6,7 +6,7 @@ import {
   useImperativeHandle,
   forwardRef,
 } from 'react';
-import { positionsAPI } from '../../utils/api';
+import { positionLegKey, positionsAPI } from '../../utils/api';
 import { healthCheckService } from '../../utils/healthCheck';
 import type { AlertType } from '../Alert';
 import './PositionsTable.css';
@@ -18,6 +18,8 @@ interface Position {
   leverage: number;
   unRealizedProfit: string;
   marginType: string;
+  positionSide?: string;
+  key?: string;
 }
 
 interface PositionsTableProps {
@@ -287,16 +289,19 @@ export const PositionsTable = forwardRef<
     // 초기 로드
     initializeComponent();
 
-    // 30초마다 포지션 새로고침
-    const refreshInterval = setInterval(async () => {
-      try {
-        await loadPositions();
-      } catch (err) {
-        console.error('Failed to refresh positions:', err);
+    // 주기적 폴링 대신 서버 푸시(SSE)로 포지션/PnL 변경분 수신
+    const unsubscribe = positionsAPI.subscribePositions(
+      (positionsData) => {
+        setInternalPositions(positionsData);
+        setError(null);
+        setLoading(false);
+      },
+      (err) => {
+        console.error('Positions stream error, reconnecting:', err);
       }
-    }, 30000);
+    );
 
-    return () => clearInterval(refreshInterval);
+    return () => unsubscribe();
   }, [onAddAlert, externalPositions]);
 
   const handleClosePosition = async (symbol: string) => {
@@ -485,7 +490,7 @@ export const PositionsTable = forwardRef<
                   const side = getPositionSide(position.positionAmt);
 
                   return (
-                    <tr key={position.symbol} className="position-row">
+                    <tr key={positionLegKey(position)} className="position-row">
                       <td className="position-symbol">{position.symbol}</td>
                       <td className="position-side">
                         <span className={`side-badge ${side}`}>
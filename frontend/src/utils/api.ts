@@ -5,6 +5,7 @@ export const API_CONFIG = {
     symbols: '/api/symbols',
     health: '/healthz',
     positions: '/api/positions',
+    positionsStream: '/api/positions/stream',
     trade: '/api/order', // 경로 수정
   },
 };
@@ -22,8 +23,17 @@ interface Position {
   leverage: number;
   unRealizedProfit: string;
   marginType: string;
+  positionSide?: string; // 헤지 모드에서는 LONG/SHORT
+  key?: string; // 푸시 피드가 붙여 주는 다리 키
 }
 
+// 포지션 다리 키 - 서버의 closed 목록과 같은 형식 (원웨이: 심볼, 헤지: SYMBOL:SIDE)
+export const positionLegKey = (position: Position): string =>
+  position.key ??
+  (!position.positionSide || position.positionSide === 'BOTH'
+    ? position.symbol
+    : `${position.symbol}:${position.positionSide}`);
+
 // API 호출 함수 (확장성 있는 구조)
 export const apiCall = async <T>(endpoint: string): Promise<T> => {
   try {
@@ -77,6 +87,44 @@ export const positionsAPI = {
     return data || [];
   },
 
+  // 서버 푸시(SSE) 구독 - 첫 스냅샷 이후 변경/종료 심볼만 받아 합침
+  subscribePositions: (
+    onPositions: (positions: Position[]) => void,
+    onError?: (event: Event) => void
+  ): (() => void) => {
+    const current = new Map<string, Position>();
+    const source = new EventSource(
+      `${API_CONFIG.baseURL}${API_CONFIG.endpoints.positionsStream}`
+    );
+
+    source.addEventListener('snapshot', (event) => {
+      const data = JSON.parse((event as MessageEvent).data);
+      current.clear();
+      for (const position of data.positions as Position[]) {
+        current.set(positionLegKey(position), position);
+      }
+      onPositions(Array.from(current.values()));
+    });
+
+    source.addEventListener('delta', (event) => {
+      const data = JSON.parse((event as MessageEvent).data);
+      for (const position of data.changed as Position[]) {
+        current.set(positionLegKey(position), position);
+      }
+      for (const key of data.closed as string[]) {
+        current.delete(key);
+      }
+      onPositions(Array.from(current.values()));
+    });
+
+    // EventSource는 끊기면 자동 재연결하고, 재연결 시 스냅샷부터 다시 받음
+    if (onError) {
+      source.onerror = onError;
+    }
+
+    return () => source.close();
+  },
+
   closePosition: async (symbol: string): Promise<TradeResponse> => {
     const response = await fetch(`${API_CONFIG.baseURL}${API_CONFIG.endpoints.positions}/${symbol}/close`, {
       method: 'POST',
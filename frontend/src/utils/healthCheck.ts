@@ -8,23 +8,27 @@ export interface HealthStatus {
   version: string;
 }
 
+// 바이낸스/API 키 상태는 백엔드가 백그라운드에서 계산한 스냅샷 (ageSec: 경과 초)
 export interface BinanceHealthStatus {
-  status: string;
+  status: string; // ok | degraded | error | unknown
+  ageSec: number | null;
   binance: {
     reachable: boolean;
     tsOffsetMs: number;
+    lastSyncAgeSec: number | null;
     testnet: boolean;
-  };
+  } | null;
 }
 
 export interface ApiKeyHealthStatus {
-  status: string;
-  message: string;
+  status: string; // valid | invalid | unknown
+  message: string | null;
+  ageSec: number | null;
   details: {
     is_valid: boolean;
     has_futures_permission: boolean;
     rate_limit_remaining: number;
-    last_check: string;
+    last_check: string | null;
     error_message: string | null;
   };
   testnet: boolean;